@@ -48,6 +48,7 @@ from google.adk.runners import Runner
 from pydantic import BaseModel
 from typing_extensions import override
 
+from ...utils.admission_control import AdmissionController
 from ...utils.feature_decorator import experimental
 from ..converters.event_converter import convert_event_to_a2a_events
 from ..converters.request_converter import convert_a2a_request_to_adk_run_args
@@ -75,10 +76,20 @@ class A2aAgentExecutor(AgentExecutor):
       *,
       runner: Runner | Callable[..., Runner | Awaitable[Runner]],
       config: Optional[A2aAgentExecutorConfig] = None,
+      admission_controller: Optional[AdmissionController] = None,
   ):
+    """Initializes the A2aAgentExecutor.
+
+    Args:
+      runner: The runner, or a callable that returns the runner.
+      config: The configuration of the executor.
+      admission_controller: Limits the concurrent runs of the executor. A
+        rejected request fails its task.
+    """
     super().__init__()
     self._runner = runner
     self._config = config
+    self._admission_controller = admission_controller
 
   async def _resolve_runner(self) -> Runner:
     """Resolve the runner, handling cases where it's a callable that returns a Runner."""
@@ -184,56 +195,63 @@ class A2aAgentExecutor(AgentExecutor):
     # ensure the session exists
     session = await self._prepare_session(context, run_args, runner)
 
-    # create invocation context
-    invocation_context = runner._new_invocation_context(
-        session=session,
-        new_message=run_args['new_message'],
-        run_config=run_args['run_config'],
-    )
+    admission_controller = self._admission_controller
+    if admission_controller:
+      await admission_controller.acquire(runner.app_name, run_args['user_id'])
+    try:
+      # create invocation context
+      invocation_context = runner._new_invocation_context(
+          session=session,
+          new_message=run_args['new_message'],
+          run_config=run_args['run_config'],
+      )
 
-    # publish the task working event
-    await event_queue.enqueue_event(
-        TaskStatusUpdateEvent(
-            taskId=context.task_id,
-            status=TaskStatus(
-                state=TaskState.working,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            ),
-            contextId=context.context_id,
-            final=False,
-            metadata={
-                _get_adk_metadata_key('app_name'): runner.app_name,
-                _get_adk_metadata_key('user_id'): run_args['user_id'],
-                _get_adk_metadata_key('session_id'): run_args['session_id'],
-            },
-        )
-    )
+      # publish the task working event
+      await event_queue.enqueue_event(
+          TaskStatusUpdateEvent(
+              taskId=context.task_id,
+              status=TaskStatus(
+                  state=TaskState.working,
+                  timestamp=datetime.now(timezone.utc).isoformat(),
+              ),
+              contextId=context.context_id,
+              final=False,
+              metadata={
+                  _get_adk_metadata_key('app_name'): runner.app_name,
+                  _get_adk_metadata_key('user_id'): run_args['user_id'],
+                  _get_adk_metadata_key('session_id'): run_args['session_id'],
+              },
+          )
+      )
 
-    task_result_aggregator = TaskResultAggregator()
-    async for adk_event in runner.run_async(**run_args):
-      for a2a_event in convert_event_to_a2a_events(
-          adk_event, invocation_context, context.task_id, context.context_id
-      ):
-        task_result_aggregator.process_event(a2a_event)
-        await event_queue.enqueue_event(a2a_event)
-
-    # publish the task result event - this is final
-    await event_queue.enqueue_event(
-        TaskStatusUpdateEvent(
-            taskId=context.task_id,
-            status=TaskStatus(
-                state=(
-                    task_result_aggregator.task_state
-                    if task_result_aggregator.task_state != TaskState.working
-                    else TaskState.completed
-                ),
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                message=task_result_aggregator.task_status_message,
-            ),
-            contextId=context.context_id,
-            final=True,
-        )
-    )
+      task_result_aggregator = TaskResultAggregator()
+      async for adk_event in runner.run_async(**run_args):
+        for a2a_event in convert_event_to_a2a_events(
+            adk_event, invocation_context, context.task_id, context.context_id
+        ):
+          task_result_aggregator.process_event(a2a_event)
+          await event_queue.enqueue_event(a2a_event)
+
+      # publish the task result event - this is final
+      await event_queue.enqueue_event(
+          TaskStatusUpdateEvent(
+              taskId=context.task_id,
+              status=TaskStatus(
+                  state=(
+                      task_result_aggregator.task_state
+                      if task_result_aggregator.task_state != TaskState.working
+                      else TaskState.completed
+                  ),
+                  timestamp=datetime.now(timezone.utc).isoformat(),
+                  message=task_result_aggregator.task_status_message,
+              ),
+              contextId=context.context_id,
+              final=True,
+          )
+      )
+    finally:
+      if admission_controller:
+        admission_controller.release(runner.app_name, run_args['user_id'])
 
   async def _prepare_session(
       self, context: RequestContext, run_args: dict[str, Any], runner: Runner
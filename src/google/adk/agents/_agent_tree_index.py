@@ -0,0 +1,89 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from .base_agent import BaseAgent
+
+
+class AgentTreeIndex:
+  """Index of an agent tree for constant time lookups by agent name.
+
+  The index is a snapshot of the tree when it was built. Changes to the tree
+  structure or to the transfer settings of its agents afterwards are not
+  reflected.
+
+  This class is only for use by Agent Development Kit.
+  """
+
+  def __init__(self, root_agent: BaseAgent):
+    from .llm_agent import LlmAgent
+
+    self.root_agent = root_agent
+    self._agents_by_name: dict[str, BaseAgent] = {}
+    self._transferable_agent_names: set[str] = set()
+
+    # Visits the agents in the same depth-first order as BaseAgent.find_agent,
+    # so the first agent wins if names are not unique.
+    agents_to_visit: list[tuple[BaseAgent, bool]] = [(root_agent, True)]
+    while agents_to_visit:
+      agent, is_parent_transferable = agents_to_visit.pop()
+      if agent.name in self._agents_by_name:
+        continue
+      self._agents_by_name[agent.name] = agent
+
+      # Only LLM-based agents can provide agent transfer capability.
+      is_transferable = (
+          is_parent_transferable
+          and isinstance(agent, LlmAgent)
+          and not agent.disallow_transfer_to_parent
+      )
+      if is_transferable:
+        self._transferable_agent_names.add(agent.name)
+      agents_to_visit.extend(
+          (sub_agent, is_transferable)
+          for sub_agent in reversed(agent.sub_agents)
+      )
+
+  def find_agent(self, name: str) -> Optional[BaseAgent]:
+    """Finds the agent with the given name in the tree.
+
+    Args:
+      name: The name of the agent to find.
+
+    Returns:
+      The agent with the matching name, or None if no such agent is found.
+    """
+    return self._agents_by_name.get(name)
+
+  def is_transferable_across_agent_tree(self, agent: BaseAgent) -> bool:
+    """Whether the agent can transfer to any other agent in the tree.
+
+    This means the agent and all its ancestors through the root agent are LLM
+    agents that can transfer to their parent agent.
+
+    Args:
+      agent: The agent in the tree to check.
+
+    Returns:
+      True if the agent can transfer, False otherwise.
+    """
+    return (
+        agent.name in self._transferable_agent_names
+        and self._agents_by_name[agent.name] is agent
+    )
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+from typing import Any
 from typing import Optional
 import uuid
 
@@ -158,6 +159,11 @@ class InvocationContext(BaseModel):
   of this invocation.
   """
 
+  _instruction_artifacts: dict[str, tuple[Any, int]] = {}
+  """Artifacts loaded for instruction templates in this invocation, by file
+  name, with the number of session events when they were loaded.
+  """
+
   def increment_llm_call_count(
       self,
   ):
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+from typing import Any
 from typing import AsyncGenerator
+from typing import Optional
 from typing import Union
 
 from google.genai import types
@@ -27,6 +30,9 @@ from typing_extensions import override
 from ..events.event import Event
 from .base_agent import BaseAgent
 from .invocation_context import InvocationContext
+from .run_config import StreamingMode
+
+logger = logging.getLogger('google_adk.' + __name__)
 
 
 def _get_last_human_messages(events: list[Event]) -> list[HumanMessage]:
@@ -47,6 +53,34 @@ def _get_last_human_messages(events: list[Event]) -> list[HumanMessage]:
   return list(reversed(messages))
 
 
+def _get_ai_message_texts(updates: Any) -> list[str]:
+  """Extracts the texts of the AI messages from the updates of graph nodes.
+
+  Args:
+    updates: the updates streamed by the graph, keyed by node name
+
+  Returns:
+    list of texts of the AI messages
+  """
+  texts = []
+  if not isinstance(updates, dict):
+    return texts
+  for update in updates.values():
+    if not isinstance(update, dict) or 'messages' not in update:
+      continue
+    messages = update['messages']
+    if not isinstance(messages, list):
+      messages = [messages]
+    for message in messages:
+      if (
+          isinstance(message, AIMessage)
+          and isinstance(message.content, str)
+          and message.content
+      ):
+        texts.append(message.content)
+  return texts
+
+
 class LangGraphAgent(BaseAgent):
   """Currently a concept implementation, supports single and multi-turn."""
 
@@ -68,13 +102,19 @@ class LangGraphAgent(BaseAgent):
     # Needed for langgraph checkpointer (for subsequent invocations; multi-turn)
     config: RunnableConfig = {'configurable': {'thread_id': ctx.session.id}}
 
+    graph_messages = []
+    if self.graph.checkpointer:
+      # Resume from the checkpoint recorded in the session, so that the graph
+      # follows the ADK session even if the latest checkpoint of the thread
+      # belongs to another branch of the conversation.
+      checkpoint_id = ctx.session.state.get(self._checkpoint_id_state_key)
+      if checkpoint_id:
+        config['configurable']['checkpoint_id'] = checkpoint_id
+      current_graph_state = await self.graph.aget_state(config)
+      if current_graph_state.values:
+        graph_messages = current_graph_state.values.get('messages', [])
+
     # Add instruction as SystemMessage if graph state is empty
-    current_graph_state = self.graph.get_state(config)
-    graph_messages = (
-        current_graph_state.values.get('messages', [])
-        if current_graph_state.values
-        else []
-    )
     messages = (
         [SystemMessage(content=self.instruction)]
         if self.instruction and not graph_messages
@@ -83,20 +123,60 @@ class LangGraphAgent(BaseAgent):
     # Add events to messages (evaluating the memory used; parent agent vs checkpointer)
     messages += self._get_messages(ctx.session.events)
 
-    # Use the Runnable
-    final_state = self.graph.invoke({'messages': messages}, config)
-    result = final_state['messages'][-1].content
+    # Streams the messages produced by each node as partial events, only when
+    # partial responses are requested, like LlmAgent does.
+    stream_partials = bool(
+        ctx.run_config and ctx.run_config.streaming_mode == StreamingMode.SSE
+    )
+    final_state = None
+    async for stream_mode, chunk in self.graph.astream(
+        {'messages': messages},
+        config,
+        stream_mode=['updates', 'values'] if stream_partials else ['values'],
+    ):
+      if stream_mode == 'values':
+        final_state = chunk
+        continue
+      for text in _get_ai_message_texts(chunk):
+        yield self._create_event(ctx, text, partial=True)
+
+    if not final_state or not final_state.get('messages'):
+      logger.warning('The graph of agent %s returned no messages.', self.name)
+      return
 
-    result_event = Event(
+    result_event = self._create_event(
+        ctx, final_state['messages'][-1].content
+    )
+    if self.graph.checkpointer:
+      latest_graph_state = await self.graph.aget_state(
+          {'configurable': {'thread_id': ctx.session.id}}
+      )
+      result_event.actions.state_delta[self._checkpoint_id_state_key] = (
+          latest_graph_state.config['configurable'].get('checkpoint_id')
+      )
+    yield result_event
+
+  @property
+  def _checkpoint_id_state_key(self) -> str:
+    """The session state key of the latest checkpoint of the graph."""
+    return f'{self.name}_langgraph_checkpoint_id'
+
+  def _create_event(
+      self,
+      ctx: InvocationContext,
+      text: str,
+      partial: Optional[bool] = None,
+  ) -> Event:
+    return Event(
         invocation_id=ctx.invocation_id,
         author=self.name,
         branch=ctx.branch,
+        partial=partial,
         content=types.Content(
             role='model',
-            parts=[types.Part.from_text(text=result)],
+            parts=[types.Part.from_text(text=text)],
         ),
     )
-    yield result_event
 
   def _get_messages(
       self, events: list[Event]
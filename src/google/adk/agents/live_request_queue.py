@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import asyncio
+import collections
+from enum import Enum
 from typing import Optional
 
 from google.genai import types
@@ -34,10 +36,118 @@ class LiveRequest(BaseModel):
   """If set, close the queue. queue.shutdown() is only supported in Python 3.13+."""
 
 
-class LiveRequestQueue:
-  """Queue used to send LiveRequest in a live(bidirectional streaming) way."""
+class RealtimeOverflowPolicy(Enum):
+  """What a bounded LiveRequestQueue does with realtime blobs when full."""
+
+  DROP_OLDEST = 'drop_oldest'
+  """Drops the oldest queued realtime blob to make room for the new one."""
+  DROP_NEWEST = 'drop_newest'
+  """Drops the new realtime blob."""
+  COALESCE = 'coalesce'
+  """Appends the new blob to the last queued blob of the same mime type.
+
+  No data is lost, but the queued blobs grow instead of the number of requests.
+  Falls back to dropping the oldest blob if there is nothing to merge into.
+  """
+
+
+class _LiveRequestBuffer:
+  """FIFO buffer of live requests that can drop or merge queued realtime blobs.
+
+  Unlike asyncio.Queue, the queued requests are kept in a deque owned by the
+  buffer, so they can be removed or replaced in place.
+  """
 
   def __init__(self):
+    self._requests: collections.deque[LiveRequest] = collections.deque()
+    self._not_empty = asyncio.Event()
+
+  def qsize(self) -> int:
+    return len(self._requests)
+
+  def put_nowait(self, request: LiveRequest):
+    self._requests.append(request)
+    self._not_empty.set()
+
+  async def get(self) -> LiveRequest:
+    while not self._requests:
+      self._not_empty.clear()
+      await self._not_empty.wait()
+    return self._requests.popleft()
+
+  def drop_oldest_blob(self) -> bool:
+    for index, request in enumerate(self._requests):
+      if _is_realtime_only(request):
+        del self._requests[index]
+        return True
+    return False
+
+  def coalesce_blob(self, blob: types.Blob) -> bool:
+    if not self._requests:
+      return False
+    last_request = self._requests[-1]
+    if (
+        not _is_realtime_only(last_request)
+        or last_request.blob.mime_type != blob.mime_type
+    ):
+      return False
+    self._requests[-1] = LiveRequest(
+        blob=types.Blob(
+            mime_type=blob.mime_type,
+            data=(last_request.blob.data or b'') + (blob.data or b''),
+        )
+    )
+    return True
+
+
+def _is_realtime_only(request: LiveRequest) -> bool:
+  return bool(request.blob) and not request.content and not request.close
+
+
+class LiveRequestQueue:
+  """Queue used to send LiveRequest in a live(bidirectional streaming) way.
+
+  By default the queue is unbounded. With `max_size` set, realtime blobs that
+  arrive while the queue is full are handled according to `overflow_policy`.
+  Content and close requests are never dropped, so they may exceed the bound.
+
+  Producers that can wait should call `wait_for_capacity()` before sending:
+  once the queue reaches `high_watermark` it blocks until the consumer drained
+  the queue down to `low_watermark`.
+  """
+
+  def __init__(
+      self,
+      max_size: int = 0,
+      *,
+      overflow_policy: RealtimeOverflowPolicy = (
+          RealtimeOverflowPolicy.DROP_OLDEST
+      ),
+      high_watermark: Optional[int] = None,
+      low_watermark: Optional[int] = None,
+  ):
+    """Initializes the LiveRequestQueue.
+
+    Args:
+      max_size: The maximum number of queued requests before realtime blobs
+        are dropped or coalesced. 0 means unbounded.
+      overflow_policy: What to do with realtime blobs when the queue is full.
+      high_watermark: The queue size at which `wait_for_capacity()` starts
+        blocking. Defaults to `max_size`.
+      low_watermark: The queue size at which blocked `wait_for_capacity()`
+        calls are released. Defaults to half of the high watermark.
+    """
+    if max_size < 0:
+      raise ValueError('max_size must not be negative.')
+    if high_watermark is None:
+      high_watermark = max_size
+    if low_watermark is None:
+      low_watermark = high_watermark // 2
+    if high_watermark and not 0 <= low_watermark < high_watermark:
+      raise ValueError(
+          'low_watermark must be non-negative and below high_watermark.'
+      )
+
     # Ensure there's an event loop available in this thread
     try:
       asyncio.get_running_loop()
@@ -47,19 +157,56 @@ class LiveRequestQueue:
       asyncio.set_event_loop(loop)
 
     # Now create the queue (it will use the event loop we just ensured exists)
-    self._queue = asyncio.Queue()
+    self._queue = _LiveRequestBuffer()
+    self._max_size = max_size
+    self._overflow_policy = overflow_policy
+    self._high_watermark = high_watermark
+    self._low_watermark = low_watermark
+    self._has_capacity = asyncio.Event()
+    self._has_capacity.set()
+    self.dropped_count = 0
+    """The number of realtime blobs dropped because the queue was full."""
 
   def close(self):
-    self._queue.put_nowait(LiveRequest(close=True))
+    self.send(LiveRequest(close=True))
 
   def send_content(self, content: types.Content):
-    self._queue.put_nowait(LiveRequest(content=content))
+    self.send(LiveRequest(content=content))
 
   def send_realtime(self, blob: types.Blob):
-    self._queue.put_nowait(LiveRequest(blob=blob))
+    self.send(LiveRequest(blob=blob))
 
   def send(self, req: LiveRequest):
+    if (
+        self._max_size
+        and _is_realtime_only(req)
+        and self._queue.qsize() >= self._max_size
+    ):
+      if (
+          self._overflow_policy == RealtimeOverflowPolicy.COALESCE
+          and self._queue.coalesce_blob(req.blob)
+      ):
+        return
+      self.dropped_count += 1
+      if (
+          self._overflow_policy == RealtimeOverflowPolicy.DROP_NEWEST
+          or not self._queue.drop_oldest_blob()
+      ):
+        return
     self._queue.put_nowait(req)
+    if self._high_watermark and self._queue.qsize() >= self._high_watermark:
+      self._has_capacity.clear()
 
   async def get(self) -> LiveRequest:
-    return await self._queue.get()
+    req = await self._queue.get()
+    if self._queue.qsize() <= self._low_watermark:
+      self._has_capacity.set()
+    return req
+
+  async def wait_for_capacity(self):
+    """Waits until the queue is no longer above its watermarks.
+
+    Returns immediately unless the queue reached the high watermark and has not
+    been drained to the low watermark since.
+    """
+    await self._has_capacity.wait()
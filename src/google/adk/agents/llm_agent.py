@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
 from typing import Any
@@ -23,6 +24,7 @@ from typing import Callable
 from typing import Literal
 from typing import Optional
 from typing import Union
+import weakref
 
 from google.genai import types
 from pydantic import BaseModel
@@ -268,6 +270,9 @@ class LlmAgent(BaseAgent):
   """
   # Callbacks - End
 
+  _resolved_model: Optional[tuple[weakref.ref, BaseLlm]] = None
+  """The event loop and the model resolved from the model name in it."""
+
   @override
   async def _run_async_impl(
       self, ctx: InvocationContext
@@ -295,7 +300,20 @@ class LlmAgent(BaseAgent):
     if isinstance(self.model, BaseLlm):
       return self.model
     elif self.model:  # model is non-empty str
-      return LLMRegistry.new_llm(self.model)
+      # The model is reused across the invocations in an event loop. It is not
+      # shared with other event loops, as its client is bound to the event
+      # loop it is first used in.
+      try:
+        loop = asyncio.get_running_loop()
+      except RuntimeError:
+        return LLMRegistry.new_llm(self.model)
+      if self._resolved_model is not None:
+        loop_ref, model = self._resolved_model
+        if loop_ref() is loop and model.model == self.model:
+          return model
+      model = LLMRegistry.new_llm(self.model)
+      self._resolved_model = (weakref.ref(loop), model)
+      return model
     else:  # find model from ancestors.
       ancestor_agent = self.parent_agent
       while ancestor_agent is not None:
@@ -359,9 +377,32 @@ class LlmAgent(BaseAgent):
 
     This method is only for use by Agent Development Kit.
     """
+    toolsets = [
+        tool_union
+        for tool_union in self.tools
+        if isinstance(tool_union, BaseToolset)
+    ]
+    toolset_tools = {}
+    if len(toolsets) > 1:
+      # Toolsets may load their tools remotely, so they are resolved
+      # concurrently.
+      toolset_tools = dict(
+          zip(
+              map(id, toolsets),
+              await asyncio.gather(
+                  *(toolset.get_tools(ctx) for toolset in toolsets)
+              ),
+          )
+      )
+
     resolved_tools = []
     for tool_union in self.tools:
-      resolved_tools.extend(await _convert_tool_union_to_tools(tool_union, ctx))
+      if id(tool_union) in toolset_tools:
+        resolved_tools.extend(toolset_tools[id(tool_union)])
+      else:
+        resolved_tools.extend(
+            await _convert_tool_union_to_tools(tool_union, ctx)
+        )
     return resolved_tools
 
   @property
@@ -28,13 +28,20 @@ try:
   from a2a.client import A2AClient
   from a2a.client.client import A2ACardResolver  # Import A2ACardResolver
   from a2a.types import AgentCard
+  from a2a.types import Artifact as A2AArtifact
   from a2a.types import Message as A2AMessage
   from a2a.types import MessageSendParams as A2AMessageSendParams
   from a2a.types import Part as A2APart
   from a2a.types import Role
   from a2a.types import SendMessageRequest
   from a2a.types import SendMessageSuccessResponse
+  from a2a.types import SendStreamingMessageRequest
+  from a2a.types import SendStreamingMessageSuccessResponse
   from a2a.types import Task as A2ATask
+  from a2a.types import TaskArtifactUpdateEvent
+  from a2a.types import TaskState
+  from a2a.types import TaskStatus
+  from a2a.types import TaskStatusUpdateEvent
 
 except ImportError as e:
   import sys
@@ -56,6 +63,7 @@ from ..a2a.converters.part_converter import convert_genai_part_to_a2a_part
 from ..a2a.logs.log_utils import build_a2a_request_log
 from ..a2a.logs.log_utils import build_a2a_response_log
 from ..agents.invocation_context import InvocationContext
+from ..agents.run_config import StreamingMode
 from ..events.event import Event
 from ..flows.llm_flows.contents import _convert_foreign_event
 from ..flows.llm_flows.contents import _is_other_agent_reply
@@ -99,6 +107,13 @@ class RemoteA2aAgent(BaseAgent):
   - HTTP client management with proper resource cleanup
   - A2A message conversion and error handling
   - Session state management across requests
+  - Streaming of partial events when running with `StreamingMode.SSE` and the
+    remote agent supports streaming
+
+  Remote agents in the same agent tree that don't get an explicit
+  `httpx_client` and have the same timeout share a pooled client, so
+  connections to the remote hosts are reused across agents. The pooled client
+  is closed once the last of these agents is cleaned up.
   """
 
   def __init__(
@@ -135,6 +150,7 @@ class RemoteA2aAgent(BaseAgent):
     self._a2a_client: Optional[A2AClient] = None
     self._httpx_client = httpx_client
     self._httpx_client_needs_cleanup = httpx_client is None
+    self._httpx_client_pool: Optional[_HttpxClientPool] = None
     self._timeout = timeout
     self._is_resolved = False
 
@@ -154,12 +170,25 @@ class RemoteA2aAgent(BaseAgent):
   async def _ensure_httpx_client(self) -> httpx.AsyncClient:
     """Ensure HTTP client is available and properly configured."""
     if not self._httpx_client:
-      self._httpx_client = httpx.AsyncClient(
-          timeout=httpx.Timeout(timeout=self._timeout)
+      # Only clients created here are shared, as a client passed in by the
+      # user may carry settings, e.g. auth headers, meant for this agent only.
+      self._httpx_client_pool = (
+          self._find_httpx_client_pool() or _HttpxClientPool()
       )
+      self._httpx_client = self._httpx_client_pool.acquire(self._timeout)
       self._httpx_client_needs_cleanup = True
     return self._httpx_client
 
+  def _find_httpx_client_pool(self) -> Optional[_HttpxClientPool]:
+    """Returns the HTTP client pool used by the remote agents in the tree."""
+    agents_to_visit: list[BaseAgent] = [self.root_agent]
+    while agents_to_visit:
+      agent = agents_to_visit.pop()
+      if isinstance(agent, RemoteA2aAgent) and agent._httpx_client_pool:
+        return agent._httpx_client_pool
+      agents_to_visit.extend(agent.sub_agents)
+    return None
+
   async def _resolve_agent_card_from_url(self, url: str) -> AgentCard:
     """Resolve agent card from URL."""
     try:
@@ -471,6 +500,11 @@ class RemoteA2aAgent(BaseAgent):
 
     logger.info(build_a2a_request_log(a2a_request))
 
+    if self._should_stream(ctx):
+      async for event in self._run_streaming_request(a2a_request, ctx):
+        yield event
+      return
+
     try:
       a2a_response = await self._a2a_client.send_message(request=a2a_request)
       logger.info(build_a2a_response_log(a2a_response))
@@ -506,6 +540,137 @@ class RemoteA2aAgent(BaseAgent):
           },
       )
 
+  def _should_stream(self, ctx: InvocationContext) -> bool:
+    """Whether the request should be sent as a streaming message."""
+    capabilities = self._agent_card.capabilities if self._agent_card else None
+    return bool(
+        capabilities
+        and capabilities.streaming
+        and ctx.run_config
+        and ctx.run_config.streaming_mode == StreamingMode.SSE
+    )
+
+  async def _run_streaming_request(
+      self, a2a_request: SendMessageRequest, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    """Sends a streaming message and yields partial events as updates arrive.
+
+    Status and artifact updates of the remote task are yielded as partial
+    events. Once the stream ends, the final state of the task is yielded as a
+    regular event, the same way as for non-streaming requests.
+
+    Args:
+      a2a_request: The A2A request to send.
+      ctx: The invocation context
+
+    Yields:
+      Partial events for incremental updates, followed by the final event.
+    """
+    request_metadata = a2a_request.model_dump(exclude_none=True, by_alias=True)
+    streaming_request = SendStreamingMessageRequest(
+        id=a2a_request.id, params=a2a_request.params
+    )
+    a2a_task: Optional[A2ATask] = None
+    try:
+      async for a2a_response in self._a2a_client.send_message_streaming(
+          request=streaming_request
+      ):
+        if not isinstance(
+            a2a_response.root, SendStreamingMessageSuccessResponse
+        ):
+          event = await self._handle_a2a_response(a2a_response, ctx)
+          event.custom_metadata = event.custom_metadata or {}
+          event.custom_metadata[A2A_METADATA_PREFIX + "request"] = (
+              request_metadata
+          )
+          yield event
+          return
+
+        result = a2a_response.root.result
+        if isinstance(result, A2AMessage):
+          # A message is always the only and final response of a stream.
+          event = convert_a2a_message_to_event(result, self.name, ctx)
+          event.custom_metadata = event.custom_metadata or {}
+          if result.taskId:
+            event.custom_metadata[A2A_METADATA_PREFIX + "task_id"] = (
+                result.taskId
+            )
+          if result.contextId:
+            event.custom_metadata[A2A_METADATA_PREFIX + "context_id"] = (
+                result.contextId
+            )
+          event.custom_metadata[A2A_METADATA_PREFIX + "request"] = (
+              request_metadata
+          )
+          yield event
+          return
+
+        if isinstance(result, A2ATask):
+          a2a_task = result
+          continue
+
+        a2a_task = _apply_task_update(a2a_task, result)
+        partial_message = None
+        if isinstance(result, TaskStatusUpdateEvent):
+          # The submitted update echoes the request message, which is input
+          # to the remote agent rather than output of it.
+          if (
+              not result.final
+              and result.status.state != TaskState.submitted
+              and result.status.message
+              and result.status.message.role != Role.user
+          ):
+            partial_message = result.status.message
+        elif result.artifact.parts:
+          partial_message = A2AMessage(
+              messageId=str(uuid.uuid4()),
+              role=Role.agent,
+              parts=result.artifact.parts,
+              taskId=result.taskId,
+              contextId=result.contextId,
+          )
+        if partial_message:
+          event = convert_a2a_message_to_event(partial_message, self.name, ctx)
+          event.partial = True
+          yield event
+
+      if not a2a_task:
+        logger.warning("A2A streaming response has no result.")
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+        )
+        return
+
+      event = convert_a2a_task_to_event(a2a_task, self.name, ctx)
+      event.custom_metadata = event.custom_metadata or {}
+      event.custom_metadata[A2A_METADATA_PREFIX + "task_id"] = a2a_task.id
+      if a2a_task.contextId:
+        event.custom_metadata[A2A_METADATA_PREFIX + "context_id"] = (
+            a2a_task.contextId
+        )
+      event.custom_metadata[A2A_METADATA_PREFIX + "request"] = request_metadata
+      event.custom_metadata[A2A_METADATA_PREFIX + "response"] = (
+          a2a_task.model_dump(exclude_none=True, by_alias=True)
+      )
+      yield event
+
+    except Exception as e:
+      error_message = f"A2A request failed: {e}"
+      logger.error(error_message)
+
+      yield Event(
+          author=self.name,
+          error_message=error_message,
+          invocation_id=ctx.invocation_id,
+          branch=ctx.branch,
+          custom_metadata={
+              A2A_METADATA_PREFIX + "request": request_metadata,
+              A2A_METADATA_PREFIX + "error": error_message,
+          },
+      )
+
   async def _run_live_impl(
       self, ctx: InvocationContext
   ) -> AsyncGenerator[Event, None]:
@@ -520,7 +685,10 @@ class RemoteA2aAgent(BaseAgent):
     """Clean up resources, especially the HTTP client if owned by this agent."""
     if self._httpx_client_needs_cleanup and self._httpx_client:
       try:
-        await self._httpx_client.aclose()
+        if self._httpx_client_pool:
+          await self._httpx_client_pool.release(self._httpx_client)
+        else:
+          await self._httpx_client.aclose()
         logger.debug("Closed HTTP client for agent %s", self.name)
       except Exception as e:
         logger.warning(
@@ -530,3 +698,80 @@ class RemoteA2aAgent(BaseAgent):
         )
       finally:
         self._httpx_client = None
+        self._httpx_client_pool = None
+        # The A2A client uses the released HTTP client, so it is rebuilt if
+        # the agent runs again.
+        self._a2a_client = None
+        self._is_resolved = False
+
+
+class _HttpxClientPool:
+  """HTTP clients shared by the remote agents of an agent tree, by timeout.
+
+  Each client is counted as used by every agent that acquired it and is closed
+  once the last of them releases it.
+  """
+
+  def __init__(self):
+    self._clients: dict[float, httpx.AsyncClient] = {}
+    self._ref_counts: dict[float, int] = {}
+
+  def acquire(self, timeout: float) -> httpx.AsyncClient:
+    """Returns the client for the timeout, creating it if needed."""
+    if timeout not in self._clients:
+      self._clients[timeout] = httpx.AsyncClient(
+          timeout=httpx.Timeout(timeout=timeout)
+      )
+      self._ref_counts[timeout] = 0
+    self._ref_counts[timeout] += 1
+    return self._clients[timeout]
+
+  async def release(self, httpx_client: httpx.AsyncClient) -> None:
+    """Releases the client, closing it if no other agent uses it."""
+    for timeout, client in self._clients.items():
+      if client is httpx_client:
+        break
+    else:
+      return
+    self._ref_counts[timeout] -= 1
+    if self._ref_counts[timeout] == 0:
+      del self._clients[timeout]
+      del self._ref_counts[timeout]
+      await httpx_client.aclose()
+
+
+def _apply_task_update(
+    a2a_task: Optional[A2ATask],
+    update: Union[TaskStatusUpdateEvent, TaskArtifactUpdateEvent],
+) -> A2ATask:
+  """Applies a streamed task update to the task snapshot built so far."""
+  if a2a_task is None:
+    a2a_task = A2ATask(
+        id=update.taskId,
+        contextId=update.contextId,
+        status=(
+            update.status
+            if isinstance(update, TaskStatusUpdateEvent)
+            else TaskStatus(state=TaskState.working)
+        ),
+    )
+
+  if isinstance(update, TaskStatusUpdateEvent):
+    a2a_task.status = update.status
+    return a2a_task
+
+  artifacts = a2a_task.artifacts or []
+  for index, artifact in enumerate(artifacts):
+    if artifact.artifactId == update.artifact.artifactId:
+      if update.append:
+        artifacts[index] = A2AArtifact(**{
+            **artifact.model_dump(),
+            "parts": artifact.parts + update.artifact.parts,
+        })
+      else:
+        artifacts[index] = update.artifact
+      break
+  else:
+    artifacts.append(update.artifact)
+  a2a_task.artifacts = artifacts
+  return a2a_task
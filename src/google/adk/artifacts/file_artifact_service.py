@@ -0,0 +1,231 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An artifact service implementation using the local file system."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from typing import Optional
+from urllib.parse import quote
+from urllib.parse import unquote
+
+from google.genai import types
+from typing_extensions import override
+
+from .base_artifact_service import BaseArtifactService
+
+logger = logging.getLogger("google_adk." + __name__)
+
+
+class FileArtifactService(BaseArtifactService):
+  """An artifact service implementation using the local file system.
+
+  Each version of an artifact is stored as a JSON file under
+  `<root_dir>/<app_name>/<user_id>/<session_id or "user">/<filename>/`.
+  Versions are claimed atomically, so several processes can share the same
+  root directory, e.g. the workers of a multi-worker API server.
+  """
+
+  def __init__(self, root_dir: str):
+    """Initializes the FileArtifactService.
+
+    Args:
+        root_dir: The directory to store the artifacts in.
+    """
+    self.root_dir = os.path.abspath(root_dir)
+
+  def _file_has_user_namespace(self, filename: str) -> bool:
+    """Checks if the filename has a user namespace.
+
+    Args:
+        filename: The filename to check.
+
+    Returns:
+        True if the filename has a user namespace (starts with "user:"),
+        False otherwise.
+    """
+    return filename.startswith("user:")
+
+  def _session_dir(self, app_name: str, user_id: str, session_id: str) -> str:
+    return os.path.join(
+        self.root_dir,
+        _to_path_component(app_name),
+        _to_path_component(user_id),
+        _to_path_component(session_id),
+    )
+
+  def _artifact_dir(
+      self, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> str:
+    """Constructs the directory of the versions of an artifact.
+
+    Args:
+        app_name: The name of the application.
+        user_id: The ID of the user.
+        session_id: The ID of the session.
+        filename: The name of the artifact file.
+
+    Returns:
+        The constructed directory.
+    """
+    if self._file_has_user_namespace(filename):
+      session_id = "user"
+    return os.path.join(
+        self._session_dir(app_name, user_id, session_id),
+        _to_path_component(filename),
+    )
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      artifact: types.Part,
+  ) -> int:
+    return await asyncio.to_thread(
+        self._save_artifact, app_name, user_id, session_id, filename, artifact
+    )
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    return await asyncio.to_thread(
+        self._load_artifact, app_name, user_id, session_id, filename, version
+    )
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> list[str]:
+    return await asyncio.to_thread(
+        self._list_artifact_keys, app_name, user_id, session_id
+    )
+
+  @override
+  async def delete_artifact(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> None:
+    artifact_dir = self._artifact_dir(app_name, user_id, session_id, filename)
+    await asyncio.to_thread(shutil.rmtree, artifact_dir, ignore_errors=True)
+
+  @override
+  async def list_versions(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> list[int]:
+    artifact_dir = self._artifact_dir(app_name, user_id, session_id, filename)
+    return await asyncio.to_thread(_list_versions, artifact_dir)
+
+  # The methods below do the blocking file system work of the async methods
+  # above, and run in worker threads so they don't block the event loop.
+
+  def _save_artifact(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      artifact: types.Part,
+  ) -> int:
+    artifact_dir = self._artifact_dir(app_name, user_id, session_id, filename)
+    os.makedirs(artifact_dir, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=artifact_dir, prefix=".")
+    try:
+      with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(artifact.model_dump_json(exclude_none=True))
+      versions = _list_versions(artifact_dir)
+      version = 0 if not versions else max(versions) + 1
+      while True:
+        try:
+          # Linking fails if another process claimed the version first.
+          os.link(temp_path, os.path.join(artifact_dir, str(version)))
+          return version
+        except FileExistsError:
+          version += 1
+    finally:
+      os.remove(temp_path)
+
+  def _load_artifact(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int],
+  ) -> Optional[types.Part]:
+    artifact_dir = self._artifact_dir(app_name, user_id, session_id, filename)
+    if version is None:
+      versions = _list_versions(artifact_dir)
+      if not versions:
+        return None
+      version = max(versions)
+
+    try:
+      with open(
+          os.path.join(artifact_dir, str(version)), encoding="utf-8"
+      ) as f:
+        return types.Part.model_validate_json(f.read())
+    except FileNotFoundError:
+      return None
+
+  def _list_artifact_keys(
+      self, app_name: str, user_id: str, session_id: str
+  ) -> list[str]:
+    filenames = set()
+    for namespace_dir in (
+        self._session_dir(app_name, user_id, session_id),
+        self._session_dir(app_name, user_id, "user"),
+    ):
+      if os.path.isdir(namespace_dir):
+        for name in os.listdir(namespace_dir):
+          if _list_versions(os.path.join(namespace_dir, name)):
+            filenames.add(unquote(name))
+    return sorted(filenames)
+
+
+def _to_path_component(value: str) -> str:
+  """Escapes the value into a single directory name under the root directory.
+
+  Raises:
+    ValueError: If the value would not name a directory of its own, e.g. "..".
+  """
+  component = quote(value, safe="")
+  # quote() escapes separators but not dots, which would point at the current
+  # or parent directory.
+  if component in ("", ".", ".."):
+    raise ValueError(f"Invalid artifact path component: {value!r}")
+  return component
+
+
+def _list_versions(artifact_dir: str) -> list[int]:
+  """Returns the sorted versions stored in the artifact directory."""
+  try:
+    names = os.listdir(artifact_dir)
+  except FileNotFoundError:
+    return []
+  return sorted(int(name) for name in names if name.isdigit())
@@ -14,6 +14,11 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Hashable
 from typing import Optional
 
 from ..tools.tool_context import ToolContext
@@ -27,6 +32,12 @@ from .exchanger.credential_exchanger_registry import CredentialExchangerRegistry
 from .refresher.base_credential_refresher import BaseCredentialRefresher
 from .refresher.credential_refresher_registry import CredentialRefresherRegistry
 
+# Loads, exchanges and refreshes in progress, keyed by event loop and what they
+# load or the token they use, so that concurrent requests share a single call.
+_in_flight_requests: dict[
+    tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future
+] = {}
+
 
 @experimental
 class CredentialManager:
@@ -148,7 +159,7 @@ class CredentialManager:
   ) -> Optional[AuthCredential]:
     """Load existing credential from credential service or cached exchanged credential."""
 
-    # Try loading from credential service first
+    # Try loading from credential service
     credential = await self._load_from_credential_service(tool_context)
     if credential:
       return credential
@@ -163,12 +174,23 @@ class CredentialManager:
       self, tool_context: ToolContext
   ) -> Optional[AuthCredential]:
     """Load credential from credential service if available."""
-    credential_service = tool_context._invocation_context.credential_service
+    invocation_context = tool_context._invocation_context
+    credential_service = invocation_context.credential_service
     if credential_service:
-      # Note: This should be made async in a future refactor
-      # For now, assuming synchronous operation
-      return await credential_service.load_credential(
-          self._auth_config, tool_context
+      # The credential service is always read, so that credentials revoked or
+      # refreshed elsewhere, e.g. by another worker, are seen. Concurrent loads
+      # of the same credential share a single read.
+      return await _run_once(
+          (
+              "load",
+              credential_service,
+              invocation_context.app_name,
+              invocation_context.user_id,
+              self._auth_config.credential_key,
+          ),
+          lambda: credential_service.load_credential(
+              self._auth_config, tool_context
+          ),
       )
     return None
 
@@ -186,8 +208,9 @@ class CredentialManager:
     if not exchanger:
       return credential, False
 
-    exchanged_credential = await exchanger.exchange(
-        credential, self._auth_config.auth_scheme
+    exchanged_credential = await _run_once(
+        _get_single_flight_key(credential, "auth_code"),
+        lambda: exchanger.exchange(credential, self._auth_config.auth_scheme),
     )
     return exchanged_credential, True
 
@@ -202,8 +225,9 @@ class CredentialManager:
     if await refresher.is_refresh_needed(
         credential, self._auth_config.auth_scheme
     ):
-      refreshed_credential = await refresher.refresh(
-          credential, self._auth_config.auth_scheme
+      refreshed_credential = await _run_once(
+          _get_single_flight_key(credential, "refresh_token"),
+          lambda: refresher.refresh(credential, self._auth_config.auth_scheme),
       )
       return refreshed_credential, True
 
@@ -259,3 +283,39 @@ class CredentialManager:
       # Update the exchanged credential in config
       self._auth_config.exchanged_auth_credential = credential
       await credential_service.save_credential(self._auth_config, tool_context)
+
+
+def _get_single_flight_key(
+    credential: AuthCredential, token_field: str
+) -> Optional[Hashable]:
+  """Returns the key that identifies requests made with the same token."""
+  token = getattr(credential.oauth2, token_field, None)
+  if not token:
+    return None
+  return (credential.auth_type, token_field, token)
+
+
+async def _run_once(
+    key: Optional[Hashable], request: Callable[[], Awaitable[Any]]
+) -> Any:
+  """Runs the request, sharing the result with concurrent ones of same key."""
+  if key is None:
+    return await request()
+
+  in_flight_key = (asyncio.get_running_loop(), key)
+  future = _in_flight_requests.get(in_flight_key)
+  if future is None:
+    future = asyncio.ensure_future(request())
+    _in_flight_requests[in_flight_key] = future
+    future.add_done_callback(
+        lambda _: _in_flight_requests.pop(in_flight_key, None)
+    )
+    # Shielded so that a cancelled caller doesn't cancel the shared request.
+    return await asyncio.shield(future)
+
+  result = await asyncio.shield(future)
+  # The callers that joined the request get their own copies, as credentials
+  # are updated in place, e.g. by OAuth2CredentialRefresher.refresh.
+  if isinstance(result, AuthCredential):
+    return result.model_copy(deep=True)
+  return result
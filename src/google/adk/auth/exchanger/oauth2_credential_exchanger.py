@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -87,7 +88,10 @@ class OAuth2CredentialExchanger(BaseCredentialExchanger):
       return auth_credential
 
     try:
-      tokens = client.fetch_token(
+      # authlib's client is synchronous, so the token request runs in a worker
+      # thread to keep the event loop responsive.
+      tokens = await asyncio.to_thread(
+          client.fetch_token,
           token_endpoint,
           authorization_response=auth_credential.oauth2.auth_response_uri,
           code=auth_credential.oauth2.auth_code,
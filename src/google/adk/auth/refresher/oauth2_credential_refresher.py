@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import Optional
@@ -111,7 +112,10 @@ class OAuth2CredentialRefresher(BaseCredentialRefresher):
           return auth_credential
 
         try:
-          tokens = client.refresh_token(
+          # authlib's client is synchronous, so the token request runs in a
+          # worker thread to keep the event loop responsive.
+          tokens = await asyncio.to_thread(
+              client.refresh_token,
               url=token_endpoint,
               refresh_token=auth_credential.oauth2.refresh_token,
           )
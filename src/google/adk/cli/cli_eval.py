@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import json
 import logging
@@ -28,6 +29,7 @@ from ..agents import Agent
 from ..artifacts.base_artifact_service import BaseArtifactService
 from ..evaluation.constants import MISSING_EVAL_DEPENDENCIES_MESSAGE
 from ..evaluation.eval_case import EvalCase
+from ..evaluation.eval_case import Invocation
 from ..evaluation.eval_metrics import EvalMetric
 from ..evaluation.eval_metrics import EvalMetricResult
 from ..evaluation.eval_metrics import EvalMetricResultPerInvocation
@@ -46,6 +48,8 @@ RESPONSE_MATCH_SCORE_KEY = "response_match_score"
 RESPONSE_EVALUATION_SCORE_KEY = "response_evaluation_score"
 
 EVAL_SESSION_ID_PREFIX = "___eval___session___"
+RATE_LIMIT_MAX_RETRIES = 3
+RATE_LIMIT_INITIAL_BACKOFF_SECONDS = 2.0
 DEFAULT_CRITERIA = {
     TOOL_TRAJECTORY_SCORE_KEY: 1.0,  # 1-point scale; 1.0 is perfect.
     RESPONSE_MATCH_SCORE_KEY: 0.8,
@@ -133,9 +137,16 @@ async def run_evals(
     eval_metrics: list[EvalMetric],
     session_service: Optional[BaseSessionService] = None,
     artifact_service: Optional[BaseArtifactService] = None,
+    max_concurrency: int = 1,
+    eval_case_timeout: Optional[float] = None,
+    max_rate_limit_retries: int = RATE_LIMIT_MAX_RETRIES,
 ) -> AsyncGenerator[EvalCaseResult, None]:
   """Returns a stream of EvalCaseResult for each eval case that was evaluated.
 
+  Eval cases are run concurrently, up to `max_concurrency` at a time. Results
+  are always yielded in the order of the input eval cases, each one as soon as
+  it and all the eval cases before it have finished.
+
   Args:
     eval_cases_by_eval_set_id: Eval cases categorized by eval set id to which
       they belong.
@@ -145,116 +156,212 @@ async def run_evals(
     eval_metrics: A list of metrics that should be used during evaluation.
     session_service: The session service to use during inferencing.
     artifact_service: The artifact service to use during inferencing.
+    max_concurrency: The maximum number of eval cases that are run at the same
+      time. Agents relying on `reset_func` or other shared mutable state should
+      use the default of 1.
+    eval_case_timeout: If set, the maximum number of seconds inferencing for a
+      single eval case may take. Eval cases that time out are yielded as
+      failed results without metric results.
+    max_rate_limit_retries: The number of times inferencing for an eval case is
+      retried, with exponential backoff, when the model reports that it is rate
+      limited.
   """
   try:
     from ..evaluation.evaluation_generator import EvaluationGenerator
   except ModuleNotFoundError as e:
     raise ModuleNotFoundError(MISSING_EVAL_DEPENDENCIES_MESSAGE) from e
 
-  for eval_set_id, eval_cases in eval_cases_by_eval_set_id.items():
-    for eval_case in eval_cases:
-      eval_name = eval_case.eval_id
-      initial_session = eval_case.session_input
-      user_id = initial_session.user_id if initial_session else "test_user_id"
+  if max_concurrency < 1:
+    raise ValueError("max_concurrency should be at least 1.")
 
-      try:
-        print(f"Running Eval: {eval_set_id}:{eval_name}")
-        session_id = f"{EVAL_SESSION_ID_PREFIX}{str(uuid.uuid4())}"
+  semaphore = asyncio.Semaphore(max_concurrency)
 
-        inference_result = (
-            await EvaluationGenerator._generate_inferences_from_root_agent(
-                invocations=eval_case.conversation,
-                root_agent=root_agent,
-                reset_func=reset_func,
-                initial_session=initial_session,
-                session_id=session_id,
-                session_service=session_service,
-                artifact_service=artifact_service,
-            )
-        )
+  async def _run_eval_case(
+      eval_set_id: str, eval_case: EvalCase
+  ) -> Optional[EvalCaseResult]:
+    eval_name = eval_case.eval_id
+    initial_session = eval_case.session_input
+    user_id = initial_session.user_id if initial_session else "test_user_id"
 
-        # Initialize the per-invocation metric results to an empty list.
-        # We will fill this as we evaluate each metric.
-        eval_metric_result_per_invocation = []
-        for actual, expected in zip(inference_result, eval_case.conversation):
-          eval_metric_result_per_invocation.append(
-              EvalMetricResultPerInvocation(
-                  actual_invocation=actual,
-                  expected_invocation=expected,
-                  eval_metric_results=[],
-              )
+    try:
+      for attempt in range(max_rate_limit_retries + 1):
+        session_id = f"{EVAL_SESSION_ID_PREFIX}{str(uuid.uuid4())}"
+        try:
+          async with semaphore:
+            if attempt == 0:
+              print(f"Running Eval: {eval_set_id}:{eval_name}")
+            inference_result = await asyncio.wait_for(
+                EvaluationGenerator._generate_inferences_from_root_agent(
+                    invocations=eval_case.conversation,
+                    root_agent=root_agent,
+                    reset_func=reset_func,
+                    initial_session=initial_session,
+                    session_id=session_id,
+                    session_service=session_service,
+                    artifact_service=artifact_service,
+                ),
+                timeout=eval_case_timeout,
+            )
+          break
+        except Exception as e:
+          if not _is_rate_limit_error(e) or attempt == max_rate_limit_retries:
+            raise
+          delay = RATE_LIMIT_INITIAL_BACKOFF_SECONDS * (2**attempt)
+          logger.warning(
+              "Eval `%s:%s` was rate limited, retrying in %.1f seconds.",
+              eval_set_id,
+              eval_name,
+              delay,
           )
+          # The backoff happens outside of the semaphore, so that other eval
+          # cases can run in the meantime.
+          await asyncio.sleep(delay)
+
+      eval_case_result = _evaluate_inferences(
+          eval_set_id=eval_set_id,
+          eval_case=eval_case,
+          inference_result=inference_result,
+          eval_metrics=eval_metrics,
+          session_id=session_id,
+          user_id=user_id,
+      )
 
-        overall_eval_metric_results = []
+      if eval_case_result.final_eval_status == EvalStatus.PASSED:
+        result = "✅ Passed"
+      else:
+        result = "❌ Failed"
+
+      print(f"Result: {eval_set_id}:{eval_name} {result}\n")
+      return eval_case_result
+    except ModuleNotFoundError as e:
+      raise ModuleNotFoundError(MISSING_EVAL_DEPENDENCIES_MESSAGE) from e
+    except asyncio.TimeoutError:
+      logger.error(
+          "Eval `%s:%s` timed out after %s seconds.",
+          eval_set_id,
+          eval_name,
+          eval_case_timeout,
+      )
+      print(f"Result: {eval_set_id}:{eval_name} ❌ Failed (timed out)\n")
+      return EvalCaseResult(
+          eval_set_file=eval_set_id,
+          eval_set_id=eval_set_id,
+          eval_id=eval_name,
+          final_eval_status=EvalStatus.FAILED,
+          overall_eval_metric_results=[],
+          eval_metric_result_per_invocation=[],
+          session_id=session_id,
+          user_id=user_id,
+      )
+    except Exception:
+      # Catching the general exception, so that we don't block other eval
+      # cases.
+      logger.exception(f"Eval failed for `{eval_set_id}:{eval_name}`")
+    return None
+
+  tasks = [
+      asyncio.create_task(_run_eval_case(eval_set_id, eval_case))
+      for eval_set_id, eval_cases in eval_cases_by_eval_set_id.items()
+      for eval_case in eval_cases
+  ]
+  try:
+    # Awaiting the tasks in submission order keeps the results deterministic
+    # regardless of the order in which they complete.
+    for task in tasks:
+      eval_case_result = await task
+      if eval_case_result:
+        yield eval_case_result
+  finally:
+    for task in tasks:
+      task.cancel()
+
+
+def _evaluate_inferences(
+    eval_set_id: str,
+    eval_case: EvalCase,
+    inference_result: list[Invocation],
+    eval_metrics: list[EvalMetric],
+    session_id: str,
+    user_id: str,
+) -> EvalCaseResult:
+  """Returns the EvalCaseResult for the inferences of a single eval case."""
+  # Initialize the per-invocation metric results to an empty list.
+  # We will fill this as we evaluate each metric.
+  eval_metric_result_per_invocation = []
+  for actual, expected in zip(inference_result, eval_case.conversation):
+    eval_metric_result_per_invocation.append(
+        EvalMetricResultPerInvocation(
+            actual_invocation=actual,
+            expected_invocation=expected,
+            eval_metric_results=[],
+        )
+    )
 
-        for eval_metric in eval_metrics:
-          metric_evaluator = _get_evaluator(eval_metric)
+  overall_eval_metric_results = []
 
-          evaluation_result = metric_evaluator.evaluate_invocations(
-              actual_invocations=inference_result,
-              expected_invocations=eval_case.conversation,
-          )
+  for eval_metric in eval_metrics:
+    metric_evaluator = _get_evaluator(eval_metric)
 
-          overall_eval_metric_results.append(
-              EvalMetricResult(
-                  metric_name=eval_metric.metric_name,
-                  threshold=eval_metric.threshold,
-                  score=evaluation_result.overall_score,
-                  eval_status=evaluation_result.overall_eval_status,
-              )
-          )
-          for index, per_invocation_result in enumerate(
-              evaluation_result.per_invocation_results
-          ):
-            eval_metric_result_per_invocation[index].eval_metric_results.append(
-                EvalMetricResult(
-                    metric_name=eval_metric.metric_name,
-                    threshold=eval_metric.threshold,
-                    score=per_invocation_result.score,
-                    eval_status=per_invocation_result.eval_status,
-                )
-            )
+    evaluation_result = metric_evaluator.evaluate_invocations(
+        actual_invocations=inference_result,
+        expected_invocations=eval_case.conversation,
+    )
 
-        final_eval_status = EvalStatus.NOT_EVALUATED
-        # Go over the all the eval statuses and mark the final eval status as
-        # passed if all of them pass, otherwise mark the final eval status to
-        # failed.
-        for overall_eval_metric_result in overall_eval_metric_results:
-          overall_eval_status = overall_eval_metric_result.eval_status
-          if overall_eval_status == EvalStatus.PASSED:
-            final_eval_status = EvalStatus.PASSED
-          elif overall_eval_status == EvalStatus.NOT_EVALUATED:
-            continue
-          elif overall_eval_status == EvalStatus.FAILED:
-            final_eval_status = EvalStatus.FAILED
-            break
-          else:
-            raise ValueError("Unknown eval status.")
-
-        yield EvalCaseResult(
-            eval_set_file=eval_set_id,
-            eval_set_id=eval_set_id,
-            eval_id=eval_name,
-            final_eval_status=final_eval_status,
-            eval_metric_results=[],
-            overall_eval_metric_results=overall_eval_metric_results,
-            eval_metric_result_per_invocation=eval_metric_result_per_invocation,
-            session_id=session_id,
-            user_id=user_id,
+    overall_eval_metric_results.append(
+        EvalMetricResult(
+            metric_name=eval_metric.metric_name,
+            threshold=eval_metric.threshold,
+            score=evaluation_result.overall_score,
+            eval_status=evaluation_result.overall_eval_status,
         )
+    )
+    for index, per_invocation_result in enumerate(
+        evaluation_result.per_invocation_results
+    ):
+      eval_metric_result_per_invocation[index].eval_metric_results.append(
+          EvalMetricResult(
+              metric_name=eval_metric.metric_name,
+              threshold=eval_metric.threshold,
+              score=per_invocation_result.score,
+              eval_status=per_invocation_result.eval_status,
+          )
+      )
 
-        if final_eval_status == EvalStatus.PASSED:
-          result = "✅ Passed"
-        else:
-          result = "❌ Failed"
-
-        print(f"Result: {result}\n")
-      except ModuleNotFoundError as e:
-        raise ModuleNotFoundError(MISSING_EVAL_DEPENDENCIES_MESSAGE) from e
-      except Exception:
-        # Catching the general exception, so that we don't block other eval
-        # cases.
-        logger.exception(f"Eval failed for `{eval_set_id}:{eval_name}`")
+  final_eval_status = EvalStatus.NOT_EVALUATED
+  # Go over the all the eval statuses and mark the final eval status as
+  # passed if all of them pass, otherwise mark the final eval status to
+  # failed.
+  for overall_eval_metric_result in overall_eval_metric_results:
+    overall_eval_status = overall_eval_metric_result.eval_status
+    if overall_eval_status == EvalStatus.PASSED:
+      final_eval_status = EvalStatus.PASSED
+    elif overall_eval_status == EvalStatus.NOT_EVALUATED:
+      continue
+    elif overall_eval_status == EvalStatus.FAILED:
+      final_eval_status = EvalStatus.FAILED
+      break
+    else:
+      raise ValueError("Unknown eval status.")
+
+  return EvalCaseResult(
+      eval_set_file=eval_set_id,
+      eval_set_id=eval_set_id,
+      eval_id=eval_case.eval_id,
+      final_eval_status=final_eval_status,
+      eval_metric_results=[],
+      overall_eval_metric_results=overall_eval_metric_results,
+      eval_metric_result_per_invocation=eval_metric_result_per_invocation,
+      session_id=session_id,
+      user_id=user_id,
+  )
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+  """Returns whether the error signals that the model is rate limited."""
+  status_code = getattr(error, "code", None) or getattr(
+      error, "status_code", None
+  )
+  return status_code == 429
 
 
 def _get_evaluator(eval_metric: EvalMetric) -> Evaluator:
@@ -15,10 +15,10 @@
 from __future__ import annotations
 
 import asyncio
-import collections
 from contextlib import asynccontextmanager
 from datetime import datetime
 import functools
+import json
 import logging
 import os
 import tempfile
@@ -294,12 +294,33 @@ def cli_run(
     ),
     default=None,
 )
+@click.option(
+    "--max_concurrency",
+    type=click.IntRange(min=1),
+    show_default=True,
+    default=1,
+    help=(
+        "Optional. The maximum number of eval cases to run at the same time."
+        " Results are reported in the same order regardless."
+    ),
+)
+@click.option(
+    "--eval_case_timeout",
+    type=float,
+    help=(
+        "Optional. The maximum number of seconds an eval case may take. Eval"
+        " cases that time out are skipped."
+    ),
+    default=None,
+)
 def cli_eval(
     agent_module_file_path: str,
     eval_set_file_path: list[str],
     config_file_path: str,
     print_detailed_results: bool,
     eval_storage_uri: Optional[str] = None,
+    max_concurrency: int = 1,
+    eval_case_timeout: Optional[float] = None,
 ):
   """Evaluates an agent given the eval sets.
 
@@ -388,15 +409,30 @@ def cli_eval(
 
     eval_set_id_to_eval_cases[eval_set.eval_set_id] = eval_cases
 
+  def _save_eval_set_results(
+      eval_set_id: str, eval_case_results: list[EvalCaseResult]
+  ):
+    eval_set_results_manager.save_eval_set_result(
+        app_name=os.path.basename(agent_module_file_path),
+        eval_set_id=eval_set_id,
+        eval_case_results=eval_case_results,
+    )
+
   async def _collect_eval_results() -> list[EvalCaseResult]:
     session_service = InMemorySessionService()
     eval_case_results = []
+    # Results arrive grouped by eval set, so each eval set's results are written
+    # as soon as its last eval case finishes.
+    current_eval_set_id = None
+    current_eval_set_results = []
     async for eval_case_result in run_evals(
         eval_set_id_to_eval_cases,
         root_agent,
         reset_func,
         eval_metrics,
         session_service=session_service,
+        max_concurrency=max_concurrency,
+        eval_case_timeout=eval_case_timeout,
     ):
       eval_case_result.session_details = await session_service.get_session(
           app_name=os.path.basename(agent_module_file_path),
@@ -404,6 +440,14 @@ def cli_eval(
           session_id=eval_case_result.session_id,
       )
       eval_case_results.append(eval_case_result)
+      if eval_case_result.eval_set_id != current_eval_set_id:
+        if current_eval_set_results:
+          _save_eval_set_results(current_eval_set_id, current_eval_set_results)
+        current_eval_set_id = eval_case_result.eval_set_id
+        current_eval_set_results = []
+      current_eval_set_results.append(eval_case_result)
+    if current_eval_set_results:
+      _save_eval_set_results(current_eval_set_id, current_eval_set_results)
     return eval_case_results
 
   try:
@@ -411,19 +455,6 @@ def cli_eval(
   except ModuleNotFoundError:
     raise click.ClickException(MISSING_EVAL_DEPENDENCIES_MESSAGE)
 
-  # Write eval set results.
-  eval_set_id_to_eval_results = collections.defaultdict(list)
-  for eval_case_result in eval_results:
-    eval_set_id = eval_case_result.eval_set_id
-    eval_set_id_to_eval_results[eval_set_id].append(eval_case_result)
-
-  for eval_set_id, eval_case_results in eval_set_id_to_eval_results.items():
-    eval_set_results_manager.save_eval_set_result(
-        app_name=os.path.basename(agent_module_file_path),
-        eval_set_id=eval_set_id,
-        eval_case_results=eval_case_results,
-    )
-
   print("*********************************************************************")
   eval_run_summary = {}
 
@@ -471,7 +502,8 @@ def adk_services_options():
         type=str,
         help=(
             "Optional. The URI of the artifact service,"
-            " supported URIs: gs://<bucket name> for GCS artifact service."
+            " supported URIs: gs://<bucket name> for GCS artifact service,"
+            " file://<path> for local file system artifact service."
         ),
         default=None,
     )
@@ -592,6 +624,102 @@ def fast_api_common_options():
   return decorator
 
 
+def fast_api_server_options():
+  """Decorator to add options of the local fast api server to click commands."""
+
+  def decorator(func):
+    @click.option(
+        "--workers",
+        type=click.IntRange(min=1),
+        default=1,
+        show_default=True,
+        help=(
+            "Optional. The number of worker processes of the server. More"
+            " than one worker requires --session_service_uri and"
+            " --artifact_service_uri so that the workers share sessions and"
+            " artifacts, and disables auto reload. Each worker keeps its own"
+            " traces for the dev UI."
+        ),
+    )
+    @click.option(
+        "--preload",
+        is_flag=True,
+        show_default=True,
+        default=False,
+        help=(
+            "Optional. Whether to load and warm up all agents at startup, so"
+            " that the first request to an agent is as fast as later ones."
+            " Fails the startup if an agent cannot be loaded."
+        ),
+    )
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+      return func(*args, **kwargs)
+
+    return wrapper
+
+  return decorator
+
+
+_WORKER_CONFIG_ENV = "ADK_FAST_API_WORKER_CONFIG"
+
+
+def _create_fast_api_app_for_worker() -> FastAPI:
+  """Creates the app in a worker process of a multi-worker server."""
+  worker_config = json.loads(os.environ[_WORKER_CONFIG_ENV])
+  logs.setup_adk_logger(getattr(logging, worker_config["log_level"].upper()))
+  return get_fast_api_app(**worker_config["app_kwargs"])
+
+
+def _run_fast_api_server(
+    app_kwargs: dict,
+    *,
+    log_level: str,
+    reload: bool,
+    workers: int,
+    lifespan=None,
+) -> None:
+  """Runs the FastAPI server in one process or in several worker processes."""
+  host = app_kwargs["host"]
+  port = app_kwargs["port"]
+  if workers == 1:
+    config = uvicorn.Config(
+        get_fast_api_app(**app_kwargs, lifespan=lifespan),
+        host=host,
+        port=port,
+        reload=reload,
+    )
+    server = uvicorn.Server(config)
+    server.run()
+    return
+
+  if (
+      not app_kwargs["session_service_uri"]
+      or not app_kwargs["artifact_service_uri"]
+  ):
+    raise click.UsageError(
+        "--workers greater than 1 requires --session_service_uri and"
+        " --artifact_service_uri, e.g. sqlite:///sessions.db and"
+        " file://artifacts, so that the workers share sessions and artifacts."
+    )
+  # Builds the app once before starting the workers, so that configuration
+  # errors surface early and the services create their storage, e.g. the
+  # tables of the session database, without racing each other.
+  get_fast_api_app(**app_kwargs)
+  # The workers are new processes, so they build the app from the
+  # environment instead of receiving it from this process.
+  os.environ[_WORKER_CONFIG_ENV] = json.dumps(
+      {"log_level": log_level, "app_kwargs": app_kwargs}
+  )
+  uvicorn.run(
+      f"{__name__}:{_create_fast_api_app_for_worker.__name__}",
+      factory=True,
+      host=host,
+      port=port,
+      workers=workers,
+  )
+
+
 @main.command("web")
 @click.option(
     "--host",
@@ -601,6 +729,7 @@ def fast_api_common_options():
     show_default=True,
 )
 @fast_api_common_options()
+@fast_api_server_options()
 @adk_services_options()
 @deprecated_adk_services_options()
 @click.argument(
@@ -625,6 +754,8 @@ def cli_web(
     session_db_url: Optional[str] = None,  # Deprecated
     artifact_storage_uri: Optional[str] = None,  # Deprecated
     a2a: bool = False,
+    workers: int = 1,
+    preload: bool = False,
 ):
   """Starts a FastAPI server with Web UI for agents.
 
@@ -661,30 +792,27 @@ def cli_web(
 
   session_service_uri = session_service_uri or session_db_url
   artifact_service_uri = artifact_service_uri or artifact_storage_uri
-  app = get_fast_api_app(
-      agents_dir=agents_dir,
-      session_service_uri=session_service_uri,
-      artifact_service_uri=artifact_service_uri,
-      memory_service_uri=memory_service_uri,
-      eval_storage_uri=eval_storage_uri,
-      allow_origins=allow_origins,
-      web=True,
-      trace_to_cloud=trace_to_cloud,
-      lifespan=_lifespan,
-      a2a=a2a,
-      host=host,
-      port=port,
-  )
-  config = uvicorn.Config(
-      app,
-      host=host,
-      port=port,
+  _run_fast_api_server(
+      dict(
+          agents_dir=agents_dir,
+          session_service_uri=session_service_uri,
+          artifact_service_uri=artifact_service_uri,
+          memory_service_uri=memory_service_uri,
+          eval_storage_uri=eval_storage_uri,
+          allow_origins=allow_origins,
+          web=True,
+          trace_to_cloud=trace_to_cloud,
+          a2a=a2a,
+          host=host,
+          port=port,
+          preload=preload,
+      ),
+      log_level=log_level,
       reload=reload,
+      workers=workers,
+      lifespan=_lifespan,
   )
 
-  server = uvicorn.Server(config)
-  server.run()
-
 
 @main.command("api_server")
 @click.option(
@@ -695,6 +823,7 @@ def cli_web(
     show_default=True,
 )
 @fast_api_common_options()
+@fast_api_server_options()
 @adk_services_options()
 @deprecated_adk_services_options()
 # The directory of agents, where each sub-directory is a single agent.
@@ -721,6 +850,8 @@ def cli_api_server(
     session_db_url: Optional[str] = None,  # Deprecated
     artifact_storage_uri: Optional[str] = None,  # Deprecated
     a2a: bool = False,
+    workers: int = 1,
+    preload: bool = False,
 ):
   """Starts a FastAPI server for agents.
 
@@ -735,8 +866,8 @@ def cli_api_server(
 
   session_service_uri = session_service_uri or session_db_url
   artifact_service_uri = artifact_service_uri or artifact_storage_uri
-  config = uvicorn.Config(
-      get_fast_api_app(
+  _run_fast_api_server(
+      dict(
           agents_dir=agents_dir,
           session_service_uri=session_service_uri,
           artifact_service_uri=artifact_service_uri,
@@ -748,13 +879,12 @@ def cli_api_server(
           a2a=a2a,
           host=host,
           port=port,
+          preload=preload,
       ),
-      host=host,
-      port=port,
+      log_level=log_level,
       reload=reload,
+      workers=workers,
   )
-  server = uvicorn.Server(config)
-  server.run()
 
 
 @deploy.command("cloud_run")
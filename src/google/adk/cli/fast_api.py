@@ -16,14 +16,15 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
+import functools
 import json
 import logging
 import os
 from pathlib import Path
 import time
 import traceback
-import typing
 from typing import Any
+from typing import Callable
 from typing import List
 from typing import Literal
 from typing import Optional
@@ -43,21 +44,21 @@ import graphviz
 from opentelemetry import trace
 from opentelemetry.exporter.cloud_trace import CloudTraceSpanExporter
 from opentelemetry.sdk.trace import export
-from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace import TracerProvider
 from pydantic import Field
 from pydantic import ValidationError
 from starlette.types import Lifespan
-from typing_extensions import override
 
 from ..agents import RunConfig
 from ..agents.live_request_queue import LiveRequest
 from ..agents.live_request_queue import LiveRequestQueue
 from ..agents.run_config import StreamingMode
+from ..artifacts.file_artifact_service import FileArtifactService
 from ..artifacts.gcs_artifact_service import GcsArtifactService
 from ..artifacts.in_memory_artifact_service import InMemoryArtifactService
 from ..auth.credential_service.in_memory_credential_service import InMemoryCredentialService
 from ..errors.not_found_error import NotFoundError
+from ..errors.too_many_requests_error import TooManyRequestsError
 from ..evaluation.eval_case import EvalCase
 from ..evaluation.eval_case import SessionInput
 from ..evaluation.eval_metrics import EvalMetric
@@ -75,6 +76,9 @@ from ..sessions.database_session_service import DatabaseSessionService
 from ..sessions.in_memory_session_service import InMemorySessionService
 from ..sessions.session import Session
 from ..sessions.vertex_ai_session_service import VertexAiSessionService
+from ..utils.admission_control import AdmissionController
+from ..utils.admission_control import AdmissionMetrics
+from ..utils.log_utils import LazyPayload
 from .cli_eval import EVAL_SESSION_ID_PREFIX
 from .cli_eval import EvalStatus
 from .utils import cleanup
@@ -83,75 +87,14 @@ from .utils import create_empty_state
 from .utils import envs
 from .utils import evals
 from .utils.agent_loader import AgentLoader
+from .utils.trace_store import TraceStore
+from .utils.trace_store import TraceStoreSpanExporter
 
 logger = logging.getLogger("google_adk." + __name__)
 
 _EVAL_SET_FILE_EXTENSION = ".evalset.json"
 
 
-class ApiServerSpanExporter(export.SpanExporter):
-
-  def __init__(self, trace_dict):
-    self.trace_dict = trace_dict
-
-  def export(
-      self, spans: typing.Sequence[ReadableSpan]
-  ) -> export.SpanExportResult:
-    for span in spans:
-      if (
-          span.name == "call_llm"
-          or span.name == "send_data"
-          or span.name.startswith("execute_tool")
-      ):
-        attributes = dict(span.attributes)
-        attributes["trace_id"] = span.get_span_context().trace_id
-        attributes["span_id"] = span.get_span_context().span_id
-        if attributes.get("gcp.vertex.agent.event_id", None):
-          self.trace_dict[attributes["gcp.vertex.agent.event_id"]] = attributes
-    return export.SpanExportResult.SUCCESS
-
-  def force_flush(self, timeout_millis: int = 30000) -> bool:
-    return True
-
-
-class InMemoryExporter(export.SpanExporter):
-
-  def __init__(self, trace_dict):
-    super().__init__()
-    self._spans = []
-    self.trace_dict = trace_dict
-
-  @override
-  def export(
-      self, spans: typing.Sequence[ReadableSpan]
-  ) -> export.SpanExportResult:
-    for span in spans:
-      trace_id = span.context.trace_id
-      if span.name == "call_llm":
-        attributes = dict(span.attributes)
-        session_id = attributes.get("gcp.vertex.agent.session_id", None)
-        if session_id:
-          if session_id not in self.trace_dict:
-            self.trace_dict[session_id] = [trace_id]
-          else:
-            self.trace_dict[session_id] += [trace_id]
-    self._spans.extend(spans)
-    return export.SpanExportResult.SUCCESS
-
-  @override
-  def force_flush(self, timeout_millis: int = 30000) -> bool:
-    return True
-
-  def get_finished_spans(self, session_id: str):
-    trace_ids = self.trace_dict.get(session_id, None)
-    if trace_ids is None or not trace_ids:
-      return []
-    return [x for x in self._spans if x.context.trace_id in trace_ids]
-
-  def clear(self):
-    self._spans.clear()
-
-
 class AgentRunRequest(common.BaseModel):
   app_name: str
   user_id: str
@@ -192,6 +135,48 @@ class GetEventGraphResult(common.BaseModel):
   dot_src: str
 
 
+class _ReleasingStreamingResponse(StreamingResponse):
+  """A StreamingResponse that calls `release` once it is sent or aborted."""
+
+  def __init__(self, *args, release: Callable[[], None], **kwargs):
+    super().__init__(*args, **kwargs)
+    self._release = release
+
+  async def __call__(self, scope, receive, send) -> None:
+    try:
+      await super().__call__(scope, receive, send)
+    finally:
+      self._release()
+
+
+def _split_inline_data(event: Event) -> tuple[Event, list[bytes]]:
+  """Moves the data of the inline data parts out of the event.
+
+  Returns:
+    The event without the data of its inline data parts, and the data of
+    those parts in the order of the parts.
+  """
+  if not event.content or not event.content.parts:
+    return event, []
+  parts = []
+  blobs = []
+  for part in event.content.parts:
+    if part.inline_data and part.inline_data.data is not None:
+      blobs.append(part.inline_data.data)
+      part = part.model_copy(
+          update={
+              "inline_data": part.inline_data.model_copy(
+                  update={"data": None}
+              )
+          }
+      )
+    parts.append(part)
+  if not blobs:
+    return event, []
+  content = event.content.model_copy(update={"parts": parts})
+  return event.model_copy(update={"content": content}), blobs
+
+
 def get_fast_api_app(
     *,
     agents_dir: str,
@@ -206,18 +191,23 @@ def get_fast_api_app(
     port: int = 8000,
     trace_to_cloud: bool = False,
     lifespan: Optional[Lifespan[FastAPI]] = None,
+    trace_store: Optional[TraceStore] = None,
+    admission_controller: Optional[AdmissionController] = None,
+    preload: bool = False,
 ) -> FastAPI:
-  # InMemory tracing dict.
-  trace_dict: dict[str, Any] = {}
-  session_trace_dict: dict[str, Any] = {}
+  # Admits all runs unless limits are configured.
+  if admission_controller is None:
+    admission_controller = AdmissionController()
+
+  # In-memory store of the spans shown by the dev UI.
+  if trace_store is None:
+    trace_store = TraceStore()
 
   # Set up tracing in the FastAPI server.
   provider = TracerProvider()
   provider.add_span_processor(
-      export.SimpleSpanProcessor(ApiServerSpanExporter(trace_dict))
+      export.SimpleSpanProcessor(TraceStoreSpanExporter(trace_store))
   )
-  memory_exporter = InMemoryExporter(session_trace_dict)
-  provider.add_span_processor(export.SimpleSpanProcessor(memory_exporter))
   if trace_to_cloud:
     envs.load_dotenv_for_agent("", agents_dir)
     if project_id := os.environ.get("GOOGLE_CLOUD_PROJECT", None):
@@ -237,6 +227,8 @@ def get_fast_api_app(
   async def internal_lifespan(app: FastAPI):
 
     try:
+      if preload:
+        await _preload_runners()
       if lifespan:
         async with lifespan(app) as lifespan_context:
           yield lifespan_context
@@ -323,6 +315,9 @@ def get_fast_api_app(
     if artifact_service_uri.startswith("gs://"):
       gcs_bucket = artifact_service_uri.split("://")[1]
       artifact_service = GcsArtifactService(bucket_name=gcs_bucket)
+    elif artifact_service_uri.startswith("file://"):
+      root_dir = artifact_service_uri.split("://")[1]
+      artifact_service = FileArtifactService(root_dir=root_dir)
     else:
       raise click.ClickException(
           "Unsupported artifact service URI: %s" % artifact_service_uri
@@ -353,16 +348,25 @@ def get_fast_api_app(
     agent_names.sort()
     return agent_names
 
+  @app.post("/apps/{app_name}/reload_env")
+  def reload_env(app_name: str) -> None:
+    """Reloads the .env file of the app after it changed on disk."""
+    envs.load_dotenv_for_agent(os.path.basename(app_name), agents_dir)
+
+  @app.get("/debug/admission")
+  def get_admission_metrics() -> dict[str, AdmissionMetrics]:
+    return admission_controller.get_metrics()
+
   @app.get("/debug/trace/{event_id}")
   def get_trace_dict(event_id: str) -> Any:
-    event_dict = trace_dict.get(event_id, None)
+    event_dict = trace_store.get_event_trace(event_id)
     if event_dict is None:
       raise HTTPException(status_code=404, detail="Trace not found")
     return event_dict
 
   @app.get("/debug/trace/session/{session_id}")
   def get_session_trace(session_id: str) -> Any:
-    spans = memory_exporter.get_finished_spans(session_id)
+    spans = trace_store.get_session_spans(session_id)
     if not spans:
       return []
     return [
@@ -780,16 +784,25 @@ def get_fast_api_app(
     )
     if not session:
       raise HTTPException(status_code=404, detail="Session not found")
-    runner = await _get_runner_async(req.app_name)
-    events = [
-        event
-        async for event in runner.run_async(
-            user_id=req.user_id,
-            session_id=req.session_id,
-            new_message=req.new_message,
-        )
-    ]
-    logger.info("Generated %s events in agent run: %s", len(events), events)
+    await _acquire_admission(req.app_name, req.user_id)
+    try:
+      runner = await _get_runner_async(req.app_name)
+      events = [
+          event
+          async for event in runner.run_async(
+              user_id=req.user_id,
+              session_id=req.session_id,
+              new_message=req.new_message,
+              session=session,
+          )
+      ]
+    finally:
+      admission_controller.release(req.app_name, req.user_id)
+    logger.info(
+        "Generated %s events in agent run: %s",
+        len(events),
+        LazyPayload(logger, events.__str__),
+    )
     return events
 
   @app.post("/run_sse")
@@ -800,6 +813,7 @@ def get_fast_api_app(
     )
     if not session:
       raise HTTPException(status_code=404, detail="Session not found")
+    await _acquire_admission(req.app_name, req.user_id)
 
     # Convert the events to properly formatted SSE
     async def event_generator():
@@ -811,10 +825,14 @@ def get_fast_api_app(
             session_id=req.session_id,
             new_message=req.new_message,
             run_config=RunConfig(streaming_mode=stream_mode),
+            session=session,
         ):
           # Format as SSE data
           sse_event = event.model_dump_json(exclude_none=True, by_alias=True)
-          logger.info("Generated event in agent run streaming: %s", sse_event)
+          logger.info(
+              "Generated event in agent run streaming: %s",
+              LazyPayload(logger, sse_event.__str__),
+          )
           yield f"data: {sse_event}\n\n"
       except Exception as e:
         logger.exception("Error in event_generator: %s", e)
@@ -822,9 +840,12 @@ def get_fast_api_app(
         yield f'data: {{"error": "{str(e)}"}}\n\n'
 
     # Returns a streaming response with the proper media type for SSE
-    return StreamingResponse(
+    return _ReleasingStreamingResponse(
         event_generator(),
         media_type="text/event-stream",
+        release=functools.partial(
+            admission_controller.release, req.app_name, req.user_id
+        ),
     )
 
   @app.get(
@@ -886,7 +907,15 @@ def get_fast_api_app(
       modalities: List[Literal["TEXT", "AUDIO"]] = Query(
           default=["TEXT", "AUDIO"]
       ),  # Only allows "TEXT" or "AUDIO"
+      binary_inline_data: bool = False,
   ) -> None:
+    """Runs the agent in live mode over a websocket.
+
+    Each event is sent as a JSON text frame. If `binary_inline_data` is set,
+    the data of the inline data parts of an event (e.g. audio) is left out of
+    the JSON and sent as raw binary frames right after it, one per part and in
+    the order of the parts, instead of base64 in the JSON.
+    """
     await websocket.accept()
 
     session = await session_service.get_session(
@@ -898,58 +927,84 @@ def get_fast_api_app(
       await websocket.close(code=1002, reason="Session not found")
       return
 
-    live_request_queue = LiveRequestQueue()
-
-    async def forward_events():
-      runner = await _get_runner_async(app_name)
-      async for event in runner.run_live(
-          session=session, live_request_queue=live_request_queue
-      ):
-        await websocket.send_text(
-            event.model_dump_json(exclude_none=True, by_alias=True)
-        )
-
-    async def process_messages():
-      try:
-        while True:
-          data = await websocket.receive_text()
-          # Validate and send the received message to the live queue.
-          live_request_queue.send(LiveRequest.model_validate_json(data))
-      except ValidationError as ve:
-        logger.error("Validation error in process_messages: %s", ve)
-
-    # Run both tasks concurrently and cancel all if one fails.
-    tasks = [
-        asyncio.create_task(forward_events()),
-        asyncio.create_task(process_messages()),
-    ]
-    done, pending = await asyncio.wait(
-        tasks, return_when=asyncio.FIRST_EXCEPTION
-    )
     try:
-      # This will re-raise any exception from the completed tasks.
-      for task in done:
-        task.result()
-    except WebSocketDisconnect:
-      logger.info("Client disconnected during process_messages.")
-    except Exception as e:
-      logger.exception("Error during live websocket communication: %s", e)
-      traceback.print_exc()
-      WEBSOCKET_INTERNAL_ERROR_CODE = 1011
+      await admission_controller.acquire(app_name, user_id)
+    except TooManyRequestsError as e:
+      WEBSOCKET_TRY_AGAIN_LATER_CODE = 1013
       WEBSOCKET_MAX_BYTES_FOR_REASON = 123
       await websocket.close(
-          code=WEBSOCKET_INTERNAL_ERROR_CODE,
-          reason=str(e)[:WEBSOCKET_MAX_BYTES_FOR_REASON],
+          code=WEBSOCKET_TRY_AGAIN_LATER_CODE,
+          reason=e.message[:WEBSOCKET_MAX_BYTES_FOR_REASON],
+      )
+      return
+    try:
+      live_request_queue = LiveRequestQueue()
+
+      async def forward_events():
+        runner = await _get_runner_async(app_name)
+        async for event in runner.run_live(
+            session=session, live_request_queue=live_request_queue
+        ):
+          blobs = []
+          if binary_inline_data:
+            event, blobs = _split_inline_data(event)
+          await websocket.send_text(
+              event.model_dump_json(exclude_none=True, by_alias=True)
+          )
+          for blob in blobs:
+            await websocket.send_bytes(blob)
+
+      async def process_messages():
+        try:
+          while True:
+            data = await websocket.receive_text()
+            # Validate and send the received message to the live queue.
+            live_request_queue.send(LiveRequest.model_validate_json(data))
+        except ValidationError as ve:
+          logger.error("Validation error in process_messages: %s", ve)
+
+      # Run both tasks concurrently and cancel all if one fails.
+      tasks = [
+          asyncio.create_task(forward_events()),
+          asyncio.create_task(process_messages()),
+      ]
+      done, pending = await asyncio.wait(
+          tasks, return_when=asyncio.FIRST_EXCEPTION
       )
+      try:
+        # This will re-raise any exception from the completed tasks.
+        for task in done:
+          task.result()
+      except WebSocketDisconnect:
+        logger.info("Client disconnected during process_messages.")
+      except Exception as e:
+        logger.exception("Error during live websocket communication: %s", e)
+        traceback.print_exc()
+        WEBSOCKET_INTERNAL_ERROR_CODE = 1011
+        WEBSOCKET_MAX_BYTES_FOR_REASON = 123
+        await websocket.close(
+            code=WEBSOCKET_INTERNAL_ERROR_CODE,
+            reason=str(e)[:WEBSOCKET_MAX_BYTES_FOR_REASON],
+        )
+      finally:
+        for task in pending:
+          task.cancel()
     finally:
-      for task in pending:
-        task.cancel()
+      admission_controller.release(app_name, user_id)
+
+  async def _acquire_admission(app_name: str, user_id: str) -> None:
+    """Admits a run, or rejects it with HTTP 429 if the app is overloaded."""
+    try:
+      await admission_controller.acquire(app_name, user_id)
+    except TooManyRequestsError as e:
+      raise HTTPException(status_code=429, detail=e.message) from e
 
   async def _get_runner_async(app_name: str) -> Runner:
     """Returns the runner for the given app."""
-    envs.load_dotenv_for_agent(os.path.basename(app_name), agents_dir)
     if app_name in runner_dict:
       return runner_dict[app_name]
+    # The .env file is loaded once per app, see `reload_env` to reload it.
+    envs.load_dotenv_for_agent(os.path.basename(app_name), agents_dir)
     root_agent = agent_loader.load_agent(app_name)
     runner = Runner(
         app_name=app_name,
@@ -962,6 +1017,12 @@ def get_fast_api_app(
     runner_dict[app_name] = runner
     return runner
 
+  async def _preload_runners() -> None:
+    """Loads and warms up the runners of all apps before serving requests."""
+    for app_name in list_apps():
+      runner = await _get_runner_async(app_name)
+      await runner.warmup()
+
   if a2a:
     try:
       from a2a.server.apps import A2AStarletteApplication
@@ -1013,6 +1074,7 @@ def get_fast_api_app(
 
           agent_executor = A2aAgentExecutor(
               runner=create_a2a_runner_loader(app_name),
+              admission_controller=admission_controller,
           )
 
           request_handler = DefaultRequestHandler(
@@ -0,0 +1,231 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bounded in-process store for the spans shown by the dev UI."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import threading
+import time
+import typing
+from typing import Any
+from typing import Optional
+
+from opentelemetry.sdk.trace import export
+from opentelemetry.sdk.trace import ReadableSpan
+from typing_extensions import override
+
+DEFAULT_MAX_SPANS = 10_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SESSION_ID_ATTRIBUTE = "gcp.vertex.agent.session_id"
+_EVENT_ID_ATTRIBUTE = "gcp.vertex.agent.event_id"
+
+
+def _is_event_span(span: ReadableSpan) -> bool:
+  return (
+      span.name == "call_llm"
+      or span.name == "send_data"
+      or span.name.startswith("execute_tool")
+  )
+
+
+def _estimate_size(span: ReadableSpan) -> int:
+  size = len(span.name)
+  for key, value in (span.attributes or {}).items():
+    size += len(key) + len(str(value))
+  return size
+
+
+@dataclasses.dataclass
+class _StoredSpan:
+  span: ReadableSpan
+  sequence: int
+  size: int
+  stored_at: float
+  event_id: Optional[str] = None
+
+
+class TraceStore:
+  """Ring buffer of finished spans indexed by session id and event id.
+
+  The oldest spans are evicted first once any retention limit is exceeded.
+  Lookups by event id and by session id do not scan the buffer.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_spans: Optional[int] = DEFAULT_MAX_SPANS,
+      max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+      max_age_seconds: Optional[float] = None,
+  ):
+    """Initializes the TraceStore.
+
+    Args:
+      max_spans: The maximum number of spans to keep, or None for no limit.
+      max_bytes: The approximate maximum size of the attributes of the kept
+        spans, or None for no limit.
+      max_age_seconds: How long to keep a span after it finished, or None for
+        no limit.
+    """
+    self.max_spans = max_spans
+    self.max_bytes = max_bytes
+    self.max_age_seconds = max_age_seconds
+
+    self._lock = threading.Lock()
+    self._sequence = 0
+    self._size = 0
+    self._spans: collections.deque[_StoredSpan] = collections.deque()
+    self._spans_by_trace_id: dict[int, collections.deque[_StoredSpan]] = {}
+    self._session_id_by_trace_id: dict[int, str] = {}
+    # Trace ids per session, in the order they were first seen.
+    self._trace_ids_by_session_id: dict[str, dict[int, None]] = {}
+    self._event_traces: dict[str, dict[str, Any]] = {}
+
+  def add_spans(self, spans: typing.Sequence[ReadableSpan]) -> None:
+    """Adds finished spans to the store and evicts the expired ones."""
+    with self._lock:
+      now = time.monotonic()
+      for span in spans:
+        self._add_span(span, now)
+      self._evict(now)
+
+  def get_event_trace(self, event_id: str) -> Optional[dict[str, Any]]:
+    """Returns the attributes of the span that produced the event."""
+    with self._lock:
+      self._evict(time.monotonic())
+      return self._event_traces.get(event_id)
+
+  def get_session_spans(self, session_id: str) -> list[ReadableSpan]:
+    """Returns the spans of the traces with LLM calls in the session."""
+    with self._lock:
+      self._evict(time.monotonic())
+      trace_ids = self._trace_ids_by_session_id.get(session_id)
+      if not trace_ids:
+        return []
+      stored_spans = [
+          stored_span
+          for trace_id in trace_ids
+          for stored_span in self._spans_by_trace_id[trace_id]
+      ]
+      is_multi_trace = len(trace_ids) > 1
+    if is_multi_trace:
+      stored_spans.sort(key=lambda stored_span: stored_span.sequence)
+    return [stored_span.span for stored_span in stored_spans]
+
+  def clear(self) -> None:
+    """Removes all spans from the store."""
+    with self._lock:
+      self._size = 0
+      self._spans.clear()
+      self._spans_by_trace_id.clear()
+      self._session_id_by_trace_id.clear()
+      self._trace_ids_by_session_id.clear()
+      self._event_traces.clear()
+
+  def __len__(self) -> int:
+    return len(self._spans)
+
+  def _add_span(self, span: ReadableSpan, now: float) -> None:
+    trace_id = span.context.trace_id
+    stored_span = _StoredSpan(
+        span=span,
+        sequence=self._sequence,
+        size=_estimate_size(span),
+        stored_at=now,
+    )
+    self._sequence += 1
+    self._size += stored_span.size
+    self._spans.append(stored_span)
+    self._spans_by_trace_id.setdefault(
+        trace_id, collections.deque()
+    ).append(stored_span)
+
+    attributes = span.attributes or {}
+    if span.name == "call_llm":
+      session_id = attributes.get(_SESSION_ID_ATTRIBUTE)
+      if session_id and trace_id not in self._session_id_by_trace_id:
+        self._session_id_by_trace_id[trace_id] = session_id
+        self._trace_ids_by_session_id.setdefault(session_id, {})[
+            trace_id
+        ] = None
+
+    if _is_event_span(span) and attributes.get(_EVENT_ID_ATTRIBUTE):
+      stored_span.event_id = attributes[_EVENT_ID_ATTRIBUTE]
+      event_trace = dict(attributes)
+      event_trace["trace_id"] = trace_id
+      event_trace["span_id"] = span.context.span_id
+      self._event_traces[stored_span.event_id] = event_trace
+
+  def _evict(self, now: float) -> None:
+    while self._spans and self._is_over_limit(now):
+      self._remove_oldest_span()
+
+  def _is_over_limit(self, now: float) -> bool:
+    return (
+        (self.max_spans is not None and len(self._spans) > self.max_spans)
+        or (self.max_bytes is not None and self._size > self.max_bytes)
+        or (
+            self.max_age_seconds is not None
+            and now - self._spans[0].stored_at > self.max_age_seconds
+        )
+    )
+
+  def _remove_oldest_span(self) -> None:
+    stored_span = self._spans.popleft()
+    self._size -= stored_span.size
+    trace_id = stored_span.span.context.trace_id
+
+    trace_spans = self._spans_by_trace_id[trace_id]
+    # Spans are removed in the order they were added, so the oldest span of
+    # the trace is the first one.
+    trace_spans.popleft()
+    if not trace_spans:
+      del self._spans_by_trace_id[trace_id]
+      session_id = self._session_id_by_trace_id.pop(trace_id, None)
+      if session_id is not None:
+        session_trace_ids = self._trace_ids_by_session_id[session_id]
+        del session_trace_ids[trace_id]
+        if not session_trace_ids:
+          del self._trace_ids_by_session_id[session_id]
+
+    if stored_span.event_id is not None:
+      event_trace = self._event_traces.get(stored_span.event_id)
+      if (
+          event_trace is not None
+          and event_trace["span_id"] == stored_span.span.context.span_id
+      ):
+        del self._event_traces[stored_span.event_id]
+
+
+class TraceStoreSpanExporter(export.SpanExporter):
+  """Exports finished spans to a TraceStore."""
+
+  def __init__(self, trace_store: TraceStore):
+    super().__init__()
+    self.trace_store = trace_store
+
+  @override
+  def export(
+      self, spans: typing.Sequence[ReadableSpan]
+  ) -> export.SpanExportResult:
+    self.trace_store.add_spans(spans)
+    return export.SpanExportResult.SUCCESS
+
+  @override
+  def force_flush(self, timeout_millis: int = 30000) -> bool:
+    return True
@@ -12,40 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import logging
+from typing import TYPE_CHECKING
 
+from ..utils._lazy_import import lazy_getattr
 from .base_code_executor import BaseCodeExecutor
 from .built_in_code_executor import BuiltInCodeExecutor
 from .code_executor_context import CodeExecutorContext
 from .unsafe_local_code_executor import UnsafeLocalCodeExecutor
 
-logger = logging.getLogger('google_adk.' + __name__)
+if TYPE_CHECKING:
+  from .container_code_executor import ContainerCodeExecutor
+  from .vertex_ai_code_executor import VertexAiCodeExecutor
 
 __all__ = [
     'BaseCodeExecutor',
     'BuiltInCodeExecutor',
     'CodeExecutorContext',
     'UnsafeLocalCodeExecutor',
+    'VertexAiCodeExecutor',
 ]
 
-try:
-  from .vertex_ai_code_executor import VertexAiCodeExecutor
-
-  __all__.append('VertexAiCodeExecutor')
-except ImportError:
-  logger.debug(
-      'The Vertex sdk is not installed. If you want to use the Vertex Code'
-      ' Interpreter with agents, please install it. If not, you can ignore this'
-      ' warning.'
-  )
-
-try:
-  from .container_code_executor import ContainerCodeExecutor
-
-  __all__.append('ContainerCodeExecutor')
-except ImportError:
-  logger.debug(
-      'The docker sdk is not installed. If you want to use the Container Code'
-      ' Executor with agents, please install it. If not, you can ignore this'
-      ' warning.'
-  )
+# Executors backed by the Vertex SDK or docker are imported on first access.
+# ContainerCodeExecutor requires the optional docker sdk, so it's not exported
+# with `import *`.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'ContainerCodeExecutor': '.container_code_executor',
+        'VertexAiCodeExecutor': '.vertex_ai_code_executor',
+    },
+)
@@ -99,6 +99,7 @@ class AgentEvaluator:
       num_runs=NUM_RUNS,
       agent_name=None,
       print_detailed_results: bool = True,
+      max_concurrency: int = 1,
   ):
     """Evaluates an agent using the given EvalSet.
 
@@ -114,6 +115,8 @@ class AgentEvaluator:
       agent_name: The name of the agent.
       print_detailed_results: Whether to print detailed results for each metric
         evaluation.
+      max_concurrency: The maximum number of eval case runs that are processed
+        at the same time.
     """
     try:
       from .evaluation_generator import EvaluationGenerator
@@ -124,6 +127,7 @@ class AgentEvaluator:
         agent_module_path=agent_module,
         repeat_num=num_runs,
         agent_name=agent_name,
+        max_concurrency=max_concurrency,
     )
 
     failures = []
@@ -177,6 +181,7 @@ class AgentEvaluator:
       num_runs: int = NUM_RUNS,
       agent_name: Optional[str] = None,
       initial_session_file: Optional[str] = None,
+      max_concurrency: int = 1,
   ):
     """Evaluates an Agent given eval data.
 
@@ -193,6 +198,8 @@ class AgentEvaluator:
       agent_name: The name of the agent.
       initial_session_file: File that contains initial session state that is
         needed by all the evals in the eval dataset.
+      max_concurrency: The maximum number of eval case runs that are processed
+        at the same time.
     """
     test_files = []
     if isinstance(eval_dataset_file_path_or_dir, str) and os.path.isdir(
@@ -219,6 +226,7 @@ class AgentEvaluator:
           criteria=criteria,
           num_runs=num_runs,
           agent_name=agent_name,
+          max_concurrency=max_concurrency,
       )
 
   @staticmethod
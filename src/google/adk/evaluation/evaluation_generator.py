@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 from typing import Any
 from typing import Optional
@@ -54,6 +55,7 @@ class EvaluationGenerator:
       agent_module_path: str,
       repeat_num: int = 3,
       agent_name: str = None,
+      max_concurrency: int = 1,
   ) -> list[EvalCaseResponses]:
     """Returns evaluation responses for the given dataset and agent.
 
@@ -64,25 +66,36 @@ class EvaluationGenerator:
         usually done to remove uncertainty that a single run may bring.
       agent_name: The name of the agent that should be evaluated. This is
         usually the sub-agent.
+      max_concurrency: The maximum number of eval case runs that are processed
+        at the same time. The order of the results does not depend on it.
     """
-    results = []
+    if max_concurrency < 1:
+      raise ValueError("max_concurrency should be at least 1.")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-    for eval_case in eval_set.eval_cases:
-      responses = []
-      for _ in range(repeat_num):
-        response_invocations = await EvaluationGenerator._process_query(
+    async def _process_eval_case_run(eval_case: EvalCase) -> list[Invocation]:
+      async with semaphore:
+        return await EvaluationGenerator._process_query(
             eval_case.conversation,
             agent_module_path,
             agent_name,
             eval_case.session_input,
         )
-        responses.append(response_invocations)
 
-      results.append(
-          EvalCaseResponses(eval_case=eval_case, responses=responses)
-      )
+    responses_per_eval_case = await asyncio.gather(*[
+        asyncio.gather(
+            *[_process_eval_case_run(eval_case) for _ in range(repeat_num)]
+        )
+        for eval_case in eval_set.eval_cases
+    ])
 
-    return results
+    return [
+        EvalCaseResponses(eval_case=eval_case, responses=list(responses))
+        for eval_case, responses in zip(
+            eval_set.eval_cases, responses_per_eval_case
+        )
+    ]
 
   @staticmethod
   def generate_responses_from_session(session_path, eval_dataset):
@@ -14,10 +14,13 @@
 
 from __future__ import annotations
 
+import collections
+import functools
 from typing import Optional
 
 from google.genai import types as genai_types
-from rouge_score import rouge_scorer
+from rouge_score import scoring
+from rouge_score import tokenizers
 from typing_extensions import override
 
 from .eval_case import Invocation
@@ -27,6 +30,10 @@ from .evaluator import EvaluationResult
 from .evaluator import Evaluator
 from .evaluator import PerInvocationResult
 
+# Eval runs repeat the same expected responses many times (e.g. once per run),
+# so tokenized texts are cached across invocations and evaluators.
+_TOKENIZED_TEXT_CACHE_SIZE = 4096
+
 
 class RougeEvaluator(Evaluator):
   """Calculates the ROUGE-1 metric to compare responses."""
@@ -101,10 +108,30 @@ def _calculate_rouge_1_scores(candidate: str, reference: str):
   Returns:
       A dictionary containing the ROUGE-1 precision, recall, and f-measure.
   """
-  scorer = rouge_scorer.RougeScorer(["rouge1"], use_stemmer=True)
+  target_unigrams = _get_unigram_counts(reference)
+  prediction_unigrams = _get_unigram_counts(candidate)
+
+  intersection_count = sum(
+      min(count, prediction_unigrams[unigram])
+      for unigram, count in target_unigrams.items()
+  )
+  precision = intersection_count / max(sum(prediction_unigrams.values()), 1)
+  recall = intersection_count / max(sum(target_unigrams.values()), 1)
+
+  return scoring.Score(
+      precision=precision,
+      recall=recall,
+      fmeasure=scoring.fmeasure(precision, recall),
+  )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tokenizer() -> tokenizers.DefaultTokenizer:
+  """Returns the stemming tokenizer shared by all ROUGE-1 computations."""
+  return tokenizers.DefaultTokenizer(use_stemmer=True)
 
-  # The score method returns a dictionary where keys are the ROUGE types
-  # and values are Score objects (tuples) with precision, recall, and fmeasure.
-  scores = scorer.score(reference, candidate)
 
-  return scores["rouge1"]
+@functools.lru_cache(maxsize=_TOKENIZED_TEXT_CACHE_SIZE)
+def _get_unigram_counts(text: str) -> collections.Counter[str]:
+  """Returns the unigram counts of the text. Callers must not mutate them."""
+  return collections.Counter(_get_tokenizer().tokenize(text))
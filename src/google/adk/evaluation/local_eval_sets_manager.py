@@ -18,20 +18,20 @@ import json
 import logging
 import os
 import re
+import threading
 import time
 from typing import Any
+from typing import NamedTuple
 from typing import Optional
 import uuid
 
 from google.genai import types as genai_types
+from pydantic import BaseModel
 from pydantic import ValidationError
 from typing_extensions import override
 
-from ._eval_sets_manager_utils import add_eval_case_to_eval_set
-from ._eval_sets_manager_utils import delete_eval_case_from_eval_set
-from ._eval_sets_manager_utils import get_eval_case_from_eval_set
-from ._eval_sets_manager_utils import get_eval_set_from_app_and_id
-from ._eval_sets_manager_utils import update_eval_case_in_eval_set
+from ..errors.not_found_error import NotFoundError
+from ..utils._file_utils import write_file_atomically
 from .eval_case import EvalCase
 from .eval_case import IntermediateData
 from .eval_case import Invocation
@@ -43,6 +43,14 @@ logger = logging.getLogger("google_adk." + __name__)
 
 _EVAL_SET_FILE_EXTENSION = ".evalset.json"
 
+# Appended to the path of an eval set file to get the path of its journal.
+_JOURNAL_FILE_SUFFIX = ".journal.jsonl"
+
+# The journal is folded into its eval set file once it has at least this many
+# records and more records than the eval set has eval cases, so that each
+# change costs O(1) amortized.
+_MIN_JOURNAL_RECORDS_TO_COMPACT = 100
+
 
 def _convert_invocation_to_pydantic_schema(
     invocation_in_json_format: dict[str, Any],
@@ -174,7 +182,20 @@ def convert_eval_set_to_pydanctic_schema(
 def load_eval_set_from_file(
     eval_set_file_path: str, eval_set_id: str
 ) -> EvalSet:
-  """Returns an EvalSet that is read from the given file."""
+  """Returns an EvalSet that is read from the given file and its journal."""
+  eval_set = _load_eval_set_file(eval_set_file_path, eval_set_id)
+  records, _ = _read_journal(eval_set_file_path + _JOURNAL_FILE_SUFFIX, 0)
+  if records:
+    eval_cases = {
+        eval_case.eval_id: eval_case for eval_case in eval_set.eval_cases
+    }
+    _apply_journal_records(eval_cases, records)
+    eval_set.eval_cases = list(eval_cases.values())
+  return eval_set
+
+
+def _load_eval_set_file(eval_set_file_path: str, eval_set_id: str) -> EvalSet:
+  """Returns an EvalSet that is read from the given file only."""
   with open(eval_set_file_path, "r", encoding="utf-8") as f:
     content = f.read()
     try:
@@ -187,21 +208,163 @@ def load_eval_set_from_file(
       )
 
 
+class _EvalCaseJournalRecord(BaseModel):
+  """A change to one eval case, appended as a line to an eval set's journal."""
+
+  eval_case: Optional[EvalCase] = None
+  """The added or updated eval case."""
+
+  deleted_eval_case_id: Optional[str] = None
+  """The id of the deleted eval case."""
+
+
+def _read_journal(
+    journal_path: str, offset: int
+) -> tuple[list[_EvalCaseJournalRecord], int]:
+  """Returns the records of the journal after the offset and the new offset.
+
+  Only complete lines are read, so a record that is still being appended is
+  read on a later call.
+  """
+  try:
+    with open(journal_path, "rb") as f:
+      f.seek(offset)
+      content = f.read()
+  except FileNotFoundError:
+    return [], offset
+
+  end = content.rfind(b"\n") + 1
+  records = []
+  for line in content[:end].splitlines():
+    if not line.strip():
+      continue
+    try:
+      records.append(_EvalCaseJournalRecord.model_validate_json(line))
+    except ValidationError:
+      logger.warning("Skipping invalid record in `%s`.", journal_path)
+  return records, offset + end
+
+
+def _apply_journal_records(
+    eval_cases: dict[str, EvalCase], records: list[_EvalCaseJournalRecord]
+):
+  """Applies the journal records to the eval cases, keyed by eval id."""
+  for record in records:
+    if record.eval_case:
+      eval_cases[record.eval_case.eval_id] = record.eval_case
+    elif record.deleted_eval_case_id:
+      eval_cases.pop(record.deleted_eval_case_id, None)
+
+
+class _CachedEvalSet(NamedTuple):
+  """An eval set loaded from disk, along with the file versions it came from."""
+
+  mtime_ns: int
+  size: int
+  journal_offset: int
+  """The number of bytes of the journal applied to the eval cases."""
+  journal_records: int
+  """The number of records of the journal applied to the eval cases."""
+  eval_set: EvalSet
+  """The eval set without its eval cases, which are in eval_cases."""
+  eval_cases: dict[str, EvalCase]
+  """The eval cases of the eval set, keyed by eval id."""
+
+
+class _CachedEvalSetIds(NamedTuple):
+  """The eval set ids of an app, along with the directory version they came
+  from."""
+
+  mtime_ns: int
+  eval_set_ids: list[str]
+
+
 class LocalEvalSetsManager(EvalSetsManager):
-  """An EvalSets manager that stores eval sets locally on disk."""
+  """An EvalSets manager that stores eval sets locally on disk.
+
+  Each eval set is stored in an `.evalset.json` file. Adding, updating and
+  deleting an eval case appends a record to a journal next to that file
+  instead of rewriting it, and the journal is folded back into the file once
+  it grows as large as the eval set.
+
+  Eval sets are cached in memory, indexed by eval id, and only reloaded when
+  their file changes on disk; records appended to the journal since the last
+  read are applied to the cached eval set. Callers always get copies of the
+  cached eval sets.
+  """
 
   def __init__(self, agents_dir: str):
     self._agents_dir = agents_dir
+    self._eval_set_cache: dict[str, _CachedEvalSet] = {}
+    self._eval_set_ids_cache: dict[str, _CachedEvalSetIds] = {}
+    # Guards the cached eval sets, which are updated in place, and serializes
+    # the changes to the eval cases, which may come from concurrent requests.
+    self._lock = threading.Lock()
 
   @override
   def get_eval_set(self, app_name: str, eval_set_id: str) -> Optional[EvalSet]:
     """Returns an EvalSet identified by an app_name and eval_set_id."""
-    # Load the eval set file data
+    with self._lock:
+      cached = self._get_cached_eval_set(app_name, eval_set_id)
+      if not cached:
+        return None
+      return cached.eval_set.model_copy(
+          update={
+              "eval_cases": [
+                  eval_case.model_copy(deep=True)
+                  for eval_case in cached.eval_cases.values()
+              ]
+          }
+      )
+
+  def _get_cached_eval_set(
+      self, app_name: str, eval_set_id: str
+  ) -> Optional[_CachedEvalSet]:
+    """Returns the cached eval set, brought up to date with the disk.
+
+    Must be called with the lock held, and the result must not be modified.
+    """
+    eval_set_file_path = self._get_eval_set_file_path(app_name, eval_set_id)
     try:
-      eval_set_file_path = self._get_eval_set_file_path(app_name, eval_set_id)
-      return load_eval_set_from_file(eval_set_file_path, eval_set_id)
-    except FileNotFoundError:
-      return None
+      file_stat = os.stat(eval_set_file_path)
+    except OSError:
+      file_stat = None
+
+    cached = self._eval_set_cache.get(eval_set_file_path)
+    if not (
+        file_stat
+        and cached
+        and cached.mtime_ns == file_stat.st_mtime_ns
+        and cached.size == file_stat.st_size
+    ):
+      # Load the eval set file data
+      try:
+        eval_set = _load_eval_set_file(eval_set_file_path, eval_set_id)
+      except FileNotFoundError:
+        self._eval_set_cache.pop(eval_set_file_path, None)
+        return None
+      cached = _CachedEvalSet(
+          mtime_ns=file_stat.st_mtime_ns if file_stat else 0,
+          size=file_stat.st_size if file_stat else 0,
+          journal_offset=0,
+          journal_records=0,
+          eval_set=eval_set.model_copy(update={"eval_cases": []}),
+          eval_cases={
+              eval_case.eval_id: eval_case for eval_case in eval_set.eval_cases
+          },
+      )
+
+    records, journal_offset = _read_journal(
+        eval_set_file_path + _JOURNAL_FILE_SUFFIX, cached.journal_offset
+    )
+    _apply_journal_records(cached.eval_cases, records)
+    cached = cached._replace(
+        journal_offset=journal_offset,
+        journal_records=cached.journal_records + len(records),
+    )
+    if file_stat:
+      self._eval_set_cache[eval_set_file_path] = cached
+    return cached
 
   @override
   def create_eval_set(self, app_name: str, eval_set_id: str):
@@ -223,29 +386,51 @@ class LocalEvalSetsManager(EvalSetsManager):
           creation_timestamp=time.time(),
       )
       self._write_eval_set_to_path(new_eval_set_path, new_eval_set)
+      # Drops the journal of a previous eval set with the same id.
+      try:
+        os.remove(new_eval_set_path + _JOURNAL_FILE_SUFFIX)
+      except FileNotFoundError:
+        pass
 
   @override
   def list_eval_sets(self, app_name: str) -> list[str]:
     """Returns a list of EvalSets that belong to the given app_name."""
     eval_set_file_path = os.path.join(self._agents_dir, app_name)
+    # Adding, removing or renaming a file changes the mtime of the directory,
+    # so the directory is only scanned again when the eval sets may differ.
+    try:
+      mtime_ns = os.stat(eval_set_file_path).st_mtime_ns
+    except OSError:
+      mtime_ns = None
+    cached = self._eval_set_ids_cache.get(eval_set_file_path)
+    if cached and cached.mtime_ns == mtime_ns:
+      return list(cached.eval_set_ids)
+
     eval_sets = []
     for file in os.listdir(eval_set_file_path):
       if file.endswith(_EVAL_SET_FILE_EXTENSION):
         eval_sets.append(
             os.path.basename(file).removesuffix(_EVAL_SET_FILE_EXTENSION)
         )
+    eval_sets.sort()
 
-    return sorted(eval_sets)
+    if mtime_ns is not None:
+      self._eval_set_ids_cache[eval_set_file_path] = _CachedEvalSetIds(
+          mtime_ns=mtime_ns, eval_set_ids=eval_sets
+      )
+    return list(eval_sets)
 
   @override
   def get_eval_case(
       self, app_name: str, eval_set_id: str, eval_case_id: str
   ) -> Optional[EvalCase]:
     """Returns an EvalCase if found, otherwise None."""
-    eval_set = self.get_eval_set(app_name, eval_set_id)
-    if not eval_set:
-      return None
-    return get_eval_case_from_eval_set(eval_set, eval_case_id)
+    with self._lock:
+      cached = self._get_cached_eval_set(app_name, eval_set_id)
+      if not cached:
+        return None
+      eval_case = cached.eval_cases.get(eval_case_id)
+      return eval_case.model_copy(deep=True) if eval_case else None
 
   @override
   def add_eval_case(self, app_name: str, eval_set_id: str, eval_case: EvalCase):
@@ -254,10 +439,16 @@ class LocalEvalSetsManager(EvalSetsManager):
     Raises:
       NotFoundError: If the eval set is not found.
     """
-    eval_set = get_eval_set_from_app_and_id(self, app_name, eval_set_id)
-    updated_eval_set = add_eval_case_to_eval_set(eval_set, eval_case)
-
-    self._save_eval_set(app_name, eval_set_id, updated_eval_set)
+    with self._lock:
+      cached = self._get_existing_eval_set(app_name, eval_set_id)
+      if eval_case.eval_id in cached.eval_cases:
+        raise ValueError(
+            f"Eval id `{eval_case.eval_id}` already exists in `{eval_set_id}`"
+            " eval set.",
+        )
+      self._append_to_journal(
+          app_name, eval_set_id, _EvalCaseJournalRecord(eval_case=eval_case)
+      )
 
   @override
   def update_eval_case(
@@ -268,9 +459,16 @@ class LocalEvalSetsManager(EvalSetsManager):
     Raises:
       NotFoundError: If the eval set or the eval case is not found.
     """
-    eval_set = get_eval_set_from_app_and_id(self, app_name, eval_set_id)
-    updated_eval_set = update_eval_case_in_eval_set(eval_set, updated_eval_case)
-    self._save_eval_set(app_name, eval_set_id, updated_eval_set)
+    with self._lock:
+      cached = self._get_existing_eval_set(app_name, eval_set_id)
+      self._check_eval_case_exists(
+          cached, eval_set_id, updated_eval_case.eval_id
+      )
+      self._append_to_journal(
+          app_name,
+          eval_set_id,
+          _EvalCaseJournalRecord(eval_case=updated_eval_case),
+      )
 
   @override
   def delete_eval_case(
@@ -281,9 +479,36 @@ class LocalEvalSetsManager(EvalSetsManager):
     Raises:
       NotFoundError: If the eval set or the eval case to delete is not found.
     """
-    eval_set = get_eval_set_from_app_and_id(self, app_name, eval_set_id)
-    updated_eval_set = delete_eval_case_from_eval_set(eval_set, eval_case_id)
-    self._save_eval_set(app_name, eval_set_id, updated_eval_set)
+    with self._lock:
+      cached = self._get_existing_eval_set(app_name, eval_set_id)
+      self._check_eval_case_exists(cached, eval_set_id, eval_case_id)
+      logger.info(
+          "EvalCase`%s` was found in the eval set. It will be removed"
+          " permanently.",
+          eval_case_id,
+      )
+      self._append_to_journal(
+          app_name,
+          eval_set_id,
+          _EvalCaseJournalRecord(deleted_eval_case_id=eval_case_id),
+      )
+
+  def _get_existing_eval_set(
+      self, app_name: str, eval_set_id: str
+  ) -> _CachedEvalSet:
+    """Returns the cached eval set, or raises NotFoundError if not found."""
+    cached = self._get_cached_eval_set(app_name, eval_set_id)
+    if not cached:
+      raise NotFoundError(f"Eval set `{eval_set_id}` not found.")
+    return cached
+
+  def _check_eval_case_exists(
+      self, cached: _CachedEvalSet, eval_set_id: str, eval_case_id: str
+  ):
+    if eval_case_id not in cached.eval_cases:
+      raise NotFoundError(
+          f"Eval case `{eval_case_id}` not found in eval set `{eval_set_id}`."
+      )
 
   def _get_eval_set_file_path(self, app_name: str, eval_set_id: str) -> str:
     return os.path.join(
@@ -300,9 +525,64 @@ class LocalEvalSetsManager(EvalSetsManager):
       )
 
   def _write_eval_set_to_path(self, eval_set_path: str, eval_set: EvalSet):
-    with open(eval_set_path, "w") as f:
-      f.write(eval_set.model_dump_json(indent=2))
+    write_file_atomically(eval_set_path, eval_set.model_dump_json(indent=2))
+
+  def _append_to_journal(
+      self, app_name: str, eval_set_id: str, record: _EvalCaseJournalRecord
+  ):
+    """Appends the record to the journal of the eval set.
 
-  def _save_eval_set(self, app_name: str, eval_set_id: str, eval_set: EvalSet):
+    Must be called with the lock held.
+    """
     eval_set_file_path = self._get_eval_set_file_path(app_name, eval_set_id)
-    self._write_eval_set_to_path(eval_set_file_path, eval_set)
+    journal_path = eval_set_file_path + _JOURNAL_FILE_SUFFIX
+    line = (record.model_dump_json() + "\n").encode("utf-8")
+    fd = os.open(journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+      journal_size = os.fstat(fd).st_size
+      try:
+        # A single write, so that records appended by other processes don't
+        # interleave with this one.
+        os.write(fd, line)
+      except BaseException:
+        # Removes a partially written record, which would otherwise merge
+        # with the next one.
+        os.ftruncate(fd, journal_size)
+        raise
+    finally:
+      os.close(fd)
+
+    # Reads the record back, along with the ones appended by other processes.
+    cached = self._get_existing_eval_set(app_name, eval_set_id)
+    if cached.journal_records >= max(
+        len(cached.eval_cases), _MIN_JOURNAL_RECORDS_TO_COMPACT
+    ):
+      self._compact(app_name, eval_set_id, cached)
+
+  def _compact(self, app_name: str, eval_set_id: str, cached: _CachedEvalSet):
+    """Folds the journal of the eval set into its file.
+
+    Must be called with the lock held.
+    """
+    eval_set_file_path = self._get_eval_set_file_path(app_name, eval_set_id)
+    self._write_eval_set_to_path(
+        eval_set_file_path,
+        cached.eval_set.model_copy(
+            update={"eval_cases": list(cached.eval_cases.values())}
+        ),
+    )
+    # The journal is removed after the eval set file was replaced, so a
+    # failure in between leaves records that are applied again on load, which
+    # gives the same eval cases.
+    os.remove(eval_set_file_path + _JOURNAL_FILE_SUFFIX)
+    try:
+      file_stat = os.stat(eval_set_file_path)
+    except OSError:
+      self._eval_set_cache.pop(eval_set_file_path, None)
+      return
+    self._eval_set_cache[eval_set_file_path] = cached._replace(
+        mtime_ns=file_stat.st_mtime_ns,
+        size=file_stat.st_size,
+        journal_offset=0,
+        journal_records=0,
+    )
@@ -164,27 +164,29 @@ class TrajectoryEvaluator(Evaluator):
     if not eval_dataset:
       raise ValueError("The evaluation dataset is empty.")
 
-    results_df = pd.DataFrame(
-        columns=[
-            "query",
-            "response",
-            "actual_tool_use",
-            "expected_tool_use",
-            "tool_use_accuracy",
-        ]
-    )
+    rows = []
     failures = []
 
     for conversation in eval_dataset:
       for index, row in enumerate(conversation):
         new_row, failure = TrajectoryEvaluator._evaluate_row(row)
-        results_df = pd.concat(
-            [results_df, pd.DataFrame([new_row])], ignore_index=True
-        )
+        rows.append(new_row)
         if failure:
           failure["turn"] = index + 1
           failures.append(failure)
 
+    # Build the DataFrame once, concatenating per row is quadratic.
+    results_df = pd.DataFrame(
+        rows,
+        columns=[
+            "query",
+            "response",
+            "actual_tool_use",
+            "expected_tool_use",
+            "tool_use_accuracy",
+        ],
+    )
+
     TrajectoryEvaluator._report_failures(failures)
 
     if print_detailed_results:
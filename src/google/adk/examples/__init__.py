@@ -12,17 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import TYPE_CHECKING
+
+from ..utils._lazy_import import lazy_getattr
 from .base_example_provider import BaseExampleProvider
 from .example import Example
+from .local_example_provider import LocalExampleProvider
+
+if TYPE_CHECKING:
+  from .vertex_ai_example_store import VertexAiExampleStore
 
 __all__ = [
     'BaseExampleProvider',
     'Example',
+    'LocalExampleProvider',
+    'VertexAiExampleStore',
 ]
 
-try:
-  from .vertex_ai_example_store import VertexAiExampleStore
-
-  __all__.append('VertexAiExampleStore')
-except ImportError:
-  pass
+# VertexAiExampleStore pulls in the Vertex SDK, so it's imported on first
+# access.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'VertexAiExampleStore': '.vertex_ai_example_store',
+    },
+)
@@ -49,48 +49,63 @@ def convert_examples_to_text(
     examples: list[Example], model: Optional[str]
 ) -> str:
   """Converts a list of examples to a string that can be used in a system instruction."""
-  examples_str = ""
-  for example_num, example in enumerate(examples):
-    output = f"{_EXAMPLE_START.format(example_num + 1)}{_USER_PREFIX}"
-    if example.input and example.input.parts:
-      output += (
-          "\n".join(part.text for part in example.input.parts if part.text)
-          + "\n"
-      )
-
-    gemini2 = model is None or "gemini-2" in model
-    previous_role = None
-    for content in example.output:
-      role = _MODEL_PREFIX if content.role == "model" else _USER_PREFIX
-      if role != previous_role:
-        output += role
-      previous_role = role
-      for part in content.parts:
-        if part.function_call:
-          args = []
-          # Convert function call part to python-like function call
-          for k, v in part.function_call.args.items():
-            if isinstance(v, str):
-              args.append(f"{k}='{v}'")
-            else:
-              args.append(f"{k}={v}")
-          prefix = _FUNCTION_PREFIX if gemini2 else _FUNCTION_CALL_PREFIX
-          output += (
-              f"{prefix}{part.function_call.name}({', '.join(args)}){_FUNCTION_CALL_SUFFIX}"
-          )
-        # Convert function response part to json string
-        elif part.function_response:
-          prefix = _FUNCTION_PREFIX if gemini2 else _FUNCTION_RESPONSE_PREFIX
-          output += f"{prefix}{part.function_response.__dict__}{_FUNCTION_RESPONSE_SUFFIX}"
-        elif part.text:
-          output += f"{part.text}\n"
-
-    output += _EXAMPLE_END
-    examples_str += output
+  gemini2 = _is_gemini2(model)
+  return _join_example_texts(
+      [_render_example(example, gemini2) for example in examples]
+  )
 
+
+def _is_gemini2(model: Optional[str]) -> bool:
+  """Whether the examples are rendered for a Gemini 2 model."""
+  return model is None or "gemini-2" in model
+
+
+def _join_example_texts(example_texts: list[str]) -> str:
+  """Joins the rendered texts of examples into a system instruction."""
+  examples_str = "".join(
+      f"{_EXAMPLE_START.format(example_num + 1)}{text}{_EXAMPLE_END}"
+      for example_num, text in enumerate(example_texts)
+  )
   return f"{_EXAMPLES_INTRO}{examples_str}{_EXAMPLES_END}"
 
 
+def _render_example(example: Example, gemini2: bool) -> str:
+  """Renders the user input and the model output of the example."""
+  output = _USER_PREFIX
+  if example.input and example.input.parts:
+    output += (
+        "\n".join(part.text for part in example.input.parts if part.text)
+        + "\n"
+    )
+
+  previous_role = None
+  for content in example.output:
+    role = _MODEL_PREFIX if content.role == "model" else _USER_PREFIX
+    if role != previous_role:
+      output += role
+    previous_role = role
+    for part in content.parts:
+      if part.function_call:
+        args = []
+        # Convert function call part to python-like function call
+        for k, v in part.function_call.args.items():
+          if isinstance(v, str):
+            args.append(f"{k}='{v}'")
+          else:
+            args.append(f"{k}={v}")
+        prefix = _FUNCTION_PREFIX if gemini2 else _FUNCTION_CALL_PREFIX
+        output += (
+            f"{prefix}{part.function_call.name}({', '.join(args)}){_FUNCTION_CALL_SUFFIX}"
+        )
+      # Convert function response part to json string
+      elif part.function_response:
+        prefix = _FUNCTION_PREFIX if gemini2 else _FUNCTION_RESPONSE_PREFIX
+        output += f"{prefix}{part.function_response.__dict__}{_FUNCTION_RESPONSE_SUFFIX}"
+      elif part.text:
+        output += f"{part.text}\n"
+  return output
+
+
 def _get_latest_message_from_user(session: "Session") -> str:
   """Gets the latest message from the user.
 
@@ -116,9 +131,21 @@ def build_example_si(
     query: str,
     model: Optional[str],
 ) -> str:
+  # Imported here, as the provider renders its examples with this module.
+  from .local_example_provider import LocalExampleProvider
+
   if isinstance(examples, list):
     return convert_examples_to_text(examples, model)
+  if isinstance(examples, LocalExampleProvider):
+    # The provider renders its examples once, when it's built.
+    example_texts = examples._get_example_texts(query, _is_gemini2(model))
+    if not example_texts:
+      return ""
+    return _join_example_texts(example_texts)
   if isinstance(examples, BaseExampleProvider):
-    return convert_examples_to_text(examples.get_examples(query), model)
+    provided_examples = examples.get_examples(query)
+    if not provided_examples:
+      return ""
+    return convert_examples_to_text(provided_examples, model)
 
   raise ValueError("Invalid example configuration")
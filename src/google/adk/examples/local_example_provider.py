@@ -0,0 +1,120 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import heapq
+import math
+import re
+
+from pydantic import TypeAdapter
+from typing_extensions import override
+
+from . import example_util
+from .base_example_provider import BaseExampleProvider
+from .example import Example
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# BM25 parameters, see https://en.wikipedia.org/wiki/Okapi_BM25.
+_K1 = 1.2
+_B = 0.75
+
+
+def _tokenize(text: str) -> list[str]:
+  return _WORD_PATTERN.findall(text.lower())
+
+
+def _get_input_text(example: Example) -> str:
+  if not example.input or not example.input.parts:
+    return ""
+  return "\n".join(part.text for part in example.input.parts if part.text)
+
+
+class LocalExampleProvider(BaseExampleProvider):
+  """Provides the examples most relevant to a query from an in-memory index.
+
+  The examples are ranked by the BM25 score of their input against the query,
+  using a keyword index built once at construction. Examples that share no
+  word with the query are not returned. The text of the examples in system
+  instructions is also rendered once at construction.
+  """
+
+  def __init__(self, examples: list[Example], *, top_k: int = 3):
+    """Initializes the LocalExampleProvider.
+
+    Args:
+      examples: The examples to index.
+      top_k: The maximum number of examples to return for a query.
+    """
+    self.examples = TypeAdapter(list[Example]).validate_python(examples)
+    self.top_k = top_k
+
+    token_counts = [
+        collections.Counter(_tokenize(_get_input_text(example)))
+        for example in self.examples
+    ]
+    lengths = [sum(counts.values()) for counts in token_counts]
+    average_length = sum(lengths) / len(lengths) if lengths else 0.0
+    document_frequencies = collections.Counter(
+        token for counts in token_counts for token in counts
+    )
+
+    # The BM25 weight of each token in each example, by token.
+    self._postings: dict[str, list[tuple[int, float]]] = (
+        collections.defaultdict(list)
+    )
+    for index, (counts, length) in enumerate(zip(token_counts, lengths)):
+      length_ratio = length / average_length if average_length else 0.0
+      for token, count in counts.items():
+        frequency = document_frequencies[token]
+        idf = math.log(
+            1 + (len(self.examples) - frequency + 0.5) / (frequency + 0.5)
+        )
+        weight = (
+            idf
+            * count
+            * (_K1 + 1)
+            / (count + _K1 * (1 - _B + _B * length_ratio))
+        )
+        self._postings[token].append((index, weight))
+
+    # The rendered text of each example, by whether it's rendered for Gemini 2.
+    self._example_texts: dict[bool, list[str]] = {
+        gemini2: [
+            example_util._render_example(example, gemini2)
+            for example in self.examples
+        ]
+        for gemini2 in (False, True)
+    }
+
+  @override
+  def get_examples(self, query: str) -> list[Example]:
+    return [self.examples[index] for index in self._get_top_indices(query)]
+
+  def _get_example_texts(self, query: str, gemini2: bool) -> list[str]:
+    """Returns the rendered texts of the examples most relevant to the query."""
+    example_texts = self._example_texts[gemini2]
+    return [example_texts[index] for index in self._get_top_indices(query)]
+
+  def _get_top_indices(self, query: str) -> list[int]:
+    scores: dict[int, float] = collections.defaultdict(float)
+    for token in set(_tokenize(query)):
+      for index, weight in self._postings.get(token, ()):
+        scores[index] += weight
+    # Ties are broken by the order of the examples.
+    return heapq.nlargest(
+        self.top_k, scores, key=lambda index: (scores[index], -index)
+    )
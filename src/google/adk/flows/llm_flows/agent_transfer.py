@@ -16,8 +16,10 @@
 
 from __future__ import annotations
 
+import functools
 import typing
 from typing import AsyncGenerator
+from typing import Optional
 
 from typing_extensions import override
 
@@ -69,10 +71,10 @@ class _AgentTransferLlmRequestProcessor(BaseLlmRequestProcessor):
 request_processor = _AgentTransferLlmRequestProcessor()
 
 
-def _build_target_agents_info(target_agent: BaseAgent) -> str:
+def _build_target_agents_info(name: str, description: str) -> str:
   return f"""
-Agent name: {target_agent.name}
-Agent description: {target_agent.description}
+Agent name: {name}
+Agent description: {description}
 """
 
 
@@ -81,12 +83,32 @@ line_break = '\n'
 
 def _build_target_agents_instructions(
     agent: LlmAgent, target_agents: list[BaseAgent]
+) -> str:
+  parent_agent_name = None
+  if agent.parent_agent and not agent.disallow_transfer_to_parent:
+    parent_agent_name = agent.parent_agent.name
+  return _format_target_agents_instructions(
+      tuple(
+          (target_agent.name, target_agent.description)
+          for target_agent in target_agents
+      ),
+      parent_agent_name,
+  )
+
+
+# The instructions are rebuilt on every LLM step, so they are cached by the
+# agent names and descriptions they are built from.
+@functools.lru_cache(maxsize=256)
+def _format_target_agents_instructions(
+    target_agents: tuple[tuple[str, str], ...],
+    parent_agent_name: Optional[str],
 ) -> str:
   si = f"""
 You have a list of other agents to transfer to:
 
 {line_break.join([
-    _build_target_agents_info(target_agent) for target_agent in target_agents
+    _build_target_agents_info(name, description)
+    for name, description in target_agents
 ])}
 
 If you are the best to answer the question according to your description, you
@@ -98,9 +120,9 @@ question to that agent. When transferring, do not generate any text other than
 the function call.
 """
 
-  if agent.parent_agent and not agent.disallow_transfer_to_parent:
+  if parent_agent_name:
     si += f"""
-Your parent agent is {agent.parent_agent.name}. If neither the other agents nor
+Your parent agent is {parent_agent_name}. If neither the other agents nor
 you are best for answering the question according to the descriptions, transfer
 to your parent agent.
 """
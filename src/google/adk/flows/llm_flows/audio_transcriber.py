@@ -13,7 +13,9 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
+from typing import Union
 
 from google.cloud import speech
 from google.genai import types as genai_types
@@ -44,13 +46,57 @@ class AudioTranscriber:
     Returns:
         A list of Content objects containing the transcribed text.
     """
+    contents = []
+    for speaker, data in self._bundle_audio(invocation_context):
+      if isinstance(data, bytes):
+        contents.extend(self._transcribe(speaker, data))
+      else:
+        # don't need to transcribe model which are already text
+        contents.append(data)
+    return contents
+
+  async def transcribe_file_async(
+      self, invocation_context: InvocationContext
+  ) -> list[genai_types.Content]:
+    """Async version of `transcribe_file`.
+
+    The audio bundles are transcribed concurrently in worker threads, so the
+    blocking Speech-to-Text calls don't stall the event loop.
+
+    Args:
+        invocation_context: The invocation context to access the transcription
+          cache.
+
+    Returns:
+        A list of Content objects containing the transcribed text, in the same
+        order as the speakers.
+    """
+
+    async def _transcribe_bundle(
+        speaker: str, data: Union[bytes, genai_types.Content]
+    ) -> list[genai_types.Content]:
+      if isinstance(data, bytes):
+        return await asyncio.to_thread(self._transcribe, speaker, data)
+      return [data]
+
+    transcribed_bundles = await asyncio.gather(*[
+        _transcribe_bundle(speaker, data)
+        for speaker, data in self._bundle_audio(invocation_context)
+    ])
+    return [content for contents in transcribed_bundles for content in contents]
 
+  def _bundle_audio(
+      self, invocation_context: InvocationContext
+  ) -> list[tuple[str, Union[bytes, genai_types.Content]]]:
+    """Merges consecutive audio blobs of the same speaker and resets the cache.
+
+    The audio chunks of a speaker turn are collected in a list and joined once,
+    so bundling is linear in the size of the audio.
+    """
     bundled_audio = []
     current_speaker = None
-    current_audio_data = b''
-    contents = []
+    current_audio_chunks: list[bytes] = []
 
-    # Step1: merge audio blobs
     for transcription_entry in invocation_context.transcription_cache or []:
       speaker, audio_data = (
           transcription_entry.role,
@@ -59,52 +105,52 @@ class AudioTranscriber:
 
       if isinstance(audio_data, genai_types.Content):
         if current_speaker is not None:
-          bundled_audio.append((current_speaker, current_audio_data))
+          bundled_audio.append(
+              (current_speaker, b''.join(current_audio_chunks))
+          )
           current_speaker = None
-          current_audio_data = b''
+          current_audio_chunks = []
         bundled_audio.append((speaker, audio_data))
         continue
 
       if not audio_data.data:
         continue
 
-      if speaker == current_speaker:
-        current_audio_data += audio_data.data
-      else:
+      if speaker != current_speaker:
         if current_speaker is not None:
-          bundled_audio.append((current_speaker, current_audio_data))
+          bundled_audio.append(
+              (current_speaker, b''.join(current_audio_chunks))
+          )
         current_speaker = speaker
-        current_audio_data = audio_data.data
+        current_audio_chunks = []
+      current_audio_chunks.append(audio_data.data)
 
     # Append the last audio segment if any
     if current_speaker is not None:
-      bundled_audio.append((current_speaker, current_audio_data))
+      bundled_audio.append((current_speaker, b''.join(current_audio_chunks)))
 
     # reset cache
     invocation_context.transcription_cache = []
+    return bundled_audio
 
-    # Step2: transcription
-    for speaker, data in bundled_audio:
-      if isinstance(data, genai_types.Blob):
-        audio = speech.RecognitionAudio(content=data)
+  def _transcribe(self, speaker: str, data: bytes) -> list[genai_types.Content]:
+    """Transcribes a single audio bundle with Speech-to-Text."""
+    audio = speech.RecognitionAudio(content=data)
 
-        config = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=16000,
-            language_code='en-US',
-        )
+    config = speech.RecognitionConfig(
+        encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+        sample_rate_hertz=16000,
+        language_code='en-US',
+    )
 
-        response = self.client.recognize(config=config, audio=audio)
+    response = self.client.recognize(config=config, audio=audio)
 
-        for result in response.results:
-          transcript = result.alternatives[0].transcript
-
-          parts = [genai_types.Part(text=transcript)]
-          role = speaker.lower()
-          content = genai_types.Content(role=role, parts=parts)
-          contents.append(content)
-      else:
-        # don't need to transcribe model which are already text
-        contents.append(data)
+    contents = []
+    for result in response.results:
+      transcript = result.alternatives[0].transcript
 
+      parts = [genai_types.Part(text=transcript)]
+      role = speaker.lower()
+      content = genai_types.Content(role=role, parts=parts)
+      contents.append(content)
     return contents
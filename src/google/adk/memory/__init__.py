@@ -11,27 +11,29 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import logging
 
+from typing import TYPE_CHECKING
+
+from ..utils._lazy_import import lazy_getattr
 from .base_memory_service import BaseMemoryService
 from .in_memory_memory_service import InMemoryMemoryService
-from .vertex_ai_memory_bank_service import VertexAiMemoryBankService
 
-logger = logging.getLogger('google_adk.' + __name__)
+if TYPE_CHECKING:
+  from .vertex_ai_memory_bank_service import VertexAiMemoryBankService
+  from .vertex_ai_rag_memory_service import VertexAiRagMemoryService
 
 __all__ = [
     'BaseMemoryService',
     'InMemoryMemoryService',
     'VertexAiMemoryBankService',
+    'VertexAiRagMemoryService',
 ]
 
-try:
-  from .vertex_ai_rag_memory_service import VertexAiRagMemoryService
-
-  __all__.append('VertexAiRagMemoryService')
-except ImportError:
-  logger.debug(
-      'The Vertex SDK is not installed. If you want to use the'
-      ' VertexAiRagMemoryService please install it. If not, you can ignore this'
-      ' warning.'
-  )
+# Services backed by the Vertex SDK are imported on first access.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'VertexAiMemoryBankService': '.vertex_ai_memory_bank_service',
+        'VertexAiRagMemoryService': '.vertex_ai_rag_memory_service',
+    },
+)
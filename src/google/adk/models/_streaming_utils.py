@@ -0,0 +1,102 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers to aggregate streamed model output in linear time."""
+
+from __future__ import annotations
+
+import json
+
+
+class TextAccumulator:
+  """Accumulates streamed text fragments and joins them once when consumed."""
+
+  def __init__(self):
+    self._chunks: list[str] = []
+
+  def append(self, text: str) -> None:
+    if text:
+      self._chunks.append(text)
+
+  def __bool__(self) -> bool:
+    return bool(self._chunks)
+
+  @property
+  def text(self) -> str:
+    """The text accumulated so far."""
+    if len(self._chunks) > 1:
+      self._chunks = [''.join(self._chunks)]
+    return self._chunks[0] if self._chunks else ''
+
+  def pop(self) -> str:
+    """Returns the text accumulated so far and resets the accumulator."""
+    text = self.text
+    self._chunks = []
+    return text
+
+
+class JsonAccumulator(TextAccumulator):
+  """Accumulates streamed JSON fragments and tracks whether they are complete.
+
+  Brackets are tracked as fragments arrive, so the accumulated text is only
+  parsed when its brackets are balanced, instead of after every fragment.
+  """
+
+  def __init__(self):
+    super().__init__()
+    self._depth = 0
+    self._in_string = False
+    self._escaped = False
+    self._is_scalar = None
+    self._is_complete = False
+
+  def append(self, text: str) -> None:
+    super().append(text)
+    if not text:
+      return
+
+    for char in text:
+      if self._in_string:
+        if self._escaped:
+          self._escaped = False
+        elif char == '\\':
+          self._escaped = True
+        elif char == '"':
+          self._in_string = False
+        continue
+      if self._is_scalar is None and not char.isspace():
+        self._is_scalar = char not in '{['
+      if char == '"':
+        self._in_string = True
+      elif char in '{[':
+        self._depth += 1
+      elif char in '}]':
+        self._depth -= 1
+
+    if self._is_scalar or (self._depth == 0 and not self._in_string):
+      self._is_complete = _is_valid_json(self.text)
+    else:
+      self._is_complete = False
+
+  def is_complete(self) -> bool:
+    """Whether the accumulated text is a complete JSON value."""
+    return self._is_complete
+
+
+def _is_valid_json(text: str) -> bool:
+  try:
+    json.loads(text)
+    return True
+  except json.JSONDecodeError:
+    return False
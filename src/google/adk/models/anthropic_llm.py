@@ -248,6 +248,10 @@ class Claude(BaseLlm):
     )
     yield message_to_generate_content_response(message)
 
+  @override
+  async def warmup(self) -> None:
+    self._anthropic_client  # pylint: disable=pointless-statement
+
   @cached_property
   def _anthropic_client(self) -> AnthropicVertex:
     if (
@@ -115,6 +115,12 @@ class BaseLlm(BaseModel):
           )
       )
 
+  async def warmup(self) -> None:
+    """Prepares the LLM for its first request, e.g. by creating its client.
+
+    The default implementation does nothing.
+    """
+
   def connect(self, llm_request: LlmRequest) -> BaseLlmConnection:
     """Creates a live connection to the LLM.
 
@@ -20,6 +20,7 @@ from typing import AsyncGenerator
 from google.genai import live
 from google.genai import types
 
+from ._streaming_utils import TextAccumulator
 from .base_llm_connection import BaseLlmConnection
 from .llm_response import LlmResponse
 
@@ -130,7 +131,7 @@ class GeminiLlmConnection(BaseLlmConnection):
       LlmResponse: The model response.
     """
 
-    text = ''
+    text = TextAccumulator()
     async for message in self._gemini_session.receive():
       logger.debug('Got LLM Live message: %s', message)
       if message.server_content:
@@ -140,12 +141,11 @@ class GeminiLlmConnection(BaseLlmConnection):
               content=content, interrupted=message.server_content.interrupted
           )
           if content.parts[0].text:
-            text += content.parts[0].text
+            text.append(content.parts[0].text)
             llm_response.partial = True
           # don't yield the merged text event when receiving audio data
           elif text and not content.parts[0].inline_data:
-            yield self.__build_full_text_response(text)
-            text = ''
+            yield self.__build_full_text_response(text.pop())
           yield llm_response
         if (
             message.server_content.input_transcription
@@ -172,7 +172,7 @@ class GeminiLlmConnection(BaseLlmConnection):
           # Transcription is always considered as partial event
           # We rely on other control signals to determine when to yield the
           # full text response(turn_complete, interrupted, or tool_call).
-          text += message.server_content.output_transcription.text
+          text.append(message.server_content.output_transcription.text)
           parts = [
               types.Part.from_text(
                   text=message.server_content.output_transcription.text
@@ -185,8 +185,7 @@ class GeminiLlmConnection(BaseLlmConnection):
 
         if message.server_content.turn_complete:
           if text:
-            yield self.__build_full_text_response(text)
-            text = ''
+            yield self.__build_full_text_response(text.pop())
           yield LlmResponse(
               turn_complete=True, interrupted=message.server_content.interrupted
           )
@@ -196,13 +195,11 @@ class GeminiLlmConnection(BaseLlmConnection):
         # text. Other we don't merge. because content can be none when model
         # safety threshold is triggered
         if message.server_content.interrupted and text:
-          yield self.__build_full_text_response(text)
-          text = ''
+          yield self.__build_full_text_response(text.pop())
         yield LlmResponse(interrupted=message.server_content.interrupted)
       if message.tool_call:
         if text:
-          yield self.__build_full_text_response(text)
-          text = ''
+          yield self.__build_full_text_response(text.pop())
         parts = [
             types.Part(function_call=function_call)
             for function_call in message.tool_call.function_calls
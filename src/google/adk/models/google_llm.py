@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 from functools import cached_property
 import logging
 import os
@@ -30,7 +31,9 @@ from google.genai import types
 from typing_extensions import override
 
 from .. import version
+from ..utils.log_utils import LazyPayload
 from ..utils.variant_utils import GoogleLLMVariant
+from ._streaming_utils import TextAccumulator
 from .base_llm import BaseLlm
 from .base_llm_connection import BaseLlmConnection
 from .gemini_llm_connection import GeminiLlmConnection
@@ -93,7 +96,10 @@ class Gemini(BaseLlm):
         self._api_backend,
         stream,
     )
-    logger.info(_build_request_log(llm_request))
+    logger.info(
+        '%s',
+        LazyPayload(logger, functools.partial(_build_request_log, llm_request)),
+    )
 
     # add tracking headers to custom headers given it will override the headers
     # set in the api client constructor
@@ -109,8 +115,8 @@ class Gemini(BaseLlm):
           config=llm_request.config,
       )
       response = None
-      thought_text = ''
-      text = ''
+      thought_text = TextAccumulator()
+      text = TextAccumulator()
       usage_metadata = None
       # for sse, similar as bidi (see receive method in gemini_llm_connecton.py),
       # we need to mark those text content as partial and after all partial
@@ -118,7 +124,13 @@ class Gemini(BaseLlm):
       # previous partial content. The only difference is bidi rely on
       # complete_turn flag to detect end while sse depends on finish_reason.
       async for response in responses:
-        logger.info(_build_response_log(response))
+        logger.info(
+            '%s',
+            LazyPayload(
+                logger,
+                functools.partial(_build_response_log, response),
+            ),
+        )
         llm_response = LlmResponse.create(response)
         usage_metadata = llm_response.usage_metadata
         if (
@@ -128,9 +140,9 @@ class Gemini(BaseLlm):
         ):
           part0 = llm_response.content.parts[0]
           if part0.thought:
-            thought_text += part0.text
+            thought_text.append(part0.text)
           else:
-            text += part0.text
+            text.append(part0.text)
           llm_response.partial = True
         elif (thought_text or text) and (
             not llm_response.content
@@ -138,17 +150,12 @@ class Gemini(BaseLlm):
             # don't yield the merged text event when receiving audio data
             or not llm_response.content.parts[0].inline_data
         ):
-          parts = []
-          if thought_text:
-            parts.append(types.Part(text=thought_text, thought=True))
-          if text:
-            parts.append(types.Part.from_text(text=text))
           yield LlmResponse(
-              content=types.ModelContent(parts=parts),
+              content=types.ModelContent(
+                  parts=_build_aggregated_parts(thought_text, text)
+              ),
               usage_metadata=llm_response.usage_metadata,
           )
-          thought_text = ''
-          text = ''
         yield llm_response
       if (
           (text or thought_text)
@@ -156,13 +163,10 @@ class Gemini(BaseLlm):
           and response.candidates
           and response.candidates[0].finish_reason == types.FinishReason.STOP
       ):
-        parts = []
-        if thought_text:
-          parts.append(types.Part(text=thought_text, thought=True))
-        if text:
-          parts.append(types.Part.from_text(text=text))
         yield LlmResponse(
-            content=types.ModelContent(parts=parts),
+            content=types.ModelContent(
+                parts=_build_aggregated_parts(thought_text, text)
+            ),
             usage_metadata=usage_metadata,
         )
 
@@ -172,9 +176,17 @@ class Gemini(BaseLlm):
           contents=llm_request.contents,
           config=llm_request.config,
       )
-      logger.info(_build_response_log(response))
+      logger.info(
+          '%s',
+          LazyPayload(logger, functools.partial(_build_response_log, response)),
+      )
       yield LlmResponse.create(response)
 
+  @override
+  async def warmup(self) -> None:
+    # Creating the client resolves the credentials and the API backend.
+    self._api_backend  # pylint: disable=pointless-statement
+
   @cached_property
   def api_client(self) -> Client:
     """Provides the api client.
@@ -365,3 +377,15 @@ def _remove_display_name_if_present(
   """
   if data_obj and data_obj.display_name:
     data_obj.display_name = None
+
+
+def _build_aggregated_parts(
+    thought_text: TextAccumulator, text: TextAccumulator
+) -> list[types.Part]:
+  """Builds the parts of the aggregated response and resets the accumulators."""
+  parts = []
+  if thought_text:
+    parts.append(types.Part(text=thought_text.pop(), thought=True))
+  if text:
+    parts.append(types.Part.from_text(text=text.pop()))
+  return parts
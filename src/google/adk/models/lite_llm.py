@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import base64
+import functools
 import json
 import logging
 from typing import Any
@@ -51,6 +52,9 @@ from pydantic import BaseModel
 from pydantic import Field
 from typing_extensions import override
 
+from ..utils.log_utils import LazyPayload
+from ._streaming_utils import JsonAccumulator
+from ._streaming_utils import TextAccumulator
 from .base_llm import BaseLlm
 from .llm_request import LlmRequest
 from .llm_response import LlmResponse
@@ -697,7 +701,10 @@ class LiteLlm(BaseLlm):
     """
 
     self._maybe_append_user_content(llm_request)
-    logger.debug(_build_request_log(llm_request))
+    logger.debug(
+        '%s',
+        LazyPayload(logger, functools.partial(_build_request_log, llm_request)),
+    )
 
     messages, tools, response_format, generation_params = (
         _get_completion_inputs(llm_request)
@@ -719,7 +726,7 @@ class LiteLlm(BaseLlm):
       completion_args.update(generation_params)
 
     if stream:
-      text = ""
+      text = TextAccumulator()
       # Track function calls by index
       function_calls = {}  # index -> {name, args, id}
       completion_args["stream"] = True
@@ -732,26 +739,27 @@ class LiteLlm(BaseLlm):
           if isinstance(chunk, FunctionChunk):
             index = chunk.index or fallback_index
             if index not in function_calls:
-              function_calls[index] = {"name": "", "args": "", "id": None}
+              function_calls[index] = {
+                  "name": "",
+                  "args": JsonAccumulator(),
+                  "id": None,
+              }
 
             if chunk.name:
               function_calls[index]["name"] += chunk.name
             if chunk.args:
-              function_calls[index]["args"] += chunk.args
+              function_calls[index]["args"].append(chunk.args)
 
               # check if args is completed (workaround for improper chunk
               # indexing)
-              try:
-                json.loads(function_calls[index]["args"])
+              if function_calls[index]["args"].is_complete():
                 fallback_index += 1
-              except json.JSONDecodeError:
-                pass
 
             function_calls[index]["id"] = (
                 chunk.id or function_calls[index]["id"] or str(index)
             )
           elif isinstance(chunk, TextChunk):
-            text += chunk.text
+            text.append(chunk.text)
             yield _message_to_generate_content_response(
                 ChatCompletionAssistantMessage(
                     role="assistant",
@@ -778,7 +786,7 @@ class LiteLlm(BaseLlm):
                         id=func_data["id"],
                         function=Function(
                             name=func_data["name"],
-                            arguments=func_data["args"],
+                            arguments=func_data["args"].text,
                             index=index,
                         ),
                     )
@@ -787,18 +795,18 @@ class LiteLlm(BaseLlm):
                 _message_to_generate_content_response(
                     ChatCompletionAssistantMessage(
                         role="assistant",
-                        content=text,
+                        content=text.pop(),
                         tool_calls=tool_calls,
                     )
                 )
             )
-            text = ""
             function_calls.clear()
           elif finish_reason == "stop" and text:
             aggregated_llm_response = _message_to_generate_content_response(
-                ChatCompletionAssistantMessage(role="assistant", content=text)
+                ChatCompletionAssistantMessage(
+                    role="assistant", content=text.pop()
+                )
             )
-            text = ""
 
       # waiting until streaming ends to yield the llm_response as litellm tends
       # to send chunk that contains usage_metadata after the chunk with
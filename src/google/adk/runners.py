@@ -17,6 +17,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import queue
+import threading
+import time
 from typing import AsyncGenerator
 from typing import Generator
 from typing import Optional
@@ -24,6 +26,7 @@ import warnings
 
 from google.genai import types
 
+from .agents._agent_tree_index import AgentTreeIndex
 from .agents.active_streaming_tool import ActiveStreamingTool
 from .agents.base_agent import BaseAgent
 from .agents.invocation_context import InvocationContext
@@ -102,6 +105,62 @@ class Runner:
     self.session_service = session_service
     self.memory_service = memory_service
     self.credential_service = credential_service
+    self._loop: Optional[asyncio.AbstractEventLoop] = None
+    self._loop_thread: Optional[threading.Thread] = None
+    self._loop_lock = threading.Lock()
+    self._agent_tree_index: Optional[AgentTreeIndex] = None
+
+  def _get_or_create_loop(self) -> asyncio.AbstractEventLoop:
+    """Returns the background event loop backing the sync `run` API.
+
+    The loop is created lazily on first use and lives until `close` is called,
+    so loop-bound resources (HTTP clients, MCP sessions, etc.) created while
+    running the agent can be reused across `run` calls.
+    """
+    with self._loop_lock:
+      if self._loop is None or self._loop.is_closed():
+        loop = asyncio.new_event_loop()
+
+        def _loop_thread_main():
+          asyncio.set_event_loop(loop)
+          try:
+            loop.run_forever()
+          finally:
+            loop.close()
+
+        self._loop_thread = create_thread(target=_loop_thread_main)
+        self._loop_thread.daemon = True
+        self._loop_thread.start()
+        self._loop = loop
+      return self._loop
+
+  async def _run_on_background_loop(self, coro):
+    """Awaits `coro` on the background loop, if one was started."""
+    loop = self._loop
+    if loop is None or loop.is_closed():
+      return await coro
+    try:
+      running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+      running_loop = None
+    if running_loop is loop:
+      return await coro
+    return await asyncio.wrap_future(
+        asyncio.run_coroutine_threadsafe(coro, loop)
+    )
+
+  def _shutdown_loop(self):
+    """Stops the background loop and waits for its thread to exit."""
+    with self._loop_lock:
+      loop, thread = self._loop, self._loop_thread
+      self._loop = None
+      self._loop_thread = None
+    if loop is None:
+      return
+    if not loop.is_closed():
+      loop.call_soon_threadsafe(loop.stop)
+    if thread is not None and thread is not threading.current_thread():
+      thread.join()
 
   def run(
       self,
@@ -116,6 +175,9 @@ class Runner:
     NOTE: This sync interface is only for local testing and convenience purpose.
     Consider using `run_async` for production usage.
 
+    All calls share one background event loop owned by this runner, so
+    loop-bound resources are reused across turns. Call `close` to shut it down.
+
     Args:
       user_id: The user ID of the session.
       session_id: The session ID of the session.
@@ -139,24 +201,22 @@ class Runner:
       finally:
         event_queue.put(None)
 
-    def _asyncio_thread_main():
-      try:
-        asyncio.run(_invoke_run_async())
-      finally:
-        event_queue.put(None)
-
-    thread = create_thread(target=_asyncio_thread_main)
-    thread.start()
-
-    # consumes and re-yield the events from background thread.
-    while True:
-      event = event_queue.get()
-      if event is None:
-        break
-      else:
-        yield event
-
-    thread.join()
+    future = asyncio.run_coroutine_threadsafe(
+        _invoke_run_async(), self._get_or_create_loop()
+    )
+    try:
+      # consumes and re-yield the events from the background loop.
+      while True:
+        event = event_queue.get()
+        if event is None:
+          break
+        else:
+          yield event
+      future.result()
+    finally:
+      # Stops the invocation if the caller stopped consuming early.
+      if not future.done():
+        future.cancel()
 
   async def run_async(
       self,
@@ -165,6 +225,7 @@ class Runner:
       session_id: str,
       new_message: types.Content,
       run_config: RunConfig = RunConfig(),
+      session: Optional[Session] = None,
   ) -> AsyncGenerator[Event, None]:
     """Main entry method to run the agent in this runner.
 
@@ -173,16 +234,25 @@ class Runner:
       session_id: The session ID of the session.
       new_message: A new message to append to the session.
       run_config: The run config for the agent.
+      session: The session identified by `user_id` and `session_id`, if the
+        caller has just fetched it from the session service. If provided, the
+        runner does not fetch the session again.
 
     Yields:
       The events generated by the agent.
     """
     with tracer.start_as_current_span('invocation'):
-      session = await self.session_service.get_session(
-          app_name=self.app_name, user_id=user_id, session_id=session_id
-      )
-      if not session:
-        raise ValueError(f'Session not found: {session_id}')
+      if session is None:
+        session = await self.session_service.get_session(
+            app_name=self.app_name, user_id=user_id, session_id=session_id
+        )
+        if not session:
+          raise ValueError(f'Session not found: {session_id}')
+      elif session.user_id != user_id or session.id != session_id:
+        raise ValueError(
+            f'Session {session.id} of user {session.user_id} does not match'
+            f' session {session_id} of user {user_id}.'
+        )
 
       invocation_context = self._new_invocation_context(
           session,
@@ -355,14 +425,15 @@ class Runner:
     # the agent that returned the corressponding function call regardless the
     # type of the agent. e.g. a remote a2a agent may surface a credential
     # request as a special long running function tool call.
+    agent_tree_index = self._get_agent_tree_index(root_agent)
     event = find_matching_function_call(session.events)
     if event and event.author:
-      return root_agent.find_agent(event.author)
+      return agent_tree_index.find_agent(event.author)
     for event in filter(lambda e: e.author != 'user', reversed(session.events)):
       if event.author == root_agent.name:
         # Found root agent.
         return root_agent
-      if not (agent := root_agent.find_sub_agent(event.author)):
+      if not (agent := agent_tree_index.find_agent(event.author)):
         # Agent not found, continue looking.
         logger.warning(
             'Event from an unknown agent: %s, event id: %s',
@@ -370,32 +441,19 @@ class Runner:
             event.id,
         )
         continue
-      if self._is_transferable_across_agent_tree(agent):
+      if agent_tree_index.is_transferable_across_agent_tree(agent):
         return agent
     # Falls back to root agent if no suitable agents are found in the session.
     return root_agent
 
-  def _is_transferable_across_agent_tree(self, agent_to_run: BaseAgent) -> bool:
-    """Whether the agent to run can transfer to any other agent in the agent tree.
-
-    This typically means all agent_to_run's parent through root agent can
-    transfer to their parent_agent.
-
-    Args:
-        agent_to_run: The agent to check for transferability.
-
-    Returns:
-        True if the agent can transfer, False otherwise.
-    """
-    agent = agent_to_run
-    while agent:
-      if not isinstance(agent, LlmAgent):
-        # Only LLM-based Agent can provider agent transfer capability.
-        return False
-      if agent.disallow_transfer_to_parent:
-        return False
-      agent = agent.parent_agent
-    return True
+  def _get_agent_tree_index(self, root_agent: BaseAgent) -> AgentTreeIndex:
+    """Returns the index of the agent tree, building it on first use."""
+    if (
+        self._agent_tree_index is None
+        or self._agent_tree_index.root_agent is not root_agent
+    ):
+      self._agent_tree_index = AgentTreeIndex(root_agent)
+    return self._agent_tree_index
 
   def _new_invocation_context(
       self,
@@ -474,6 +532,52 @@ class Runner:
         run_config=run_config,
     )
 
+  async def warmup(self) -> dict[str, float]:
+    """Prepares the agent tree, so that the first run is as fast as later ones.
+
+    Builds the index of the agent tree and, for each LLM agent in it, creates
+    the client of its model, resolves its tools, which opens the connections
+    of its toolsets, and builds their function declarations. Errors in the
+    agent tree, e.g. an unknown model or an unsupported tool signature, are
+    raised here instead of in the first run.
+
+    The model clients and the toolset connections are bound to the event loop,
+    so this should be called from the event loop that runs the agent.
+
+    Returns:
+        The warm-up time in seconds of each component, by component name.
+    """
+    timings = {}
+    start_time = time.perf_counter()
+    self._get_agent_tree_index(self.agent)
+    timings['agent_tree'] = time.perf_counter() - start_time
+
+    agents_to_visit = [self.agent]
+    while agents_to_visit:
+      agent = agents_to_visit.pop()
+      agents_to_visit.extend(reversed(agent.sub_agents))
+      if not isinstance(agent, LlmAgent):
+        continue
+
+      start_time = time.perf_counter()
+      await agent.canonical_model.warmup()
+      timings[f'{agent.name}.model'] = time.perf_counter() - start_time
+
+      start_time = time.perf_counter()
+      for tool in await agent.canonical_tools():
+        tool._get_declaration()
+      timings[f'{agent.name}.tools'] = time.perf_counter() - start_time
+
+    logger.info(
+        'Warmed up app %s in %.3fs: %s',
+        self.app_name,
+        sum(timings.values()),
+        ', '.join(
+            f'{name} {seconds:.3f}s' for name, seconds in timings.items()
+        ),
+    )
+    return timings
+
   def _collect_toolset(self, agent: BaseAgent) -> set[BaseToolset]:
     toolsets = set()
     if isinstance(agent, LlmAgent):
@@ -502,8 +606,18 @@ class Runner:
         logger.error('Error closing toolset %s: %s', type(toolset).__name__, e)
 
   async def close(self):
-    """Closes the runner."""
-    await self._cleanup_toolsets(self._collect_toolset(self.agent))
+    """Closes the runner.
+
+    Toolsets are cleaned up on the background loop used by `run` when it
+    exists, since their connections are bound to that loop, and the loop is
+    then shut down.
+    """
+    try:
+      await self._run_on_background_loop(
+          self._cleanup_toolsets(self._collect_toolset(self.agent))
+      )
+    finally:
+      self._shutdown_loop()
 
 
 class InMemoryRunner(Runner):
@@ -11,31 +11,34 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import logging
 
+from typing import TYPE_CHECKING
+
+from ..utils._lazy_import import lazy_getattr
 from .base_session_service import BaseSessionService
 from .in_memory_session_service import InMemorySessionService
 from .session import Session
 from .state import State
-from .vertex_ai_session_service import VertexAiSessionService
-
-logger = logging.getLogger('google_adk.' + __name__)
 
+if TYPE_CHECKING:
+  from .database_session_service import DatabaseSessionService
+  from .vertex_ai_session_service import VertexAiSessionService
 
 __all__ = [
     'BaseSessionService',
+    'DatabaseSessionService',
     'InMemorySessionService',
     'Session',
     'State',
     'VertexAiSessionService',
 ]
 
-try:
-  from .database_session_service import DatabaseSessionService
-
-  __all__.append('DatabaseSessionService')
-except ImportError:
-  logger.debug(
-      'DatabaseSessionService require sqlalchemy>=2.0, please ensure it is'
-      ' installed correctly.'
-  )
+# Services that pull in sqlalchemy or the Vertex SDK are imported on first
+# access.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'DatabaseSessionService': '.database_session_service',
+        'VertexAiSessionService': '.vertex_ai_session_service',
+    },
+)
@@ -52,6 +52,7 @@ from tzlocal import get_localzone
 
 from . import _session_util
 from ..events.event import Event
+from ..utils.log_utils import LazyPayload
 from .base_session_service import BaseSessionService
 from .base_session_service import GetSessionConfig
 from .base_session_service import ListSessionsResponse
@@ -532,7 +533,11 @@ class DatabaseSessionService(BaseSessionService):
 
   @override
   async def append_event(self, session: Session, event: Event) -> Event:
-    logger.info(f"Append event: {event} to session {session.id}")
+    logger.info(
+        "Append event: %s to session %s",
+        LazyPayload(logger, event.__str__),
+        session.id,
+    )
 
     if event.partial:
       return event
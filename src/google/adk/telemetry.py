@@ -24,10 +24,15 @@
 from __future__ import annotations
 
 import json
+import random
 from typing import Any
+from typing import Optional
 
 from google.genai import types
 from opentelemetry import trace
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
 
 from .agents.invocation_context import InvocationContext
 from .events.event import Event
@@ -37,6 +42,68 @@ from .tools.base_tool import BaseTool
 
 tracer = trace.get_tracer('gcp.vertex.agent')
 
+_TRUNCATED_SUFFIX = '...<truncated>'
+
+
+class TelemetryConfig(BaseModel):
+  """Configures the attributes recorded on the spans of the agent runs.
+
+  Attributes are only built when the current span is recording, so spans
+  dropped by the sampler of the tracer provider cost nothing beyond the span
+  itself. This config controls the payloads, i.e. the serialized LLM requests
+  and responses, tool arguments and tool responses, recorded on spans that are
+  kept.
+  """
+
+  model_config = ConfigDict(extra='forbid')
+
+  capture_payloads: bool = True
+  """Whether to record payloads.
+
+  If False, only metadata such as the model, tool names, ids and token usage is
+  recorded.
+  """
+
+  payload_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+  """The fraction of spans that payloads are recorded on."""
+
+  max_payload_length: Optional[int] = Field(default=None, gt=0)
+  """The maximum length of a payload attribute, or None for no limit.
+
+  Longer payloads are truncated and are no longer valid JSON.
+  """
+
+
+_telemetry_config = TelemetryConfig()
+
+
+def get_telemetry_config() -> TelemetryConfig:
+  """Returns the telemetry config in use."""
+  return _telemetry_config
+
+
+def set_telemetry_config(config: TelemetryConfig) -> None:
+  """Sets the telemetry config used by the tracing functions in this module."""
+  global _telemetry_config
+  _telemetry_config = config
+
+
+def _should_capture_payloads() -> bool:
+  config = _telemetry_config
+  if not config.capture_payloads:
+    return False
+  return (
+      config.payload_sample_rate >= 1.0
+      or random.random() < config.payload_sample_rate
+  )
+
+
+def _cap_payload(payload: str) -> str:
+  max_length = _telemetry_config.max_payload_length
+  if max_length is None or len(payload) <= max_length:
+    return payload
+  return payload[:max_length] + _TRUNCATED_SUFFIX
+
 
 def _safe_json_serialize(obj) -> str:
   """Convert any Python object to a JSON-serializable type or string.
@@ -70,6 +137,8 @@ def trace_tool_call(
     function_response_event: The event with the function response details.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
   span.set_attribute('gen_ai.operation.name', 'execute_tool')
   span.set_attribute('gen_ai.tool.name', tool.name)
@@ -85,17 +154,21 @@ def trace_tool_call(
       tool_response = function_response.response
 
   span.set_attribute('gen_ai.tool.call.id', tool_call_id)
+  span.set_attribute('gcp.vertex.agent.event_id', function_response_event.id)
 
-  if not isinstance(tool_response, dict):
-    tool_response = {'result': tool_response}
+  if _should_capture_payloads():
+    if not isinstance(tool_response, dict):
+      tool_response = {'result': tool_response}
+    tool_call_args_json = _safe_json_serialize(args)
+    tool_response_json = _safe_json_serialize(tool_response)
+  else:
+    tool_call_args_json = '{}'
+    tool_response_json = '{}'
   span.set_attribute(
-      'gcp.vertex.agent.tool_call_args',
-      _safe_json_serialize(args),
+      'gcp.vertex.agent.tool_call_args', _cap_payload(tool_call_args_json)
   )
-  span.set_attribute('gcp.vertex.agent.event_id', function_response_event.id)
   span.set_attribute(
-      'gcp.vertex.agent.tool_response',
-      _safe_json_serialize(tool_response),
+      'gcp.vertex.agent.tool_response', _cap_payload(tool_response_json)
   )
   # Setting empty llm request and response (as UI expect these) while not
   # applicable for tool_response.
@@ -121,6 +194,8 @@ def trace_merged_tool_calls(
   """
 
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
   span.set_attribute('gen_ai.operation.name', 'execute_tool')
   span.set_attribute('gen_ai.tool.name', '(merged tools)')
@@ -129,16 +204,19 @@ def trace_merged_tool_calls(
 
   span.set_attribute('gcp.vertex.agent.tool_call_args', 'N/A')
   span.set_attribute('gcp.vertex.agent.event_id', response_event_id)
-  try:
-    function_response_event_json = function_response_event.model_dumps_json(
-        exclude_none=True
-    )
-  except Exception:  # pylint: disable=broad-exception-caught
-    function_response_event_json = '<not serializable>'
+  if _should_capture_payloads():
+    try:
+      function_response_event_json = function_response_event.model_dumps_json(
+          exclude_none=True
+      )
+    except Exception:  # pylint: disable=broad-exception-caught
+      function_response_event_json = '<not serializable>'
+  else:
+    function_response_event_json = '{}'
 
   span.set_attribute(
       'gcp.vertex.agent.tool_response',
-      function_response_event_json,
+      _cap_payload(function_response_event_json),
   )
   # Setting empty llm request and response (as UI expect these) while not
   # applicable for tool_response.
@@ -167,6 +245,8 @@ def trace_call_llm(
     llm_response: The LLM response object.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   # Special standard Open Telemetry GenaI attributes that indicate
   # that this is a span related to a Generative AI system.
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
@@ -178,21 +258,28 @@ def trace_call_llm(
       'gcp.vertex.agent.session_id', invocation_context.session.id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
+
+  if _should_capture_payloads():
+    llm_request_json = _safe_json_serialize(
+        _build_llm_request_for_trace(llm_request)
+    )
+    try:
+      llm_response_json = llm_response.model_dump_json(exclude_none=True)
+    except Exception:  # pylint: disable=broad-exception-caught
+      llm_response_json = '<not serializable>'
+  else:
+    llm_request_json = '{}'
+    llm_response_json = '{}'
+
   # Consider removing once GenAI SDK provides a way to record this info.
   span.set_attribute(
       'gcp.vertex.agent.llm_request',
-      _safe_json_serialize(_build_llm_request_for_trace(llm_request)),
+      _cap_payload(llm_request_json),
   )
   # Consider removing once GenAI SDK provides a way to record this info.
-
-  try:
-    llm_response_json = llm_response.model_dump_json(exclude_none=True)
-  except Exception:  # pylint: disable=broad-exception-caught
-    llm_response_json = '<not serializable>'
-
   span.set_attribute(
       'gcp.vertex.agent.llm_response',
-      llm_response_json,
+      _cap_payload(llm_response_json),
   )
 
   if llm_response.usage_metadata is not None:
@@ -222,20 +309,27 @@ def trace_send_data(
     data: A list of content objects.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   span.set_attribute(
       'gcp.vertex.agent.invocation_id', invocation_context.invocation_id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
+  if not _should_capture_payloads():
+    span.set_attribute('gcp.vertex.agent.data', '[]')
+    return
   # Once instrumentation is added to the GenAI SDK, consider whether this
   # information still needs to be recorded by the Agent Development Kit.
   span.set_attribute(
       'gcp.vertex.agent.data',
-      _safe_json_serialize([
-          types.Content(role=content.role, parts=content.parts).model_dump(
-              exclude_none=True
-          )
-          for content in data
-      ]),
+      _cap_payload(
+          _safe_json_serialize([
+              types.Content(role=content.role, parts=content.parts).model_dump(
+                  exclude_none=True
+              )
+              for content in data
+          ])
+      ),
   )
 
 
@@ -13,10 +13,11 @@
 # limitations under the License.
 
 
+from typing import TYPE_CHECKING
+
 from ..auth.auth_tool import AuthToolArguments
-from .apihub_tool.apihub_toolset import APIHubToolset
+from ..utils._lazy_import import lazy_getattr
 from .base_tool import BaseTool
-from .example_tool import ExampleTool
 from .exit_loop_tool import exit_loop
 from .function_tool import FunctionTool
 from .get_user_choice_tool import get_user_choice_tool as get_user_choice
@@ -30,6 +31,10 @@ from .transfer_to_agent_tool import transfer_to_agent
 from .url_context_tool import url_context
 from .vertex_ai_search_tool import VertexAiSearchTool
 
+if TYPE_CHECKING:
+  from .apihub_tool.apihub_toolset import APIHubToolset
+  from .example_tool import ExampleTool
+
 __all__ = [
     'APIHubToolset',
     'AuthToolArguments',
@@ -48,3 +53,12 @@ __all__ = [
     'ToolContext',
     'transfer_to_agent',
 ]
+
+# Tools that pull in heavy dependencies are imported on first access.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'APIHubToolset': '.apihub_tool.apihub_toolset',
+        'ExampleTool': '.example_tool',
+    },
+)
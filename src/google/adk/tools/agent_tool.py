@@ -15,16 +15,24 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import AsyncGenerator
 from typing import TYPE_CHECKING
+import uuid
 
 from google.genai import types
 from pydantic import model_validator
 from typing_extensions import override
 
 from . import _automatic_function_calling_util
+from ..agents.invocation_context import InvocationContext
+from ..agents.invocation_context import new_invocation_context_id
+from ..agents.run_config import RunConfig
+from ..events.event import Event
 from ..memory.in_memory_memory_service import InMemoryMemoryService
 from ..runners import Runner
 from ..sessions.in_memory_session_service import InMemorySessionService
+from ..sessions.session import Session
+from ..sessions.state import State
 from ._forwarding_artifact_service import ForwardingArtifactService
 from .base_tool import BaseTool
 from .tool_context import ToolContext
@@ -44,11 +52,23 @@ class AgentTool(BaseTool):
   Attributes:
     agent: The agent to wrap.
     skip_summarization: Whether to skip summarization of the agent output.
+    lightweight: Whether to run the agent directly in the invocation of the
+      calling agent. If True, the agent reuses the services of the caller and
+      reads the caller's session state by reference through an overlay,
+      instead of running in a new runner with its own in-memory services and a
+      copy of the state.
   """
 
-  def __init__(self, agent: BaseAgent, skip_summarization: bool = False):
+  def __init__(
+      self,
+      agent: BaseAgent,
+      skip_summarization: bool = False,
+      *,
+      lightweight: bool = False,
+  ):
     self.agent = agent
     self.skip_summarization: bool = skip_summarization
+    self.lightweight: bool = lightweight
 
     super().__init__(name=agent.name, description=agent.description)
 
@@ -110,23 +130,13 @@ class AgentTool(BaseTool):
           role='user',
           parts=[types.Part.from_text(text=args['request'])],
       )
-    runner = Runner(
-        app_name=self.agent.name,
-        agent=self.agent,
-        artifact_service=ForwardingArtifactService(tool_context),
-        session_service=InMemorySessionService(),
-        memory_service=InMemoryMemoryService(),
-    )
-    session = await runner.session_service.create_session(
-        app_name=self.agent.name,
-        user_id='tmp_user',
-        state=tool_context.state.to_dict(),
-    )
+    if self.lightweight:
+      events = self._run_in_process(content, tool_context)
+    else:
+      events = self._run_with_runner(content, tool_context)
 
     last_event = None
-    async for event in runner.run_async(
-        user_id=session.user_id, session_id=session.id, new_message=content
-    ):
+    async for event in events:
       # Forward state delta to parent session.
       if event.actions.state_delta:
         tool_context.state.update(event.actions.state_delta)
@@ -142,3 +152,71 @@ class AgentTool(BaseTool):
     else:
       tool_result = merged_text
     return tool_result
+
+  async def _run_with_runner(
+      self, content: types.Content, tool_context: ToolContext
+  ) -> AsyncGenerator[Event, None]:
+    """Runs the agent in a new runner with its own in-memory services."""
+    runner = Runner(
+        app_name=self.agent.name,
+        agent=self.agent,
+        artifact_service=ForwardingArtifactService(tool_context),
+        session_service=InMemorySessionService(),
+        memory_service=InMemoryMemoryService(),
+    )
+    session = await runner.session_service.create_session(
+        app_name=self.agent.name,
+        user_id='tmp_user',
+        state=tool_context.state.to_dict(),
+    )
+    async for event in runner.run_async(
+        user_id=session.user_id, session_id=session.id, new_message=content
+    ):
+      yield event
+
+  async def _run_in_process(
+      self, content: types.Content, tool_context: ToolContext
+  ) -> AsyncGenerator[Event, None]:
+    """Runs the agent in a child session using the services of the caller."""
+    parent_context = tool_context._invocation_context
+    parent_session = parent_context.session
+    # The child session is not stored in any session service. It starts from
+    # a snapshot of the parent state, the same as the session of a runner, and
+    # the writes of the agent reach the parent through the forwarded state
+    # deltas.
+    session = Session(
+        id=str(uuid.uuid4()),
+        app_name=parent_session.app_name,
+        user_id=parent_session.user_id,
+        state=tool_context.state.to_dict(),
+    )
+    invocation_context = InvocationContext(
+        artifact_service=ForwardingArtifactService(tool_context),
+        session_service=parent_context.session_service,
+        memory_service=parent_context.memory_service,
+        credential_service=parent_context.credential_service,
+        invocation_id=new_invocation_context_id(),
+        agent=self.agent,
+        session=session,
+        user_content=content,
+        run_config=RunConfig(),
+    )
+    session.events.append(
+        Event(
+            invocation_id=invocation_context.invocation_id,
+            author='user',
+            content=content,
+        )
+    )
+    async for event in self.agent.run_async(invocation_context):
+      if not event.partial:
+        _append_event(session, event)
+      yield event
+
+
+def _append_event(session: Session, event: Event) -> None:
+  """Appends the event to a session that is not stored in a session service."""
+  for key, value in event.actions.state_delta.items():
+    if not key.startswith(State.TEMP_PREFIX):
+      session.state[key] = value
+  session.events.append(event)
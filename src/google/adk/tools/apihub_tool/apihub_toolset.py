@@ -65,6 +65,7 @@ class APIHubToolset(BaseToolset):
       apihub_resource_name: str,
       access_token: Optional[str] = None,
       service_account_json: Optional[str] = None,
+      spec_cache_dir: Optional[str] = None,
       # Parameters for the toolset itself
       name: str = '',
       description: str = '',
@@ -119,6 +120,8 @@ class APIHubToolset(BaseToolset):
         service_account_json: The service account config as a json string.
           Required if not using default service credential. It is used for
           creating the API Hub client and fetching the API Specs from API Hub.
+        spec_cache_dir: The directory to cache the API Specs in, to skip
+          fetching an unchanged spec again. If None, specs are not cached.
         apihub_client: Optional custom API Hub client.
         name: Name of the toolset. Optional.
         description: Description of the toolset. Optional.
@@ -140,6 +143,7 @@ class APIHubToolset(BaseToolset):
     self._apihub_client = apihub_client or APIHubClient(
         access_token=access_token,
         service_account_json=service_account_json,
+        spec_cache_dir=spec_cache_dir,
     )
 
     self._openapi_toolset = None
@@ -159,7 +163,10 @@ class APIHubToolset(BaseToolset):
         A list of all available RestApiTool objects.
     """
     if not self._openapi_toolset:
-      self._prepare_toolset()
+      spec_str = await self._apihub_client.get_spec_content_async(
+          self._apihub_resource_name
+      )
+      self._prepare_toolset_from_spec(spec_str)
     if not self._openapi_toolset:
       return []
     return await self._openapi_toolset.get_tools(readonly_context)
@@ -168,6 +175,10 @@ class APIHubToolset(BaseToolset):
     """Fetches the spec from API Hub and generates the toolset."""
     # For each API, get the first version and the first spec of that version.
     spec_str = self._apihub_client.get_spec_content(self._apihub_resource_name)
+    self._prepare_toolset_from_spec(spec_str)
+
+  def _prepare_toolset_from_spec(self, spec_str: str) -> None:
+    """Generates the toolset from the spec content."""
     spec_dict = yaml.safe_load(spec_str)
     if not spec_dict:
       return
@@ -14,8 +14,11 @@
 
 from abc import ABC
 from abc import abstractmethod
+import asyncio
 import base64
 import json
+import logging
+import threading
 from typing import Any
 from typing import Dict
 from typing import List
@@ -29,6 +32,23 @@ from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 import requests
 
+from ....utils._file_utils import DiskCache
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# Credentials shared by all the clients using the same service account, or the
+# default credential for None, so that they share one access token.
+_credentials_by_service_account: Dict[Optional[str], Any] = {}
+_credentials_lock = threading.Lock()
+
+# The maximum number of specs kept in a spec cache directory. The least
+# recently used ones are evicted beyond it.
+_MAX_SPEC_CACHE_ENTRIES = 256
+
+# The suffix of the spec cache files, which sets them apart from other files in
+# the cache directory.
+_SPEC_CACHE_FILE_SUFFIX = ".spec"
+
 
 class BaseAPIHubClient(ABC):
   """Base class for API Hub clients."""
@@ -38,6 +58,10 @@ class BaseAPIHubClient(ABC):
     """From a given resource name, get the soec in the API Hub."""
     raise NotImplementedError()
 
+  async def get_spec_content_async(self, resource_name: str) -> str:
+    """Gets the spec in the API Hub without blocking the event loop."""
+    return await asyncio.to_thread(self.get_spec_content, resource_name)
+
 
 class APIHubClient(BaseAPIHubClient):
   """Client for interacting with the API Hub service."""
@@ -47,6 +71,7 @@ class APIHubClient(BaseAPIHubClient):
       *,
       access_token: Optional[str] = None,
       service_account_json: Optional[str] = None,
+      spec_cache_dir: Optional[str] = None,
   ):
     """Initializes the APIHubClient.
 
@@ -58,9 +83,15 @@ class APIHubClient(BaseAPIHubClient):
           print-access-token`. Useful for local testing.
         service_account_json: The service account configuration as a dictionary.
           Required if not using default service credential.
+        spec_cache_dir: The directory to cache the spec contents in. A cached
+          spec is reused until the spec is updated in API Hub. If None, specs
+          are not cached.
     """
     self.root_url = "https://apihub.googleapis.com/v1"
+    self.spec_cache_dir = spec_cache_dir
     self.credential_cache = None
+    # Reuses connections to API Hub across requests.
+    self._session = requests.Session()
     self.access_token, self.service_account = None, None
 
     if access_token:
@@ -110,8 +141,9 @@ class APIHubClient(BaseAPIHubClient):
       api_spec_resource_name = spec_resource_names[0]
 
     if api_spec_resource_name:
-      spec_content = self._fetch_spec(api_spec_resource_name)
-      return spec_content
+      if self.spec_cache_dir:
+        return self._fetch_spec_with_cache(api_spec_resource_name)
+      return self._fetch_spec(api_spec_resource_name)
 
     raise ValueError("No API Hub resource found in path: {path}")
 
@@ -130,7 +162,7 @@ class APIHubClient(BaseAPIHubClient):
         "accept": "application/json, text/plain, */*",
         "Authorization": f"Bearer {self._get_access_token()}",
     }
-    response = requests.get(url, headers=headers)
+    response = self._session.get(url, headers=headers)
     response.raise_for_status()
     apis = response.json().get("apis", [])
     return apis
@@ -150,7 +182,7 @@ class APIHubClient(BaseAPIHubClient):
         "accept": "application/json, text/plain, */*",
         "Authorization": f"Bearer {self._get_access_token()}",
     }
-    response = requests.get(url, headers=headers)
+    response = self._session.get(url, headers=headers)
     response.raise_for_status()
     apis = response.json()
     return apis
@@ -170,7 +202,7 @@ class APIHubClient(BaseAPIHubClient):
         "accept": "application/json, text/plain, */*",
         "Authorization": f"Bearer {self._get_access_token()}",
     }
-    response = requests.get(url, headers=headers)
+    response = self._session.get(url, headers=headers)
     response.raise_for_status()
     return response.json()
 
@@ -189,7 +221,7 @@ class APIHubClient(BaseAPIHubClient):
         "accept": "application/json, text/plain, */*",
         "Authorization": f"Bearer {self._get_access_token()}",
     }
-    response = requests.get(url, headers=headers)
+    response = self._session.get(url, headers=headers)
     response.raise_for_status()
     content_base64 = response.json().get("contents", "")
     if content_base64:
@@ -198,6 +230,41 @@ class APIHubClient(BaseAPIHubClient):
     else:
       return ""
 
+  def _fetch_spec_with_cache(self, api_spec_resource_name: str) -> str:
+    """Retrieves the content of a spec from the cache or from API Hub.
+
+    The cache key includes the update time of the spec, so an updated spec is
+    fetched again.
+
+    Args:
+        api_spec_resource_name: The resource name of the API spec.
+
+    Returns:
+        The decoded content of the specification as a string.
+    """
+    url = f"{self.root_url}/{api_spec_resource_name}"
+    headers = {
+        "accept": "application/json, text/plain, */*",
+        "Authorization": f"Bearer {self._get_access_token()}",
+    }
+    response = self._session.get(url, headers=headers)
+    response.raise_for_status()
+    update_time = response.json().get("updateTime", "")
+
+    spec_cache = DiskCache(
+        self.spec_cache_dir,
+        suffix=_SPEC_CACHE_FILE_SUFFIX,
+        max_entries=_MAX_SPEC_CACHE_ENTRIES,
+    )
+    key = json.dumps([api_spec_resource_name, update_time])
+    spec_content = spec_cache.get(key)
+    if spec_content is not None:
+      return spec_content
+
+    spec_content = self._fetch_spec(api_spec_resource_name)
+    spec_cache.put(key, spec_content)
+    return spec_content
+
   def _extract_resource_name(self, url_or_path: str) -> Tuple[str, str, str]:
     """Extracts the resource names of an API, API Version, and API Spec from a given URL or path.
 
@@ -314,6 +381,17 @@ class APIHubClient(BaseAPIHubClient):
     if self.credential_cache and not self.credential_cache.expired:
       return self.credential_cache.token
 
+    with _credentials_lock:
+      credentials = _credentials_by_service_account.get(self.service_account)
+      if credentials is None or credentials.expired:
+        credentials = self._create_credentials()
+        credentials.refresh(Request())
+        _credentials_by_service_account[self.service_account] = credentials
+    self.credential_cache = credentials
+    return credentials.token
+
+  def _create_credentials(self) -> Any:
+    """Creates the credentials for the service account or the default ones."""
     if self.service_account:
       try:
         credentials = service_account.Credentials.from_service_account_info(
@@ -333,7 +411,4 @@ class APIHubClient(BaseAPIHubClient):
           "Please provide a service account or an access token to API Hub"
           " client."
       )
-
-    credentials.refresh(Request())
-    self.credential_cache = credentials
-    return credentials.token
+    return credentials
@@ -100,6 +100,7 @@ class ApplicationIntegrationToolset(BaseToolset):
       auth_scheme: Optional[AuthScheme] = None,
       auth_credential: Optional[AuthCredential] = None,
       tool_filter: Optional[Union[ToolPredicate, List[str]]] = None,
+      schema_cache_dir: Optional[str] = None,
   ):
     """Args:
 
@@ -119,6 +120,9 @@ class ApplicationIntegrationToolset(BaseToolset):
         tool_filter: The filter used to filter the tools in the toolset. It can
           be either a tool predicate or a list of tool names of the tools to
           expose.
+        schema_cache_dir: The directory to cache the entity and action schemas
+          of the connection in, to skip fetching them again when the toolset is
+          built for an unchanged connection. If None, schemas are not cached.
 
     Raises:
         ValueError: If none of the following conditions are met:
@@ -151,6 +155,7 @@ class ApplicationIntegrationToolset(BaseToolset):
         entity_operations,
         actions,
         service_account_json,
+        schema_cache_dir=schema_cache_dir,
     )
     connection_details = {}
     if integration:
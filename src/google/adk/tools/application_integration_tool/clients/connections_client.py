@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import json
+import threading
 import time
 from typing import Any
 from typing import Dict
@@ -26,6 +27,9 @@ from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 import requests
 
+_POLL_INITIAL_DELAY_SECONDS = 0.5
+_POLL_MAX_DELAY_SECONDS = 8
+
 
 class ConnectionsClient:
   """Utility class for interacting with Google Cloud Connectors API."""
@@ -53,6 +57,7 @@ class ConnectionsClient:
     self.connector_url = "https://connectors.googleapis.com"
     self.service_account_json = service_account_json
     self.credential_cache = None
+    self._credential_lock = threading.Lock()
 
   def get_connection_details(self) -> Dict[str, Any]:
     """Retrieves service details (service name and host) for a given connection.
@@ -85,6 +90,24 @@ class ConnectionsClient:
         "authOverrideEnabled": auth_override_enabled,
     }
 
+  def get_connection_revision(self) -> str:
+    """Retrieves an identifier that changes whenever the connection changes.
+
+    Returns:
+        The connector version and the update time of the connection.
+
+    Raises:
+        PermissionError: If there are credential issues.
+        ValueError: If there's a request error.
+        Exception: For any other unexpected errors.
+    """
+    url = f"{self.connector_url}/v1/projects/{self.project}/locations/{self.location}/connections/{self.connection}?view=BASIC"
+
+    connection_data = self._execute_api_call(url).json()
+    connector_version = connection_data.get("connectorVersion", "")
+    update_time = connection_data.get("updateTime", "")
+    return f"{connector_version}@{update_time}"
+
   def get_entity_schema_and_operations(
       self, entity: str
   ) -> Tuple[Dict[str, Any], List[str]]:
@@ -800,6 +823,11 @@ class ConnectionsClient:
     Returns:
         The access token.
     """
+    # Schemas are fetched from several threads, which share the token.
+    with self._credential_lock:
+      return self._get_access_token_locked()
+
+  def _get_access_token_locked(self) -> str:
     if self.credential_cache and not self.credential_cache.expired:
       return self.credential_cache.token
 
@@ -882,12 +910,12 @@ class ConnectionsClient:
         ValueError: If there's a request error.
         Exception: For any other unexpected errors.
     """
-    operation_done: bool = False
-    operation_response: Dict[str, Any] = {}
-    while not operation_done:
-      get_operation_url = f"{self.connector_url}/v1/{operation_id}"
+    get_operation_url = f"{self.connector_url}/v1/{operation_id}"
+    delay = _POLL_INITIAL_DELAY_SECONDS
+    while True:
       response = self._execute_api_call(get_operation_url)
-      operation_response = response.json()
-      operation_done = operation_response.get("done", False)
-      time.sleep(1)
-    return operation_response
+      operation_response: Dict[str, Any] = response.json()
+      if operation_response.get("done", False):
+        return operation_response
+      time.sleep(delay)
+      delay = min(delay * 2, _POLL_MAX_DELAY_SECONDS)
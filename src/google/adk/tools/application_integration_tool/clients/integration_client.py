@@ -12,11 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 import json
+import logging
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from google.adk.tools.application_integration_tool.clients.connections_client import ConnectionsClient
+from google.adk.utils._file_utils import DiskCache
 import google.auth
 from google.auth import default as default_service_credential
 import google.auth.transport.requests
@@ -24,6 +30,19 @@ from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 import requests
 
+logger = logging.getLogger("google_adk." + __name__)
+
+# The maximum number of entity and action schemas fetched concurrently.
+_MAX_SCHEMA_FETCH_WORKERS = 8
+
+# The maximum number of schemas kept in a schema cache directory. The least
+# recently used ones are evicted beyond it.
+_MAX_SCHEMA_CACHE_ENTRIES = 1024
+
+# The suffix of the schema cache files, which sets them apart from other files
+# in the cache directory.
+_SCHEMA_CACHE_FILE_SUFFIX = ".schema.json"
+
 
 class IntegrationClient:
   """A client for interacting with Google Cloud Application Integration.
@@ -42,6 +61,7 @@ class IntegrationClient:
       entity_operations: Optional[dict[str, list[str]]] = None,
       actions: Optional[list[str]] = None,
       service_account_json: Optional[str] = None,
+      schema_cache_dir: Optional[str] = None,
   ):
     """Initializes the ApplicationIntegrationClient.
 
@@ -57,6 +77,9 @@ class IntegrationClient:
         service_account_json: The service account configuration as a dictionary.
           Required if not using default service credential. Used for fetching
           connection details.
+        schema_cache_dir: The directory to cache the entity and action schemas
+          of the connection in. Cached schemas are reused until the connection
+          or its connector version changes. If None, schemas are not cached.
     """
     self.project = project
     self.location = location
@@ -68,6 +91,7 @@ class IntegrationClient:
     )
     self.actions = actions if actions is not None else []
     self.service_account_json = service_account_json
+    self.schema_cache_dir = schema_cache_dir
     self.credential_cache = None
 
   def get_openapi_spec_for_integration(self):
@@ -141,10 +165,11 @@ class IntegrationClient:
           " one of them."
       )
     connector_spec = connections_client.get_connector_base_spec()
+    entity_schemas, action_schemas = self._get_connection_schemas(
+        connections_client
+    )
     for entity, operations in self.entity_operations.items():
-      schema, supported_operations = (
-          connections_client.get_entity_schema_and_operations(entity)
-      )
+      schema, supported_operations = entity_schemas[entity]
       if not operations:
         operations = supported_operations
       json_schema_as_string = json.dumps(schema)
@@ -195,7 +220,7 @@ class IntegrationClient:
               f"Invalid operation: {operation} for entity: {entity}"
           )
     for action in self.actions:
-      action_details = connections_client.get_action_schema(action)
+      action_details = action_schemas[action]
       input_schema = action_details["inputSchema"]
       output_schema = action_details["outputSchema"]
       # Remove spaces from the display name to generate valid spec
@@ -225,6 +250,71 @@ class IntegrationClient:
       )
     return connector_spec
 
+  def _get_connection_schemas(
+      self, connections_client: ConnectionsClient
+  ) -> Tuple[
+      Dict[str, Tuple[Dict[str, Any], List[str]]], Dict[str, Dict[str, Any]]
+  ]:
+    """Fetches the schemas of the entities and actions concurrently.
+
+    Each schema is a long running operation on the connection, so fetching
+    them one after another dominates the time to build the spec.
+
+    Returns:
+        A tuple of the schemas and operations by entity, and the schemas by
+        action.
+    """
+    schema_cache = None
+    if self.schema_cache_dir:
+      schema_cache = _SchemaCache(
+          self.schema_cache_dir,
+          self.project,
+          self.location,
+          self.connection,
+          connections_client.get_connection_revision(),
+      )
+
+    def get_entity_schema(entity: str) -> Tuple[Dict[str, Any], List[str]]:
+      if schema_cache:
+        cached = schema_cache.get("entity", entity)
+        if cached is not None:
+          return cached["schema"], cached["operations"]
+      schema, operations = connections_client.get_entity_schema_and_operations(
+          entity
+      )
+      if schema_cache:
+        schema_cache.put(
+            "entity", entity, {"schema": schema, "operations": operations}
+        )
+      return schema, operations
+
+    def get_action_schema(action: str) -> Dict[str, Any]:
+      if schema_cache:
+        cached = schema_cache.get("action", action)
+        if cached is not None:
+          return cached
+      action_details = connections_client.get_action_schema(action)
+      if schema_cache:
+        schema_cache.put("action", action, action_details)
+      return action_details
+
+    num_schemas = len(self.entity_operations) + len(self.actions)
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(num_schemas, _MAX_SCHEMA_FETCH_WORKERS))
+    ) as executor:
+      entity_futures = {
+          entity: executor.submit(get_entity_schema, entity)
+          for entity in self.entity_operations
+      }
+      action_futures = {
+          action: executor.submit(get_action_schema, action)
+          for action in self.actions
+      }
+      return (
+          {entity: f.result() for entity, f in entity_futures.items()},
+          {action: f.result() for action, f in action_futures.items()},
+      )
+
   def _get_access_token(self) -> str:
     """Gets the access token for the service account or using default credentials.
 
@@ -254,3 +344,46 @@ class IntegrationClient:
     credentials.refresh(Request())
     self.credential_cache = credentials
     return credentials.token
+
+
+class _SchemaCache:
+  """On-disk cache of the schemas of one revision of a connection."""
+
+  def __init__(
+      self,
+      cache_dir: str,
+      project: str,
+      location: str,
+      connection: str,
+      revision: str,
+  ):
+    self._disk_cache = DiskCache(
+        cache_dir,
+        suffix=_SCHEMA_CACHE_FILE_SUFFIX,
+        max_entries=_MAX_SCHEMA_CACHE_ENTRIES,
+    )
+    self._key_prefix = [project, location, connection, revision]
+
+  def get(self, kind: str, name: str) -> Optional[Dict[str, Any]]:
+    value = self._disk_cache.get(self._get_key(kind, name))
+    if value is None:
+      return None
+    try:
+      return json.loads(value)
+    except ValueError as e:
+      logger.warning("Failed to read cached %s schema %s: %s", kind, name, e)
+      return None
+
+  def put(self, kind: str, name: str, value: Dict[str, Any]) -> None:
+    try:
+      content = json.dumps(value)
+    except (TypeError, ValueError) as e:
+      logger.warning("Failed to cache %s schema %s: %s", kind, name, e)
+      return
+    self._disk_cache.put(self._get_key(kind, name), content)
+
+  def _get_path(self, kind: str, name: str) -> str:
+    return self._disk_cache.get_path(self._get_key(kind, name))
+
+  def _get_key(self, kind: str, name: str) -> str:
+    return json.dumps(self._key_prefix + [kind, name])
@@ -55,8 +55,8 @@ class ExampleTool(BaseTool):
     if not parts or not parts[0].text:
       return
 
-    llm_request.append_instructions([
-        example_util.build_example_si(
-            self.examples, parts[0].text, llm_request.model
-        )
-    ])
+    example_si = example_util.build_example_si(
+        self.examples, parts[0].text, llm_request.model
+    )
+    if example_si:
+      llm_request.append_instructions([example_si])
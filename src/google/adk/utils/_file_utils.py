@@ -0,0 +1,128 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Atomic file writes and a bounded on-disk cache."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+from typing import Optional
+import uuid
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+def write_file_atomically(path: str, content: str) -> None:
+  """Writes the content to the file at the path atomically.
+
+  The content is written to a temporary file next to the path first and then
+  swapped in, so readers never see a partially written file. The temporary
+  file is removed if the write fails.
+
+  Args:
+    path: The path of the file to write.
+    content: The text to write.
+
+  Raises:
+    OSError: If the file couldn't be written.
+  """
+  tmp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+  try:
+    with open(tmp_path, 'x', encoding='utf-8') as f:
+      f.write(content)
+    os.replace(tmp_path, path)
+  except BaseException:
+    try:
+      os.remove(tmp_path)
+    except OSError:
+      pass
+    raise
+
+
+class DiskCache:
+  """A bounded cache of text values in the files of a directory.
+
+  Each value is stored in a file named after the sha256 digest of its key and
+  the suffix of the cache. The least recently used files are evicted beyond
+  the maximum entries. Only files named that way are ever evicted, so the
+  directory may hold other files too.
+
+  Failures to read or write the cache are logged and otherwise ignored.
+  """
+
+  def __init__(self, cache_dir: str, *, suffix: str, max_entries: int):
+    self._cache_dir = cache_dir
+    self._suffix = suffix
+    self._max_entries = max_entries
+    self._file_pattern = re.compile(r'[0-9a-f]{64}' + re.escape(suffix))
+
+  def get(self, key: str) -> Optional[str]:
+    """Returns the cached value of the key, or None if it isn't cached."""
+    path = self.get_path(key)
+    try:
+      with open(path, 'r', encoding='utf-8') as f:
+        value = f.read()
+    except FileNotFoundError:
+      return None
+    except (OSError, ValueError) as e:
+      logger.warning('Failed to read cache file %s: %s', path, e)
+      return None
+    try:
+      # Marks the entry as recently used, see `_evict`.
+      os.utime(path)
+    except OSError:
+      pass
+    return value
+
+  def put(self, key: str, value: str) -> None:
+    """Caches the value of the key."""
+    path = self.get_path(key)
+    try:
+      os.makedirs(self._cache_dir, exist_ok=True)
+      write_file_atomically(path, value)
+    except OSError as e:
+      logger.warning('Failed to write cache file %s: %s', path, e)
+      return
+    self._evict()
+
+  def get_path(self, key: str) -> str:
+    """Returns the path of the file caching the value of the key."""
+    file_name = hashlib.sha256(key.encode('utf-8')).hexdigest() + self._suffix
+    return os.path.join(self._cache_dir, file_name)
+
+  def _evict(self) -> None:
+    """Removes the least recently used entries beyond the maximum entries."""
+    try:
+      entries = [
+          (entry.stat().st_mtime_ns, entry.path)
+          for entry in os.scandir(self._cache_dir)
+          if self._file_pattern.fullmatch(entry.name)
+      ]
+    except OSError as e:
+      logger.warning(
+          'Failed to list cache directory %s: %s', self._cache_dir, e
+      )
+      return
+    if len(entries) <= self._max_entries:
+      return
+    entries.sort()
+    for _, path in entries[: len(entries) - self._max_entries]:
+      try:
+        os.remove(path)
+      except OSError:
+        # Another process may have evicted it already.
+        pass
@@ -0,0 +1,50 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy attributes of packages (PEP 562).
+
+This module is for ADK internal use only.
+Please do not rely on the implementation details.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any
+from typing import Callable
+
+
+def lazy_getattr(
+    package: str, lazy_imports: dict[str, str]
+) -> Callable[[str], Any]:
+  """Returns a module `__getattr__` that imports names on first access.
+
+  Each name is imported from its module the first time it is accessed and
+  then set on the package, so later accesses don't go through `__getattr__`.
+
+  Args:
+    package: The name of the package the attributes belong to.
+    lazy_imports: The module of each lazily imported name, relative to the
+      package.
+  """
+
+  def __getattr__(name: str) -> Any:
+    if name not in lazy_imports:
+      raise AttributeError(f'module {package!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(lazy_imports[name], package), name)
+    setattr(sys.modules[package], name, value)
+    return value
+
+  return __getattr__
@@ -0,0 +1,220 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Admission control for the agent runs of a server."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+from contextlib import asynccontextmanager
+import dataclasses
+import logging
+import time
+from typing import AsyncIterator
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from ..errors.too_many_requests_error import TooManyRequestsError
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+class AdmissionConfig(BaseModel):
+  """Limits of the agent runs that an AdmissionController admits."""
+
+  max_concurrent_runs_per_app: Optional[int] = Field(default=None, ge=1)
+  """The maximum number of concurrent runs of an app, or None for no limit."""
+
+  max_concurrent_runs_per_user: Optional[int] = Field(default=None, ge=1)
+  """The maximum number of concurrent runs of a user of an app, or None for no
+  limit."""
+
+  max_queue_size: int = Field(default=0, ge=0)
+  """The maximum number of runs of an app waiting for admission. Runs beyond
+  it are rejected right away."""
+
+  max_wait_seconds: Optional[float] = Field(default=None, gt=0)
+  """How long a run waits for admission before it is rejected, or None for no
+  limit."""
+
+
+class AdmissionMetrics(BaseModel):
+  """Admission metrics of an app."""
+
+  running: int = 0
+  """The number of admitted runs that have not finished."""
+
+  queue_depth: int = 0
+  """The number of runs waiting for admission."""
+
+  admitted: int = 0
+  """The total number of admitted runs."""
+
+  rejected: int = 0
+  """The total number of rejected runs."""
+
+  total_wait_seconds: float = 0.0
+  """The total time that admitted runs waited for admission."""
+
+  max_wait_seconds: float = 0.0
+  """The longest time that an admitted run waited for admission."""
+
+
+@dataclasses.dataclass
+class _Waiter:
+  user_id: str
+  future: asyncio.Future[None]
+
+
+@dataclasses.dataclass
+class _AppState:
+  metrics: AdmissionMetrics = dataclasses.field(
+      default_factory=AdmissionMetrics
+  )
+  running_by_user: collections.Counter[str] = dataclasses.field(
+      default_factory=collections.Counter
+  )
+  waiters: collections.deque[_Waiter] = dataclasses.field(
+      default_factory=collections.deque
+  )
+
+
+class AdmissionController:
+  """Limits the concurrent agent runs per app and per user of an app.
+
+  A run that exceeds a limit waits in a bounded per-app queue, and is
+  rejected with a TooManyRequestsError if the queue is full or the wait takes
+  too long. Queued runs are admitted in order, except that a run blocked by
+  the limit of its user does not hold back the runs of other users.
+
+  The controller must be used from a single event loop.
+  """
+
+  def __init__(self, config: Optional[AdmissionConfig] = None):
+    self.config = config or AdmissionConfig()
+    self._apps: dict[str, _AppState] = {}
+
+  @asynccontextmanager
+  async def admit(self, app_name: str, user_id: str) -> AsyncIterator[None]:
+    """Admits a run for the duration of the context.
+
+    Raises:
+      TooManyRequestsError: If the run is rejected.
+    """
+    await self.acquire(app_name, user_id)
+    try:
+      yield
+    finally:
+      self.release(app_name, user_id)
+
+  async def acquire(self, app_name: str, user_id: str) -> None:
+    """Waits until a run is admitted. Each call must be paired with release.
+
+    Raises:
+      TooManyRequestsError: If the run is rejected.
+    """
+    app = self._apps.setdefault(app_name, _AppState())
+    # Waiting runs are admitted as soon as they can be, so they cannot be
+    # overtaken by a run that has capacity now.
+    if self._has_capacity(app, user_id):
+      self._start(app, user_id, wait_seconds=0.0)
+      return
+
+    if len(app.waiters) >= self.config.max_queue_size:
+      self._reject(app, app_name, 'the queue is full')
+
+    waiter = _Waiter(
+        user_id=user_id, future=asyncio.get_running_loop().create_future()
+    )
+    app.waiters.append(waiter)
+    app.metrics.queue_depth = len(app.waiters)
+    start_time = time.monotonic()
+    try:
+      await asyncio.wait_for(
+          asyncio.shield(waiter.future), self.config.max_wait_seconds
+      )
+    except asyncio.TimeoutError:
+      if not waiter.future.done():
+        self._remove_waiter(app, waiter)
+        self._reject(app, app_name, 'the wait for admission timed out')
+    except BaseException:
+      if waiter.future.done():
+        # The run was admitted right when the caller gave up.
+        self.release(app_name, user_id)
+      else:
+        self._remove_waiter(app, waiter)
+      raise
+    self._record_wait(app, time.monotonic() - start_time)
+
+  def release(self, app_name: str, user_id: str) -> None:
+    """Releases an admitted run and admits waiting runs."""
+    app = self._apps[app_name]
+    app.metrics.running -= 1
+    app.running_by_user[user_id] -= 1
+    if not app.running_by_user[user_id]:
+      del app.running_by_user[user_id]
+    self._admit_waiters(app)
+
+  def get_metrics(self) -> dict[str, AdmissionMetrics]:
+    """Returns a snapshot of the admission metrics by app name."""
+    return {
+        app_name: app.metrics.model_copy()
+        for app_name, app in self._apps.items()
+    }
+
+  def _has_capacity(self, app: _AppState, user_id: str) -> bool:
+    max_per_app = self.config.max_concurrent_runs_per_app
+    max_per_user = self.config.max_concurrent_runs_per_user
+    return (max_per_app is None or app.metrics.running < max_per_app) and (
+        max_per_user is None or app.running_by_user[user_id] < max_per_user
+    )
+
+  def _start(self, app: _AppState, user_id: str, wait_seconds: float) -> None:
+    app.metrics.running += 1
+    app.metrics.admitted += 1
+    app.running_by_user[user_id] += 1
+    self._record_wait(app, wait_seconds)
+
+  def _record_wait(self, app: _AppState, wait_seconds: float) -> None:
+    app.metrics.total_wait_seconds += wait_seconds
+    app.metrics.max_wait_seconds = max(
+        app.metrics.max_wait_seconds, wait_seconds
+    )
+
+  def _admit_waiters(self, app: _AppState) -> None:
+    for waiter in list(app.waiters):
+      if self.config.max_concurrent_runs_per_app is not None and (
+          app.metrics.running >= self.config.max_concurrent_runs_per_app
+      ):
+        break
+      if waiter.future.done() or not self._has_capacity(app, waiter.user_id):
+        continue
+      self._remove_waiter(app, waiter)
+      # The wait time is recorded by the waiter once it resumes.
+      self._start(app, waiter.user_id, wait_seconds=0.0)
+      waiter.future.set_result(None)
+
+  def _remove_waiter(self, app: _AppState, waiter: _Waiter) -> None:
+    app.waiters.remove(waiter)
+    app.metrics.queue_depth = len(app.waiters)
+
+  def _reject(self, app: _AppState, app_name: str, reason: str) -> None:
+    app.metrics.rejected += 1
+    logger.warning('Rejected a run of app %s: %s.', app_name, reason)
+    raise TooManyRequestsError(
+        f'Too many concurrent runs of app {app_name}: {reason}.'
+    )
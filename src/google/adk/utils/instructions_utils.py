@@ -12,15 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
+import functools
 import re
+from typing import Any
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+from typing import Union
 
 from ..agents.readonly_context import ReadonlyContext
 from ..sessions.state import State
 
+if TYPE_CHECKING:
+  from ..agents.invocation_context import InvocationContext
+
 __all__ = [
     'inject_session_state',
 ]
 
+_PLACEHOLDER_PATTERN = re.compile(r'{+[^{}]*}+')
+
 
 async def inject_session_state(
     template: str,
@@ -62,48 +74,101 @@ async def inject_session_state(
 
   invocation_context = readonly_context._invocation_context
 
-  async def _async_sub(pattern, repl_async_fn, string) -> str:
-    result = []
-    last_end = 0
-    for match in re.finditer(pattern, string):
-      result.append(string[last_end : match.start()])
-      replacement = await repl_async_fn(match)
-      result.append(replacement)
-      last_end = match.end()
-    result.append(string[last_end:])
-    return ''.join(result)
-
-  async def _replace_match(match) -> str:
+  result = []
+  for segment in _compile_template(template):
+    if isinstance(segment, str):
+      result.append(segment)
+    elif segment.is_artifact:
+      result.append(
+          str(await _load_artifact(invocation_context, segment.name))
+      )
+    elif segment.name in invocation_context.session.state:
+      result.append(str(invocation_context.session.state[segment.name]))
+    elif not segment.optional:
+      raise KeyError(f'Context variable not found: `{segment.name}`.')
+  return ''.join(result)
+
+
+class _Placeholder(NamedTuple):
+  """A state or artifact reference in an instruction template."""
+
+  name: str
+  """The state key or the artifact file name."""
+  optional: bool
+  """Whether a missing state key renders as empty instead of raising."""
+  is_artifact: bool
+  """Whether the placeholder references an artifact."""
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(template: str) -> tuple[Union[str, _Placeholder], ...]:
+  """Splits the template into static text and placeholders.
+
+  Placeholders that are neither artifacts nor valid state names are kept as
+  static text.
+  """
+  segments: list[Union[str, _Placeholder]] = []
+  text = []
+  last_end = 0
+  for match in _PLACEHOLDER_PATTERN.finditer(template):
+    text.append(template[last_end : match.start()])
+    last_end = match.end()
+
     var_name = match.group().lstrip('{').rstrip('}').strip()
     optional = False
     if var_name.endswith('?'):
       optional = True
       var_name = var_name.removesuffix('?')
     if var_name.startswith('artifact.'):
-      var_name = var_name.removeprefix('artifact.')
-      if invocation_context.artifact_service is None:
-        raise ValueError('Artifact service is not initialized.')
-      artifact = await invocation_context.artifact_service.load_artifact(
-          app_name=invocation_context.session.app_name,
-          user_id=invocation_context.session.user_id,
-          session_id=invocation_context.session.id,
-          filename=var_name,
+      placeholder = _Placeholder(
+          var_name.removeprefix('artifact.'), optional, is_artifact=True
       )
-      if not var_name:
-        raise KeyError(f'Artifact {var_name} not found.')
-      return str(artifact)
+    elif _is_valid_state_name(var_name):
+      placeholder = _Placeholder(var_name, optional, is_artifact=False)
     else:
-      if not _is_valid_state_name(var_name):
-        return match.group()
-      if var_name in invocation_context.session.state:
-        return str(invocation_context.session.state[var_name])
-      else:
-        if optional:
-          return ''
-        else:
-          raise KeyError(f'Context variable not found: `{var_name}`.')
-
-  return await _async_sub(r'{+[^{}]*}+', _replace_match, template)
+      text.append(match.group())
+      continue
+
+    if text:
+      segments.append(''.join(text))
+      text = []
+    segments.append(placeholder)
+  text.append(template[last_end:])
+  segments.append(''.join(text))
+  return tuple(segments)
+
+
+async def _load_artifact(
+    invocation_context: InvocationContext, filename: str
+) -> Any:
+  """Loads the artifact, reusing an earlier load in the same invocation.
+
+  An earlier load is reused unless an event appended since then saved a new
+  version of the artifact.
+  """
+  if invocation_context.artifact_service is None:
+    raise ValueError('Artifact service is not initialized.')
+
+  events = invocation_context.session.events
+  loaded_artifacts = invocation_context._instruction_artifacts
+  if filename in loaded_artifacts:
+    artifact, num_events = loaded_artifacts[filename]
+    if num_events <= len(events) and not any(
+        filename in event.actions.artifact_delta
+        for event in events[num_events:]
+    ):
+      return artifact
+
+  artifact = await invocation_context.artifact_service.load_artifact(
+      app_name=invocation_context.session.app_name,
+      user_id=invocation_context.session.user_id,
+      session_id=invocation_context.session.id,
+      filename=filename,
+  )
+  if not filename:
+    raise KeyError(f'Artifact {filename} not found.')
+  loaded_artifacts[filename] = (artifact, len(events))
+  return artifact
 
 
 def _is_valid_state_name(var_name):
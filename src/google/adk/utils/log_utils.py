@@ -0,0 +1,62 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities for logging large payloads on hot paths.
+
+This module is for ADK internal use only.
+Please do not rely on the implementation details.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+from typing import Callable
+
+MAX_PAYLOAD_PREVIEW_LENGTH = 4000
+
+
+class LazyPayload:
+  """A log argument that builds its message only when the record is formatted.
+
+  Pass it as an argument of a logging call, e.g.
+  `logger.info('%s', LazyPayload(logger, lambda: build_log(response)))`.
+  Nothing is built if the level is disabled or no handler formats the record.
+  The message is cut to a preview of `MAX_PAYLOAD_PREVIEW_LENGTH` characters
+  unless the logger is enabled for DEBUG.
+  """
+
+  __slots__ = ('_logger', '_build_message')
+
+  def __init__(self, logger: logging.Logger, build_message: Callable[[], Any]):
+    self._logger = logger
+    self._build_message = build_message
+
+  def __str__(self) -> str:
+    message = str(self._build_message())
+    if self._logger.isEnabledFor(logging.DEBUG):
+      return message
+    return preview_payload(message)
+
+
+def preview_payload(
+    payload: str, max_length: int = MAX_PAYLOAD_PREVIEW_LENGTH
+) -> str:
+  """Cuts the payload to at most `max_length` characters for logging."""
+  if len(payload) <= max_length:
+    return payload
+  return (
+      f'{payload[:max_length]}... ({len(payload) - max_length} more'
+      ' characters)'
+  )
@@ -35,6 +35,8 @@ try:
   from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutorConfig
   from google.adk.events.event import Event
   from google.adk.runners import Runner
+  from google.adk.utils.admission_control import AdmissionConfig
+  from google.adk.utils.admission_control import AdmissionController
 except ImportError as e:
   if sys.version_info < (3, 10):
     # Create dummy classes to prevent NameError during test collection
@@ -667,6 +669,42 @@ class TestA2aAgentExecutor:
       assert failure_event.status.state == TaskState.failed
       assert failure_event.final == True
 
+  @pytest.mark.asyncio
+  async def test_execute_rejected_by_admission_controller(self):
+    """Test that a request rejected by admission control fails its task."""
+    admission_controller = AdmissionController(
+        AdmissionConfig(max_concurrent_runs_per_app=1)
+    )
+    await admission_controller.acquire("test-app", "other-user")
+    executor = A2aAgentExecutor(
+        runner=self.mock_runner, admission_controller=admission_controller
+    )
+
+    with patch(
+        "google.adk.a2a.executor.a2a_agent_executor.convert_a2a_request_to_adk_run_args"
+    ) as mock_convert:
+      mock_convert.return_value = {
+          "user_id": "test-user",
+          "session_id": "test-session",
+          "new_message": Mock(),
+          "run_config": Mock(),
+      }
+      mock_session = Mock()
+      mock_session.id = "test-session"
+      self.mock_runner.session_service.get_session = AsyncMock(
+          return_value=mock_session
+      )
+
+      await executor.execute(self.mock_context, self.mock_event_queue)
+
+    self.mock_runner.run_async.assert_not_called()
+    failure_event = self.mock_event_queue.enqueue_event.call_args_list[-1][0][0]
+    assert failure_event.status.state == TaskState.failed
+    assert "Too many concurrent runs" in (
+        failure_event.status.message.parts[0].root.text
+    )
+    assert admission_controller.get_metrics()["test-app"].running == 1
+
   @pytest.mark.asyncio
   async def test_handle_request_with_aggregator_message(self):
     """Test that the final task status event includes message from aggregator."""
@@ -0,0 +1,98 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.agents._agent_tree_index import AgentTreeIndex
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.sequential_agent import SequentialAgent
+import pytest
+
+
+def _create_tree():
+  leaf = LlmAgent(name='leaf')
+  no_transfer = LlmAgent(name='no_transfer', disallow_transfer_to_parent=True)
+  below_no_transfer = LlmAgent(name='below_no_transfer')
+  no_transfer.sub_agents.append(below_no_transfer)
+  below_no_transfer.parent_agent = no_transfer
+  sequential_child = LlmAgent(name='sequential_child')
+  sequential = SequentialAgent(name='sequential', sub_agents=[sequential_child])
+  return LlmAgent(name='root', sub_agents=[leaf, no_transfer, sequential])
+
+
+def test_find_agent_matches_base_agent():
+  root = _create_tree()
+  index = AgentTreeIndex(root)
+
+  for name in [
+      'root',
+      'leaf',
+      'no_transfer',
+      'below_no_transfer',
+      'sequential',
+      'sequential_child',
+      'unknown',
+  ]:
+    assert index.find_agent(name) is root.find_agent(name)
+
+
+def test_is_transferable_across_agent_tree():
+  root = _create_tree()
+  index = AgentTreeIndex(root)
+
+  transferable = {
+      name
+      for name in [
+          'root',
+          'leaf',
+          'no_transfer',
+          'below_no_transfer',
+          'sequential',
+          'sequential_child',
+      ]
+      if index.is_transferable_across_agent_tree(index.find_agent(name))
+  }
+
+  assert transferable == {'root', 'leaf'}
+
+
+def test_agent_outside_tree_is_not_transferable():
+  index = AgentTreeIndex(_create_tree())
+
+  assert not index.is_transferable_across_agent_tree(LlmAgent(name='leaf'))
+
+
+@pytest.mark.parametrize(
+    'name, expected',
+    [
+        ('llm_agent', True),
+        ('no_transfer', False),
+        ('non_llm_agent', False),
+    ],
+)
+def test_is_transferable_across_agent_tree_for_direct_sub_agents(
+    name, expected
+):
+  root = LlmAgent(
+      name='root',
+      sub_agents=[
+          LlmAgent(name='llm_agent'),
+          LlmAgent(name='no_transfer', disallow_transfer_to_parent=True),
+          SequentialAgent(name='non_llm_agent'),
+      ],
+  )
+  index = AgentTreeIndex(root)
+
+  assert (
+      index.is_transferable_across_agent_tree(index.find_agent(name))
+      is expected
+  )
@@ -16,11 +16,17 @@ from unittest.mock import MagicMock
 
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.langgraph_agent import LangGraphAgent
+from google.adk.agents.run_config import RunConfig
+from google.adk.agents.run_config import StreamingMode
 from google.adk.events import Event
+from google.adk.runners import InMemoryRunner
 from google.genai import types
 from langchain_core.messages import AIMessage
 from langchain_core.messages import HumanMessage
 from langchain_core.messages import SystemMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import MessagesState
+from langgraph.graph import StateGraph
 from langgraph.graph.graph import CompiledGraph
 import pytest
 
@@ -154,12 +160,15 @@ async def test_langgraph_agent(
   mock_graph = MagicMock(spec=CompiledGraph)
   mock_graph_state = MagicMock()
   mock_graph_state.values = {}
-  mock_graph.get_state.return_value = mock_graph_state
+  mock_graph_state.config = {"configurable": {"checkpoint_id": "checkpoint"}}
+  mock_graph.aget_state.return_value = mock_graph_state
 
   mock_graph.checkpointer = checkpointer_value
-  mock_graph.invoke.return_value = {
-      "messages": [AIMessage(content="test response")]
-  }
+
+  async def astream(*args, **kwargs):
+    yield "values", {"messages": [AIMessage(content="test response")]}
+
+  mock_graph.astream.side_effect = astream
 
   mock_parent_context = MagicMock(spec=InvocationContext)
   mock_session = MagicMock()
@@ -167,7 +176,9 @@ async def test_langgraph_agent(
   mock_parent_context.branch = "parent_agent"
   mock_parent_context.end_invocation = False
   mock_session.events = events_list
+  mock_session.state = {}
   mock_parent_context.invocation_id = "test_invocation_id"
+  mock_parent_context.run_config = RunConfig()
   mock_parent_context.model_copy.return_value = mock_parent_context
 
   weather_agent = LangGraphAgent(
@@ -184,8 +195,142 @@ async def test_langgraph_agent(
   assert result_event.author == "weather_agent"
   assert result_event.content.parts[0].text == "test response"
 
-  mock_graph.invoke.assert_called_once()
-  mock_graph.invoke.assert_called_with(
+  mock_graph.astream.assert_called_once()
+  mock_graph.astream.assert_called_with(
       {"messages": expected_messages},
       {"configurable": {"thread_id": mock_session.id}},
+      stream_mode=["values"],
+  )
+
+
+@pytest.mark.asyncio
+async def test_langgraph_agent_without_output():
+  """A graph that streams no state yields no events."""
+  mock_graph = MagicMock(spec=CompiledGraph)
+  mock_graph.checkpointer = None
+
+  async def astream(*args, **kwargs):
+    return
+    yield
+
+  mock_graph.astream.side_effect = astream
+  mock_parent_context = MagicMock(spec=InvocationContext)
+  mock_parent_context.session = MagicMock(events=[], state={})
+  mock_parent_context.branch = "parent_agent"
+  mock_parent_context.end_invocation = False
+  mock_parent_context.invocation_id = "test_invocation_id"
+  mock_parent_context.run_config = RunConfig()
+  mock_parent_context.model_copy.return_value = mock_parent_context
+
+  agent = LangGraphAgent(name="graph_agent", graph=mock_graph)
+
+  assert [event async for event in agent.run_async(mock_parent_context)] == []
+
+
+def _create_graph(checkpointer=None) -> CompiledGraph:
+  def draft(state: MessagesState):
+    return {"messages": [AIMessage(content=f"draft {len(state['messages'])}")]}
+
+  def review(state: MessagesState):
+    return {"messages": [AIMessage(content="final")]}
+
+  builder = StateGraph(MessagesState)
+  builder.add_node("draft", draft)
+  builder.add_node("review", review)
+  builder.add_edge("__start__", "draft")
+  builder.add_edge("draft", "review")
+  return builder.compile(checkpointer=checkpointer)
+
+
+async def _run(
+    runner: InMemoryRunner,
+    session_id: str,
+    text: str,
+    streaming_mode: StreamingMode = StreamingMode.SSE,
+):
+  return [
+      event
+      async for event in runner.run_async(
+          user_id="user",
+          session_id=session_id,
+          new_message=types.Content(
+              role="user", parts=[types.Part.from_text(text=text)]
+          ),
+          run_config=RunConfig(streaming_mode=streaming_mode),
+      )
+  ]
+
+
+@pytest.mark.asyncio
+async def test_langgraph_agent_streams_node_outputs():
+  """Messages of intermediate nodes are streamed as partial events in SSE."""
+  agent = LangGraphAgent(name="graph_agent", graph=_create_graph())
+  runner = InMemoryRunner(agent=agent)
+  session = await runner.session_service.create_session(
+      app_name=runner.app_name, user_id="user"
+  )
+
+  events = await _run(runner, session.id, "hello")
+
+  assert [(event.partial, event.content.parts[0].text) for event in events] == [
+      (True, "draft 1"),
+      (True, "final"),
+      (None, "final"),
+  ]
+  session = await runner.session_service.get_session(
+      app_name=runner.app_name, user_id="user", session_id=session.id
+  )
+  # Partial events are not persisted.
+  assert [event.content.parts[0].text for event in session.events] == [
+      "hello",
+      "final",
+  ]
+
+
+@pytest.mark.asyncio
+async def test_langgraph_agent_without_streaming_yields_final_event_only():
+  """No partial events are yielded unless the run streams with SSE."""
+  agent = LangGraphAgent(name="graph_agent", graph=_create_graph())
+  runner = InMemoryRunner(agent=agent)
+  session = await runner.session_service.create_session(
+      app_name=runner.app_name, user_id="user"
+  )
+
+  events = await _run(
+      runner, session.id, "hello", streaming_mode=StreamingMode.NONE
+  )
+
+  assert [(event.partial, event.content.parts[0].text) for event in events] == [
+      (None, "final"),
+  ]
+
+
+@pytest.mark.asyncio
+async def test_langgraph_agent_maps_checkpoint_to_session_state():
+  """The checkpoint of the graph is resumed from the session state."""
+  checkpointer = MemorySaver()
+  agent = LangGraphAgent(
+      name="graph_agent",
+      instruction="be brief",
+      graph=_create_graph(checkpointer),
+  )
+  runner = InMemoryRunner(agent=agent)
+  session = await runner.session_service.create_session(
+      app_name=runner.app_name, user_id="user"
+  )
+
+  await _run(runner, session.id, "first")
+  events = await _run(runner, session.id, "second")
+
+  # The second turn only sends the new user message: system message, first
+  # message, two node outputs and the second message.
+  assert events[0].content.parts[0].text == "draft 5"
+  session = await runner.session_service.get_session(
+      app_name=runner.app_name, user_id="user", session_id=session.id
+  )
+  graph_state = await agent.graph.aget_state(
+      {"configurable": {"thread_id": session.id}}
+  )
+  assert session.state["graph_agent_langgraph_checkpoint_id"] == (
+      graph_state.config["configurable"]["checkpoint_id"]
   )
@@ -1,9 +1,11 @@
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from google.adk.agents.live_request_queue import LiveRequest
 from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.live_request_queue import RealtimeOverflowPolicy
 from google.genai import types
 import pytest
 
@@ -54,3 +56,101 @@ async def test_get():
 
     assert result == res
     mock_get.assert_called_once()
+
+
+def _blob(data: bytes) -> types.Blob:
+  return types.Blob(data=data, mime_type="audio/pcm")
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_drops_oldest_blob():
+  queue = LiveRequestQueue(max_size=2)
+  content = types.Content(role="user", parts=[types.Part(text="hi")])
+
+  queue.send_realtime(_blob(b"1"))
+  queue.send_content(content)
+  queue.send_realtime(_blob(b"2"))
+
+  assert queue.dropped_count == 1
+  assert await queue.get() == LiveRequest(content=content)
+  assert await queue.get() == LiveRequest(blob=_blob(b"2"))
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_drops_newest_blob():
+  queue = LiveRequestQueue(
+      max_size=1, overflow_policy=RealtimeOverflowPolicy.DROP_NEWEST
+  )
+
+  queue.send_realtime(_blob(b"1"))
+  queue.send_realtime(_blob(b"2"))
+
+  assert queue.dropped_count == 1
+  assert await queue.get() == LiveRequest(blob=_blob(b"1"))
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_coalesces_blobs():
+  queue = LiveRequestQueue(
+      max_size=1, overflow_policy=RealtimeOverflowPolicy.COALESCE
+  )
+
+  queue.send_realtime(_blob(b"1"))
+  queue.send_realtime(_blob(b"2"))
+  queue.close()
+
+  assert queue.dropped_count == 0
+  assert await queue.get() == LiveRequest(blob=_blob(b"12"))
+  assert await queue.get() == LiveRequest(close=True)
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_never_drops_control_requests():
+  queue = LiveRequestQueue(max_size=1)
+
+  queue.send_realtime(_blob(b"1"))
+  queue.close()
+
+  assert queue.dropped_count == 0
+  assert await queue.get() == LiveRequest(blob=_blob(b"1"))
+  assert await queue.get() == LiveRequest(close=True)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_capacity_blocks_until_low_watermark():
+  queue = LiveRequestQueue(high_watermark=3, low_watermark=1)
+  for data in (b"1", b"2", b"3"):
+    queue.send_realtime(_blob(data))
+
+  waiter = asyncio.create_task(queue.wait_for_capacity())
+  await queue.get()
+  await asyncio.sleep(0)
+  assert not waiter.done()
+
+  await queue.get()
+  await asyncio.wait_for(waiter, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_get_waits_for_request():
+  queue = LiveRequestQueue()
+  getters = [asyncio.create_task(queue.get()) for _ in range(2)]
+  await asyncio.sleep(0)
+  assert not any(getter.done() for getter in getters)
+
+  queue.send_realtime(_blob(b"1"))
+  done, pending = await asyncio.wait(
+      getters, timeout=1, return_when=asyncio.FIRST_COMPLETED
+  )
+  assert [task.result() for task in done] == [LiveRequest(blob=_blob(b"1"))]
+  await asyncio.sleep(0)
+  assert len(pending) == 1 and not pending.pop().done()
+
+  queue.send_realtime(_blob(b"2"))
+  results = await asyncio.wait_for(asyncio.gather(*getters), timeout=1)
+  assert sorted(r.blob.data for r in results) == [b"1", b"2"]
+
+
+def test_invalid_watermarks():
+  with pytest.raises(ValueError):
+    LiveRequestQueue(high_watermark=2, low_watermark=2)
@@ -14,6 +14,7 @@
 
 """Unit tests for canonical_xxx fields in LlmAgent."""
 
+import asyncio
 from typing import Any
 from typing import cast
 from typing import Optional
@@ -26,6 +27,8 @@ from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.registry import LLMRegistry
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.tools.base_toolset import BaseToolset
+from google.adk.tools.function_tool import FunctionTool
 from google.genai import types
 from pydantic import BaseModel
 import pytest
@@ -60,6 +63,26 @@ def test_canonical_model_str():
   assert agent.canonical_model.model == 'gemini-pro'
 
 
+def test_canonical_model_str_resolved_once_per_event_loop():
+  agent = LlmAgent(name='test_agent', model='gemini-pro')
+
+  async def _get_models():
+    return agent.canonical_model, agent.canonical_model
+
+  model, same_model = asyncio.run(_get_models())
+  assert same_model is model
+  # The client of the model is bound to the closed event loop.
+  other_model, _ = asyncio.run(_get_models())
+  assert other_model is not model
+
+  async def _get_model_after_change():
+    agent.canonical_model
+    agent.model = 'gemini-1.5-flash'
+    return agent.canonical_model
+
+  assert asyncio.run(_get_model_after_change()).model == 'gemini-1.5-flash'
+
+
 def test_canonical_model_llm():
   llm = LLMRegistry.new_llm('gemini-pro')
   agent = LlmAgent(name='test_agent', model=llm)
@@ -280,3 +303,45 @@ def test_allow_transfer_by_default():
 
   assert not agent.disallow_transfer_to_parent
   assert not agent.disallow_transfer_to_peers
+
+
+@pytest.mark.asyncio
+async def test_canonical_tools_resolves_toolsets_concurrently():
+  # Each toolset waits for the other one, so this only completes if they are
+  # resolved concurrently.
+  started_toolsets = []
+  all_started = asyncio.Event()
+
+  class _Toolset(BaseToolset):
+
+    def __init__(self, func):
+      super().__init__()
+      self._func = func
+
+    async def get_tools(self, readonly_context=None):
+      started_toolsets.append(self)
+      if len(started_toolsets) == 2:
+        all_started.set()
+      await asyncio.wait_for(all_started.wait(), timeout=5)
+      return [FunctionTool(func=self._func)]
+
+    async def close(self):
+      pass
+
+  def _tool_a():
+    pass
+
+  def _tool_b():
+    pass
+
+  def _tool_c():
+    pass
+
+  agent = LlmAgent(
+      name='test_agent', tools=[_Toolset(_tool_a), _tool_c, _Toolset(_tool_b)]
+  )
+  ctx = await _create_readonly_context(agent)
+
+  tools = await agent.canonical_tools(ctx)
+
+  assert [tool.name for tool in tools] == ['_tool_a', '_tool_c', '_tool_b']
@@ -22,6 +22,7 @@ from unittest.mock import patch
 
 # Try to import a2a library - will fail on Python < 3.10
 try:
+  from a2a.server.agent_execution import AgentExecutor
   from a2a.types import AgentCapabilities
   from a2a.types import AgentCard
   from a2a.types import AgentSkill
@@ -37,6 +38,7 @@ try:
 except ImportError:
   A2A_AVAILABLE = False
   # Create dummy classes to prevent NameError during test collection
+  AgentExecutor = object
   AgentCapabilities = type("AgentCapabilities", (), {})
   AgentCard = type("AgentCard", (), {})
   AgentSkill = type("AgentSkill", (), {})
@@ -45,6 +47,7 @@ except ImportError:
   A2ATask = type("A2ATask", (), {})
 
 
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.events.event import Event
 from google.adk.sessions.session import Session
 import httpx
@@ -1016,3 +1019,265 @@ class TestRemoteA2aAgentIntegration:
 
                       # Verify A2A client was called
                       mock_a2a_client.send_message.assert_called_once()
+
+
+class _StreamingAgentExecutor(AgentExecutor):
+  """Stand-in remote agent that streams status and artifact updates."""
+
+  async def execute(self, context, event_queue):
+    from a2a.server.tasks import TaskUpdater
+    from a2a.types import Part as A2APart
+    from a2a.types import Role
+    from a2a.types import TaskState
+    from a2a.types import TextPart
+
+    def _message(text: str) -> A2AMessage:
+      return A2AMessage(
+          messageId=text,
+          role=Role.agent,
+          parts=[A2APart(root=TextPart(text=text))],
+      )
+
+    updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+    await updater.submit()
+    await updater.update_status(TaskState.working, message=_message("Hello"))
+    await updater.update_status(TaskState.working, message=_message(" world"))
+    await updater.add_artifact(
+        [A2APart(root=TextPart(text="artifact"))], artifact_id="artifact-1"
+    )
+    await updater.update_status(
+        TaskState.completed, message=_message("Hello world"), final=True
+    )
+
+  async def cancel(self, context, event_queue):
+    raise NotImplementedError()
+
+
+class TestRemoteA2aAgentStreaming:
+  """Test streaming against a local stand-in A2A server."""
+
+  def setup_method(self):
+    """Setup test fixtures."""
+    from a2a.server.apps import A2AStarletteApplication
+    from a2a.server.request_handlers import DefaultRequestHandler
+    from a2a.server.tasks import InMemoryTaskStore
+    from google.adk.agents.run_config import RunConfig
+    from google.adk.agents.run_config import StreamingMode
+    from google.genai import types as genai_types
+
+    self.agent_card = create_test_agent_card(url="http://remote-agent/rpc")
+    self.agent_card.capabilities = AgentCapabilities(streaming=True)
+    app = A2AStarletteApplication(
+        agent_card=self.agent_card,
+        http_handler=DefaultRequestHandler(
+            agent_executor=_StreamingAgentExecutor(),
+            task_store=InMemoryTaskStore(),
+        ),
+    ).build(rpc_url="/rpc")
+    self.httpx_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app)
+    )
+    self.agent = RemoteA2aAgent(
+        name="test_agent",
+        agent_card=self.agent_card,
+        httpx_client=self.httpx_client,
+    )
+
+    session = Session(
+        id="session-123",
+        app_name="test_app",
+        user_id="user",
+        events=[
+            Event(
+                author="user",
+                content=genai_types.Content(
+                    role="user", parts=[genai_types.Part(text="Hi")]
+                ),
+            )
+        ],
+    )
+    self.mock_context = Mock(spec=InvocationContext)
+    self.mock_context.session = session
+    self.mock_context.invocation_id = "invocation-123"
+    self.mock_context.branch = "main"
+    self.mock_context.run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+
+  @pytest.mark.asyncio
+  async def test_run_async_impl_streams_partial_events(self):
+    """Updates are yielded as partial events, followed by the final event."""
+    events = [
+        event async for event in self.agent._run_async_impl(self.mock_context)
+    ]
+
+    assert [event.partial for event in events] == [True, True, True, None]
+    assert [event.content.parts[0].text for event in events] == [
+        "Hello",
+        " world",
+        "artifact",
+        "Hello world",
+    ]
+    final_metadata = events[-1].custom_metadata
+    assert final_metadata[A2A_METADATA_PREFIX + "task_id"]
+    assert final_metadata[A2A_METADATA_PREFIX + "context_id"]
+    response = final_metadata[A2A_METADATA_PREFIX + "response"]
+    assert response["status"]["state"] == "completed"
+    assert response["artifacts"][0]["artifactId"] == "artifact-1"
+
+  @pytest.mark.asyncio
+  async def test_run_async_impl_without_sse_does_not_stream(self):
+    """Without SSE streaming mode a single final event is yielded."""
+    from google.adk.agents.run_config import RunConfig
+
+    self.mock_context.run_config = RunConfig()
+
+    events = [
+        event async for event in self.agent._run_async_impl(self.mock_context)
+    ]
+
+    assert len(events) == 1
+    assert not events[0].partial
+    assert events[0].content.parts[0].text == "Hello world"
+
+
+class _GreetingAgent(BaseAgent):
+  """Agent behind the ADK A2A executor that replies with a greeting."""
+
+  async def _run_async_impl(self, ctx):
+    from google.genai import types as genai_types
+
+    yield Event(
+        invocation_id=ctx.invocation_id,
+        author=self.name,
+        content=genai_types.Content(
+            role="model", parts=[genai_types.Part(text="Hello there")]
+        ),
+    )
+
+
+class TestRemoteA2aAgentStreamingWithAdkExecutor:
+  """Test streaming against an ADK agent served by A2aAgentExecutor."""
+
+  @pytest.mark.asyncio
+  async def test_run_async_impl_does_not_echo_user_message(self):
+    """The submitted update carrying the user message is not yielded."""
+    from a2a.server.apps import A2AStarletteApplication
+    from a2a.server.request_handlers import DefaultRequestHandler
+    from a2a.server.tasks import InMemoryTaskStore
+    from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutor
+    from google.adk.agents.run_config import RunConfig
+    from google.adk.agents.run_config import StreamingMode
+    from google.adk.runners import Runner
+    from google.adk.sessions.in_memory_session_service import InMemorySessionService
+    from google.genai import types as genai_types
+
+    agent_card = create_test_agent_card(url="http://remote-agent/rpc")
+    agent_card.capabilities = AgentCapabilities(streaming=True)
+    runner = Runner(
+        app_name="remote_app",
+        agent=_GreetingAgent(name="greeting_agent"),
+        session_service=InMemorySessionService(),
+    )
+    app = A2AStarletteApplication(
+        agent_card=agent_card,
+        http_handler=DefaultRequestHandler(
+            agent_executor=A2aAgentExecutor(runner=runner),
+            task_store=InMemoryTaskStore(),
+        ),
+    ).build(rpc_url="/rpc")
+    agent = RemoteA2aAgent(
+        name="test_agent",
+        agent_card=agent_card,
+        httpx_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app)),
+    )
+    mock_context = Mock(spec=InvocationContext)
+    mock_context.session = Session(
+        id="session-123",
+        app_name="test_app",
+        user_id="user",
+        events=[
+            Event(
+                author="user",
+                content=genai_types.Content(
+                    role="user", parts=[genai_types.Part(text="Hi")]
+                ),
+            )
+        ],
+    )
+    mock_context.invocation_id = "invocation-123"
+    mock_context.branch = "main"
+    mock_context.run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+
+    events = [event async for event in agent._run_async_impl(mock_context)]
+
+    texts = [
+        part.text
+        for event in events
+        if event.content
+        for part in event.content.parts
+    ]
+    assert "Hi" not in texts
+    assert [
+        event.content.parts[0].text for event in events if event.partial
+    ] == ["Hello there"]
+    assert not events[-1].partial
+
+
+class TestRemoteA2aAgentSharedHttpxClient:
+  """Test sharing of the HTTP client between remote agents."""
+
+  @pytest.mark.asyncio
+  async def test_remote_agents_in_tree_share_httpx_client(self):
+    """Remote agents in the same tree reuse a single HTTP client."""
+    from google.adk.agents.llm_agent import LlmAgent
+
+    first = RemoteA2aAgent(name="first", agent_card=create_test_agent_card())
+    second = RemoteA2aAgent(name="second", agent_card=create_test_agent_card())
+    other_timeout = RemoteA2aAgent(
+        name="other_timeout", agent_card=create_test_agent_card(), timeout=5
+    )
+    LlmAgent(name="root", sub_agents=[first, second, other_timeout])
+
+    first_client = await first._ensure_httpx_client()
+    second_client = await second._ensure_httpx_client()
+    other_timeout_client = await other_timeout._ensure_httpx_client()
+
+    assert second_client is first_client
+    assert other_timeout_client is not first_client
+
+    # The client is closed once the last agent using it is cleaned up.
+    await first.cleanup()
+    assert not first_client.is_closed
+    await second.cleanup()
+    assert first_client.is_closed
+    assert not other_timeout_client.is_closed
+    await other_timeout.cleanup()
+    assert other_timeout_client.is_closed
+
+    # The next agent to need a client gets a new one.
+    new_client = await first._ensure_httpx_client()
+    assert new_client is not first_client
+    await first.cleanup()
+
+  @pytest.mark.asyncio
+  async def test_explicit_httpx_client_is_not_shared(self):
+    """A client passed in for one agent is never used by another agent."""
+    from google.adk.agents.llm_agent import LlmAgent
+
+    explicit_client = httpx.AsyncClient(headers={"Authorization": "secret"})
+    explicit = RemoteA2aAgent(
+        name="explicit",
+        agent_card=create_test_agent_card(),
+        httpx_client=explicit_client,
+    )
+    pooled = RemoteA2aAgent(name="pooled", agent_card=create_test_agent_card())
+    LlmAgent(name="root", sub_agents=[explicit, pooled])
+
+    assert await explicit._ensure_httpx_client() is explicit_client
+    pooled_client = await pooled._ensure_httpx_client()
+    assert pooled_client is not explicit_client
+
+    await explicit.cleanup()
+    await pooled.cleanup()
+    assert not explicit_client.is_closed
+    assert pooled_client.is_closed
+    await explicit_client.aclose()
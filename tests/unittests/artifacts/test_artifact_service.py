@@ -14,11 +14,16 @@
 
 """Tests for the artifact service."""
 
+import asyncio
 import enum
+import os
+import tempfile
+import threading
 from typing import Optional
 from typing import Union
 from unittest import mock
 
+from google.adk.artifacts import FileArtifactService
 from google.adk.artifacts import GcsArtifactService
 from google.adk.artifacts import InMemoryArtifactService
 from google.genai import types
@@ -30,6 +35,7 @@ Enum = enum.Enum
 class ArtifactServiceType(Enum):
   IN_MEMORY = "IN_MEMORY"
   GCS = "GCS"
+  FILE = "FILE"
 
 
 class MockBlob:
@@ -149,12 +155,19 @@ def get_artifact_service(
   """Creates an artifact service for testing."""
   if service_type == ArtifactServiceType.GCS:
     return mock_gcs_artifact_service()
+  if service_type == ArtifactServiceType.FILE:
+    return FileArtifactService(root_dir=tempfile.mkdtemp())
   return InMemoryArtifactService()
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_load_empty(service_type):
   """Tests loading an artifact when none exists."""
@@ -169,7 +182,12 @@ async def test_load_empty(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_save_load_delete(service_type):
   """Tests saving, loading, and deleting an artifact."""
@@ -213,7 +231,12 @@ async def test_save_load_delete(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_list_keys(service_type):
   """Tests listing keys in the artifact service."""
@@ -244,7 +267,12 @@ async def test_list_keys(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_list_versions(service_type):
   """Tests listing versions of an artifact."""
@@ -278,3 +306,96 @@ async def test_list_versions(service_type):
   )
 
   assert response_versions == list(range(3))
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_service_shares_root_dir(tmp_path):
+  """Services sharing a root directory see each other's versions."""
+  artifact_services = [
+      FileArtifactService(root_dir=str(tmp_path)) for _ in range(2)
+  ]
+  artifact_keys = {
+      "app_name": "app0",
+      "user_id": "user0",
+      "session_id": "123",
+      "filename": "user:file/456",
+  }
+
+  versions = [
+      await artifact_service.save_artifact(
+          **artifact_keys, artifact=types.Part.from_text(text=str(i))
+      )
+      for i, artifact_service in enumerate(artifact_services * 2)
+  ]
+
+  assert versions == [0, 1, 2, 3]
+  assert await artifact_services[0].load_artifact(
+      **artifact_keys
+  ) == types.Part.from_text(text="3")
+  assert await artifact_services[1].list_artifact_keys(
+      app_name="app0", user_id="user0", session_id="other_session"
+  ) == ["user:file/456"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "artifact_keys",
+    [
+        {"app_name": "..", "user_id": "user0", "session_id": "123"},
+        {"app_name": "app0", "user_id": ".", "session_id": "123"},
+        {"app_name": "app0", "user_id": "user0", "session_id": ".."},
+        {"app_name": "app0", "user_id": "user0", "session_id": ""},
+    ],
+)
+async def test_file_artifact_service_rejects_path_traversal(
+    tmp_path, artifact_keys
+):
+  """Path components that leave their directory are rejected."""
+  artifact_service = FileArtifactService(root_dir=str(tmp_path / "root"))
+
+  with pytest.raises(ValueError):
+    await artifact_service.save_artifact(
+        **artifact_keys,
+        filename="file",
+        artifact=types.Part.from_text(text="hello"),
+    )
+  with pytest.raises(ValueError):
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="..",
+        artifact=types.Part.from_text(text="hello"),
+    )
+
+  assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_service_saves_concurrently_off_the_loop(
+    tmp_path,
+):
+  """Concurrent saves run in worker threads and claim distinct versions."""
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  loop_thread = threading.get_ident()
+  link_threads = []
+  link = os.link
+
+  def record_link(*args, **kwargs):
+    link_threads.append(threading.get_ident())
+    return link(*args, **kwargs)
+
+  with mock.patch.object(os, "link", side_effect=record_link):
+    versions = await asyncio.gather(*(
+        artifact_service.save_artifact(
+            app_name="app0",
+            user_id="user0",
+            session_id="123",
+            filename="file",
+            artifact=types.Part.from_text(text=str(i)),
+        )
+        for i in range(5)
+    ))
+
+  assert sorted(versions) == list(range(5))
+  assert link_threads and loop_thread not in link_threads
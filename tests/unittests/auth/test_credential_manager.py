@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -31,6 +32,7 @@ from google.adk.auth.auth_schemes import AuthSchemeType
 from google.adk.auth.auth_schemes import OpenIdConnectWithConfig
 from google.adk.auth.auth_tool import AuthConfig
 from google.adk.auth.credential_manager import CredentialManager
+from google.adk.auth.refresher.credential_refresher_registry import CredentialRefresherRegistry
 import pytest
 
 
@@ -136,6 +138,7 @@ class TestCredentialManager:
   async def test_load_existing_credential_already_exchanged(self):
     """Test _load_existing_credential when credential is already exchanged."""
     auth_config = Mock(spec=AuthConfig)
+    auth_config.credential_key = "test_credential_key"
     mock_credential = Mock(spec=AuthCredential)
     auth_config.exchanged_auth_credential = mock_credential
 
@@ -152,6 +155,7 @@ class TestCredentialManager:
   async def test_load_existing_credential_with_credential_service(self):
     """Test _load_existing_credential with credential service."""
     auth_config = Mock(spec=AuthConfig)
+    auth_config.credential_key = "test_credential_key"
     auth_config.exchanged_auth_credential = None
 
     mock_credential = Mock(spec=AuthCredential)
@@ -172,6 +176,7 @@ class TestCredentialManager:
   async def test_load_from_credential_service_with_service(self):
     """Test _load_from_credential_service from tool context when credential service is available."""
     auth_config = Mock(spec=AuthConfig)
+    auth_config.credential_key = "test_credential_key"
 
     mock_credential = Mock(spec=AuthCredential)
 
@@ -215,6 +220,7 @@ class TestCredentialManager:
   async def test_save_credential_with_service(self):
     """Test _save_credential with credential service."""
     auth_config = Mock(spec=AuthConfig)
+    auth_config.credential_key = "test_credential_key"
     mock_credential = Mock(spec=AuthCredential)
 
     # Mock credential service
@@ -263,6 +269,7 @@ class TestCredentialManager:
 
     mock_credential = Mock(spec=AuthCredential)
     mock_credential.auth_type = AuthCredentialTypes.OAUTH2
+    mock_credential.oauth2 = mock_oauth2_auth
 
     auth_config = Mock(spec=AuthConfig)
     auth_config.auth_scheme = Mock()
@@ -452,6 +459,124 @@ class TestCredentialManager:
       assert was_exchanged is False
 
 
+  @pytest.mark.asyncio
+  async def test_concurrent_refreshes_share_single_request(self):
+    """Concurrent refreshes of the same credential make a single request."""
+    credential = AuthCredential(
+        auth_type=AuthCredentialTypes.OAUTH2,
+        oauth2=OAuth2Auth(client_id="id", refresh_token="shared_token"),
+    )
+    auth_config = Mock(spec=AuthConfig)
+    auth_config.auth_scheme = Mock()
+
+    refresh_started = asyncio.Event()
+    release_refresh = asyncio.Event()
+
+    async def refresh(auth_credential, auth_scheme):
+      refresh_started.set()
+      await release_refresh.wait()
+      return auth_credential
+
+    mock_refresher = Mock()
+    mock_refresher.is_refresh_needed = AsyncMock(return_value=True)
+    mock_refresher.refresh = AsyncMock(side_effect=refresh)
+
+    managers = [CredentialManager(auth_config) for _ in range(3)]
+    with patch.object(
+        CredentialRefresherRegistry,
+        "get_refresher",
+        return_value=mock_refresher,
+    ):
+      tasks = [
+          asyncio.create_task(
+              manager._refresh_credential(credential.model_copy())
+          )
+          for manager in managers
+      ]
+      await refresh_started.wait()
+      release_refresh.set()
+      results = await asyncio.gather(*tasks)
+
+    mock_refresher.refresh.assert_called_once()
+    assert all(was_refreshed for _, was_refreshed in results)
+
+  @pytest.mark.asyncio
+  async def test_concurrent_loads_share_single_read(self):
+    """Concurrent loads of the same credential read the service once."""
+    auth_config = Mock(spec=AuthConfig)
+    auth_config.credential_key = "shared_credential_key"
+    credential = AuthCredential(
+        auth_type=AuthCredentialTypes.OAUTH2,
+        oauth2=OAuth2Auth(access_token="token"),
+    )
+    load_started = asyncio.Event()
+    release_load = asyncio.Event()
+
+    async def load_credential(auth_config, tool_context):
+      load_started.set()
+      await release_load.wait()
+      return credential
+
+    credential_service = Mock()
+    credential_service.load_credential = AsyncMock(side_effect=load_credential)
+    tool_context = Mock()
+    tool_context._invocation_context.app_name = "app"
+    tool_context._invocation_context.user_id = "user"
+    tool_context._invocation_context.credential_service = credential_service
+
+    tasks = [
+        asyncio.create_task(
+            CredentialManager(auth_config)._load_from_credential_service(
+                tool_context
+            )
+        )
+        for _ in range(3)
+    ]
+    await load_started.wait()
+    release_load.set()
+    results = await asyncio.gather(*tasks)
+
+    credential_service.load_credential.assert_called_once()
+    assert results == [credential] * 3
+    # Each caller can update its credential without affecting the others.
+    assert len({id(result) for result in results}) == 3
+    results[0].oauth2.access_token = "refreshed_token"
+    assert results[1].oauth2.access_token == "token"
+
+  @pytest.mark.asyncio
+  async def test_load_sees_credential_updated_in_service(self):
+    """Credentials changed in the service after a save are loaded again."""
+    auth_config = Mock(spec=AuthConfig)
+    auth_config.credential_key = "updated_credential_key"
+    auth_config.exchanged_auth_credential = None
+    saved_credential = AuthCredential(
+        auth_type=AuthCredentialTypes.OAUTH2,
+        oauth2=OAuth2Auth(access_token="old_token"),
+    )
+    rotated_credential = AuthCredential(
+        auth_type=AuthCredentialTypes.OAUTH2,
+        oauth2=OAuth2Auth(access_token="new_token"),
+    )
+    tool_context = Mock()
+    tool_context._invocation_context.app_name = "app"
+    tool_context._invocation_context.user_id = "user"
+    credential_service = tool_context._invocation_context.credential_service
+    credential_service.save_credential = AsyncMock()
+    credential_service.load_credential = AsyncMock(
+        return_value=rotated_credential
+    )
+
+    manager = CredentialManager(auth_config)
+    await manager._save_credential(tool_context, saved_credential)
+
+    assert (
+        await CredentialManager(auth_config)._load_existing_credential(
+            tool_context
+        )
+        is rotated_credential
+    )
+
+
 # Test fixtures
 @pytest.fixture
 def oauth2_auth_scheme():
@@ -35,6 +35,8 @@ from google.adk.evaluation.eval_set import EvalSet
 from google.adk.events import Event
 from google.adk.runners import Runner
 from google.adk.sessions.base_session_service import ListSessionsResponse
+from google.adk.utils.admission_control import AdmissionConfig
+from google.adk.utils.admission_control import AdmissionController
 from google.genai import types
 from pydantic import BaseModel
 import pytest
@@ -110,6 +112,7 @@ async def dummy_run_async(
     session_id,
     new_message,
     run_config: RunConfig = RunConfig(),
+    session=None,
 ):
   yield _event_1()
   await asyncio.sleep(0)
@@ -418,6 +421,12 @@ def mock_eval_set_results_manager():
   return MockEvalSetResultsManager()
 
 
+@pytest.fixture
+def admission_controller():
+  """Admission controller that admits one run at a time."""
+  return AdmissionController(AdmissionConfig(max_concurrent_runs_per_app=1))
+
+
 @pytest.fixture
 def test_app(
     mock_session_service,
@@ -426,6 +435,7 @@ def test_app(
     mock_agent_loader,
     mock_eval_sets_manager,
     mock_eval_set_results_manager,
+    admission_controller,
 ):
   """Create a TestClient for the FastAPI app without starting a server."""
 
@@ -472,6 +482,7 @@ def test_app(
         a2a=False,  # Disable A2A for most tests
         host="127.0.0.1",
         port=8000,
+        admission_controller=admission_controller,
     )
 
     # Create a TestClient that doesn't start a real server
@@ -782,6 +793,107 @@ def test_agent_run(test_app, create_test_session):
   logger.info("Agent run test completed successfully")
 
 
+def test_agent_run_loads_env_once(test_app, create_test_session):
+  """The .env file of an app is loaded once, and again on reload."""
+  info = create_test_session
+  payload = {
+      "app_name": info["app_name"],
+      "user_id": info["user_id"],
+      "session_id": info["session_id"],
+      "new_message": {"role": "user", "parts": [{"text": "Hello agent"}]},
+  }
+
+  with patch(
+      "google.adk.cli.fast_api.envs.load_dotenv_for_agent"
+  ) as mock_load_dotenv:
+    assert test_app.post("/run", json=payload).status_code == 200
+    assert test_app.post("/run_sse", json=payload).status_code == 200
+    mock_load_dotenv.assert_called_once_with("test_app", ".")
+
+    response = test_app.post(f"/apps/{info['app_name']}/reload_env")
+
+  assert response.status_code == 200
+  assert mock_load_dotenv.call_count == 2
+
+
+def test_preload_warms_up_all_apps(tmp_path, mock_agent_loader):
+  """With preload, the runners of all apps are warmed up at startup."""
+  for app_name in ("app_a", "app_b"):
+    (tmp_path / app_name).mkdir()
+
+  with (
+      patch(
+          "google.adk.cli.fast_api.AgentLoader",
+          return_value=mock_agent_loader,
+      ),
+      patch("google.adk.cli.fast_api.envs.load_dotenv_for_agent"),
+      patch.object(
+          Runner, "warmup", autospec=True, return_value={}
+      ) as mock_warmup,
+  ):
+    app = get_fast_api_app(agents_dir=str(tmp_path), web=False, preload=True)
+    with TestClient(app):
+      warmed_up_apps = [
+          call.args[0].app_name for call in mock_warmup.await_args_list
+      ]
+
+  assert warmed_up_apps == ["app_a", "app_b"]
+
+
+@pytest.mark.parametrize("binary_inline_data", [False, True])
+def test_agent_live_run(test_app, create_test_session, binary_inline_data):
+  """Inline data is sent as base64 JSON or as binary frames on request."""
+  info = create_test_session
+  url = (
+      f"/run_live?app_name={info['app_name']}&user_id={info['user_id']}"
+      f"&session_id={info['session_id']}"
+      f"&binary_inline_data={str(binary_inline_data).lower()}"
+  )
+
+  with test_app.websocket_connect(url) as websocket:
+    event_1 = json.loads(websocket.receive_text())
+    event_2 = json.loads(websocket.receive_text())
+    audio = websocket.receive_bytes() if binary_inline_data else None
+    event_3 = json.loads(websocket.receive_text())
+
+  assert event_1["content"]["parts"][0]["text"] == "LLM reply"
+  inline_data = event_2["content"]["parts"][0]["inlineData"]
+  assert inline_data["mimeType"] == "audio/pcm;rate=24000"
+  if binary_inline_data:
+    assert "data" not in inline_data
+    assert audio == b"\x00\xFF"
+  else:
+    assert inline_data["data"] == "AP8="
+  assert event_3["interrupted"]
+
+
+def test_agent_run_rejected_when_overloaded(
+    test_app, create_test_session, admission_controller
+):
+  """Runs beyond the admission limits are rejected with HTTP 429."""
+  info = create_test_session
+  payload = {
+      "app_name": info["app_name"],
+      "user_id": info["user_id"],
+      "session_id": info["session_id"],
+      "new_message": {"role": "user", "parts": [{"text": "Hello agent"}]},
+  }
+
+  assert test_app.post("/run_sse", json=payload).status_code == 200
+  asyncio.run(admission_controller.acquire(info["app_name"], "other_user"))
+  assert test_app.post("/run", json=payload).status_code == 429
+  assert test_app.post("/run_sse", json=payload).status_code == 429
+  admission_controller.release(info["app_name"], "other_user")
+  assert test_app.post("/run", json=payload).status_code == 200
+
+  response = test_app.get("/debug/admission")
+  assert response.status_code == 200
+  metrics = response.json()[info["app_name"]]
+  assert metrics["running"] == 0
+  assert metrics["admitted"] == 3
+  assert metrics["rejected"] == 2
+
+
 def test_list_artifact_names(test_app, create_test_session):
   """Test listing artifact names for a session."""
   info = create_test_session
@@ -0,0 +1,228 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for run_evals in cli_eval."""
+
+from __future__ import annotations
+
+import asyncio
+
+from google.adk.cli import cli_eval
+from google.adk.evaluation.eval_case import EvalCase
+from google.adk.evaluation.eval_case import Invocation
+from google.adk.evaluation.eval_metrics import EvalMetric
+from google.adk.evaluation.evaluation_generator import EvaluationGenerator
+from google.adk.evaluation.evaluator import EvalStatus
+from google.adk.evaluation.evaluator import EvaluationResult
+from google.adk.evaluation.evaluator import Evaluator
+from google.genai import types as genai_types
+import pytest
+
+
+class _PassingEvaluator(Evaluator):
+
+  def evaluate_invocations(self, actual_invocations, expected_invocations):
+    return EvaluationResult(
+        overall_score=1.0, overall_eval_status=EvalStatus.PASSED
+    )
+
+
+class _RateLimitError(Exception):
+
+  def __init__(self):
+    super().__init__("Resource exhausted.")
+    self.code = 429
+
+
+def _eval_case(eval_id: str) -> EvalCase:
+  return EvalCase(
+      eval_id=eval_id,
+      conversation=[
+          Invocation(
+              user_content=genai_types.Content(
+                  role="user", parts=[genai_types.Part(text=eval_id)]
+              )
+          )
+      ],
+  )
+
+
+def _eval_id_of(invocations: list[Invocation]) -> str:
+  return invocations[0].user_content.parts[0].text
+
+
+@pytest.fixture(autouse=True)
+def _mock_evaluator(monkeypatch: pytest.MonkeyPatch) -> None:
+  monkeypatch.setattr(
+      cli_eval, "_get_evaluator", lambda _metric: _PassingEvaluator()
+  )
+  monkeypatch.setattr(cli_eval, "RATE_LIMIT_INITIAL_BACKOFF_SECONDS", 0)
+
+
+async def _collect(eval_cases_by_eval_set_id, **kwargs):
+  return [
+      result
+      async for result in cli_eval.run_evals(
+          eval_cases_by_eval_set_id,
+          root_agent=None,
+          reset_func=None,
+          eval_metrics=[EvalMetric(metric_name="metric", threshold=1.0)],
+          **kwargs,
+      )
+  ]
+
+
+@pytest.mark.asyncio
+async def test_run_evals_concurrently_in_deterministic_order(monkeypatch):
+  """Eval cases run concurrently, but results keep the input order."""
+  running = 0
+  max_running = 0
+  delays = {"e1": 0.05, "e2": 0.0, "e3": 0.02, "e4": 0.0}
+
+  async def mock_generate(invocations, **_kwargs):
+    nonlocal running, max_running
+    running += 1
+    max_running = max(max_running, running)
+    await asyncio.sleep(delays[_eval_id_of(invocations)])
+    running -= 1
+    return invocations
+
+  monkeypatch.setattr(
+      EvaluationGenerator,
+      "_generate_inferences_from_root_agent",
+      mock_generate,
+  )
+
+  results = await _collect(
+      {
+          "set1": [_eval_case("e1"), _eval_case("e2")],
+          "set2": [_eval_case("e3"), _eval_case("e4")],
+      },
+      max_concurrency=2,
+  )
+
+  assert [(r.eval_set_id, r.eval_id) for r in results] == [
+      ("set1", "e1"),
+      ("set1", "e2"),
+      ("set2", "e3"),
+      ("set2", "e4"),
+  ]
+  assert all(r.final_eval_status == EvalStatus.PASSED for r in results)
+  assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_run_evals_retries_rate_limited_eval_case(monkeypatch):
+  """Rate limited eval cases are retried with a fresh session."""
+  session_ids = []
+
+  async def mock_generate(invocations, session_id, **_kwargs):
+    session_ids.append(session_id)
+    if len(session_ids) < 3:
+      raise _RateLimitError()
+    return invocations
+
+  monkeypatch.setattr(
+      EvaluationGenerator,
+      "_generate_inferences_from_root_agent",
+      mock_generate,
+  )
+
+  results = await _collect({"set1": [_eval_case("e1")]})
+
+  assert len(results) == 1
+  assert results[0].session_id == session_ids[-1]
+  assert len(set(session_ids)) == 3
+
+
+@pytest.mark.asyncio
+async def test_run_evals_skips_eval_case_after_retries(monkeypatch):
+  """Eval cases still rate limited after all retries are skipped."""
+
+  async def mock_generate(invocations, **_kwargs):
+    if _eval_id_of(invocations) == "e1":
+      raise _RateLimitError()
+    return invocations
+
+  monkeypatch.setattr(
+      EvaluationGenerator,
+      "_generate_inferences_from_root_agent",
+      mock_generate,
+  )
+
+  results = await _collect(
+      {"set1": [_eval_case("e1"), _eval_case("e2")]},
+      max_rate_limit_retries=1,
+  )
+
+  assert [r.eval_id for r in results] == ["e2"]
+
+
+@pytest.mark.asyncio
+async def test_run_evals_fails_timed_out_eval_case(monkeypatch):
+  """Eval cases that exceed the timeout are reported as failed."""
+
+  async def mock_generate(invocations, **_kwargs):
+    if _eval_id_of(invocations) == "slow":
+      await asyncio.sleep(10)
+    return invocations
+
+  monkeypatch.setattr(
+      EvaluationGenerator,
+      "_generate_inferences_from_root_agent",
+      mock_generate,
+  )
+
+  results = await _collect(
+      {"set1": [_eval_case("slow"), _eval_case("fast")]},
+      max_concurrency=2,
+      eval_case_timeout=0.05,
+  )
+
+  assert [(r.eval_id, r.final_eval_status) for r in results] == [
+      ("slow", EvalStatus.FAILED),
+      ("fast", EvalStatus.PASSED),
+  ]
+  assert not results[0].overall_eval_metric_results
+
+
+@pytest.mark.asyncio
+async def test_run_evals_releases_slot_during_backoff(monkeypatch):
+  """A rate limited eval case does not hold its slot while backing off."""
+  monkeypatch.setattr(cli_eval, "RATE_LIMIT_INITIAL_BACKOFF_SECONDS", 0.05)
+  calls = []
+
+  async def mock_generate(invocations, **_kwargs):
+    calls.append(_eval_id_of(invocations))
+    if calls == ["e1"]:
+      raise _RateLimitError()
+    return invocations
+
+  monkeypatch.setattr(
+      EvaluationGenerator,
+      "_generate_inferences_from_root_agent",
+      mock_generate,
+  )
+
+  results = await _collect({"set1": [_eval_case("e1"), _eval_case("e2")]})
+
+  assert calls == ["e1", "e2", "e1"]
+  assert [r.eval_id for r in results] == ["e1", "e2"]
+
+
+@pytest.mark.asyncio
+async def test_run_evals_rejects_invalid_concurrency():
+  """max_concurrency should be positive."""
+  with pytest.raises(ValueError):
+    await _collect({"set1": [_eval_case("e1")]}, max_concurrency=0)
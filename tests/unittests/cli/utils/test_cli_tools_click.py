@@ -171,6 +171,26 @@ def test_cli_deploy_cloud_run_failure(
   assert any("Deploy failed: boom" in m for m in captured)
 
 
+@pytest.mark.parametrize("option", ["--workers=2", "--preload"])
+def test_cli_deploy_cloud_run_rejects_local_server_options(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, option: str
+) -> None:
+  """Options of the local server are not accepted by cloud_run."""
+  rec = _Recorder()
+  monkeypatch.setattr(cli_tools_click.cli_deploy, "to_cloud_run", rec)
+
+  agent_dir = tmp_path / "agent4"
+  agent_dir.mkdir()
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main, ["deploy", "cloud_run", option, str(agent_dir)]
+  )
+
+  assert result.exit_code != 0
+  assert "No such option" in result.output
+  assert not rec.calls
+
+
 # cli eval
 def test_cli_eval_missing_deps_raises(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -237,6 +257,81 @@ def test_cli_api_server_invokes_uvicorn(
   assert _patch_uvicorn.calls, "uvicorn.Server.run must be called"
 
 
+def test_cli_api_server_with_preload(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, _patch_uvicorn: _Recorder
+) -> None:
+  """`--preload` asks the app to warm up the agents at startup."""
+  agents_dir = tmp_path / "agents_api"
+  agents_dir.mkdir()
+  app_kwargs = []
+  monkeypatch.setattr(
+      cli_tools_click, "get_fast_api_app", lambda **k: app_kwargs.append(k)
+  )
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main, ["api_server", "--preload", str(agents_dir)]
+  )
+  assert result.exit_code == 0
+  assert app_kwargs[0]["preload"] is True
+
+
+def test_cli_api_server_with_workers_requires_shared_services(
+    tmp_path: Path, _patch_uvicorn: _Recorder
+) -> None:
+  """`--workers` needs session and artifact services shared by the workers."""
+  agents_dir = tmp_path / "agents_api"
+  agents_dir.mkdir()
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main, ["api_server", "--workers=2", str(agents_dir)]
+  )
+  assert result.exit_code != 0
+  assert "--session_service_uri" in result.output
+  assert not _patch_uvicorn.calls
+
+
+def test_cli_api_server_with_workers_runs_app_factory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  """`--workers` runs uvicorn workers that build the app from the env."""
+  agents_dir = tmp_path / "agents_api"
+  agents_dir.mkdir()
+  uvicorn_run = _Recorder()
+  monkeypatch.setattr(cli_tools_click.uvicorn, "run", uvicorn_run)
+  app_kwargs = []
+  monkeypatch.setattr(
+      cli_tools_click, "get_fast_api_app", lambda **k: app_kwargs.append(k)
+  )
+  monkeypatch.setenv(cli_tools_click._WORKER_CONFIG_ENV, "")
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main,
+      [
+          "api_server",
+          "--workers=4",
+          "--session_service_uri=sqlite:///sessions.db",
+          "--artifact_service_uri=file://artifacts",
+          str(agents_dir),
+      ],
+  )
+  assert result.exit_code == 0
+  (app,), kwargs = uvicorn_run.calls[0]
+  assert app == (
+      "google.adk.cli.cli_tools_click:_create_fast_api_app_for_worker"
+  )
+  assert kwargs["factory"] is True
+  assert kwargs["workers"] == 4
+
+  # The app is built once in the parent process, then in each worker.
+  assert len(app_kwargs) == 1
+  cli_tools_click._create_fast_api_app_for_worker()
+  assert len(app_kwargs) == 2
+  assert app_kwargs[1]["agents_dir"] == str(agents_dir)
+  assert app_kwargs[1]["session_service_uri"] == "sqlite:///sessions.db"
+  assert app_kwargs[1]["artifact_service_uri"] == "file://artifacts"
+  assert app_kwargs[1]["web"] is False
+
+
 def test_cli_eval_success_path(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
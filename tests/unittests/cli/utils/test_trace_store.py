@@ -0,0 +1,126 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the in-process trace store of the API server."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from google.adk.cli.utils.trace_store import TraceStore
+from google.adk.cli.utils.trace_store import TraceStoreSpanExporter
+from opentelemetry.sdk.trace import export
+from opentelemetry.sdk.trace import TracerProvider
+import pytest
+
+
+def _tracer(trace_store: TraceStore):
+  provider = TracerProvider()
+  provider.add_span_processor(
+      export.SimpleSpanProcessor(TraceStoreSpanExporter(trace_store))
+  )
+  return provider.get_tracer(__name__)
+
+
+def _run_invocation(tracer, session_id: str, event_id: str) -> None:
+  with tracer.start_as_current_span("invocation"):
+    with tracer.start_as_current_span("call_llm") as span:
+      span.set_attribute("gcp.vertex.agent.session_id", session_id)
+      span.set_attribute("gcp.vertex.agent.event_id", event_id)
+
+
+def test_lookups_by_session_and_event():
+  trace_store = TraceStore()
+  tracer = _tracer(trace_store)
+
+  _run_invocation(tracer, "session_1", "event_1")
+  _run_invocation(tracer, "session_2", "event_2")
+  _run_invocation(tracer, "session_1", "event_3")
+
+  spans = trace_store.get_session_spans("session_1")
+  assert [span.name for span in spans] == [
+      "call_llm",
+      "invocation",
+      "call_llm",
+      "invocation",
+  ]
+  assert len({span.context.trace_id for span in spans}) == 2
+
+  event_trace = trace_store.get_event_trace("event_2")
+  assert event_trace["gcp.vertex.agent.session_id"] == "session_2"
+  assert event_trace["trace_id"] == (
+      trace_store.get_session_spans("session_2")[0].context.trace_id
+  )
+  assert trace_store.get_event_trace("missing") is None
+  assert trace_store.get_session_spans("missing") == []
+
+
+def test_evicts_oldest_spans_beyond_max_spans():
+  trace_store = TraceStore(max_spans=3)
+  tracer = _tracer(trace_store)
+
+  _run_invocation(tracer, "session_1", "event_1")
+  _run_invocation(tracer, "session_2", "event_2")
+
+  assert len(trace_store) == 3
+  # Only the invocation span of the first trace is left.
+  assert [span.name for span in trace_store.get_session_spans("session_1")] == [
+      "invocation"
+  ]
+  assert trace_store.get_event_trace("event_1") is None
+  assert trace_store.get_event_trace("event_2") is not None
+
+  _run_invocation(tracer, "session_2", "event_3")
+
+  assert trace_store.get_session_spans("session_1") == []
+
+
+def test_evicts_spans_beyond_max_bytes():
+  trace_store = TraceStore(max_spans=None, max_bytes=1)
+  tracer = _tracer(trace_store)
+
+  _run_invocation(tracer, "session_1", "event_1")
+
+  assert len(trace_store) == 0
+  assert trace_store.get_session_spans("session_1") == []
+  assert trace_store.get_event_trace("event_1") is None
+
+
+def test_evicts_spans_beyond_max_age():
+  trace_store = TraceStore(max_age_seconds=10)
+  tracer = _tracer(trace_store)
+
+  with mock.patch("time.monotonic", return_value=100.0):
+    _run_invocation(tracer, "session_1", "event_1")
+  with mock.patch("time.monotonic", return_value=105.0):
+    _run_invocation(tracer, "session_2", "event_2")
+    assert trace_store.get_event_trace("event_1") is not None
+
+  with mock.patch("time.monotonic", return_value=111.0):
+    assert trace_store.get_event_trace("event_1") is None
+    assert trace_store.get_session_spans("session_1") == []
+    assert len(trace_store.get_session_spans("session_2")) == 2
+
+
+@pytest.mark.parametrize("span_name", ["send_data", "execute_tool my_tool"])
+def test_indexes_event_spans(span_name):
+  trace_store = TraceStore()
+  tracer = _tracer(trace_store)
+
+  with tracer.start_as_current_span(span_name) as span:
+    span.set_attribute("gcp.vertex.agent.event_id", "event_1")
+
+  assert trace_store.get_event_trace("event_1")["span_id"] == (
+      span.get_span_context().span_id
+  )
@@ -21,6 +21,7 @@ from google.adk.evaluation.final_response_match_v1 import _calculate_rouge_1_sco
 from google.adk.evaluation.final_response_match_v1 import RougeEvaluator
 from google.genai import types as genai_types
 import pytest
+from rouge_score import rouge_scorer
 
 
 def _create_test_rouge_evaluator(threshold: float) -> RougeEvaluator:
@@ -86,6 +87,28 @@ def test_calculate_rouge_1_scores():
   assert rouge_1_score.fmeasure == pytest.approx(8 / 11)
 
 
+@pytest.mark.parametrize(
+    "candidate, reference",
+    [
+        ("The runners were running quickly.", "A runner runs quick."),
+        ("hello hello world", "hello world world world"),
+        ("Numbers 123 and punctuation!", "numbers, 123; punctuation?"),
+        ("", "non-empty reference"),
+    ],
+)
+def test_calculate_rouge_1_scores_matches_rouge_scorer(
+    candidate: str, reference: str
+):
+  scorer = rouge_scorer.RougeScorer(["rouge1"], use_stemmer=True)
+  expected = scorer.score(reference, candidate)["rouge1"]
+
+  rouge_1_score = _calculate_rouge_1_scores(candidate, reference)
+
+  assert rouge_1_score.precision == pytest.approx(expected.precision)
+  assert rouge_1_score.recall == pytest.approx(expected.recall)
+  assert rouge_1_score.fmeasure == pytest.approx(expected.fmeasure)
+
+
 @pytest.mark.parametrize(
     "candidates, references, expected_score, expected_status",
     [
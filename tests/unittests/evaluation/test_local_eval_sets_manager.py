@@ -24,6 +24,8 @@ from google.adk.evaluation.eval_case import IntermediateData
 from google.adk.evaluation.eval_case import Invocation
 from google.adk.evaluation.eval_set import EvalSet
 from google.adk.evaluation.local_eval_sets_manager import _EVAL_SET_FILE_EXTENSION
+from google.adk.evaluation.local_eval_sets_manager import _JOURNAL_FILE_SUFFIX
+from google.adk.evaluation.local_eval_sets_manager import _load_eval_set_file
 from google.adk.evaluation.local_eval_sets_manager import convert_eval_set_to_pydanctic_schema
 from google.adk.evaluation.local_eval_sets_manager import load_eval_set_from_file
 from google.adk.evaluation.local_eval_sets_manager import LocalEvalSetsManager
@@ -32,6 +34,24 @@ from pydantic import ValidationError
 import pytest
 
 
+def _write_eval_set(agents_dir: str, app_name: str, eval_set: EvalSet) -> str:
+  os.makedirs(os.path.join(agents_dir, app_name), exist_ok=True)
+  eval_set_file_path = os.path.join(
+      agents_dir, app_name, eval_set.eval_set_id + _EVAL_SET_FILE_EXTENSION
+  )
+  with open(eval_set_file_path, "w", encoding="utf-8") as f:
+    f.write(eval_set.model_dump_json())
+  return eval_set_file_path
+
+
+_os_write = os.write
+
+
+def _write_partially(fd: int, data: bytes) -> int:
+  _os_write(fd, data[: len(data) // 2])
+  raise OSError("disk full")
+
+
 class TestConvertEvalSetToPydancticSchema:
   """Tests convert_eval_set_to_pydanctic_schema method."""
 
@@ -319,7 +339,7 @@ class TestLocalEvalSetsManager:
   """Tests for LocalEvalSetsManager."""
 
   @pytest.fixture
-  def local_eval_sets_manager(tmp_path):
+  def local_eval_sets_manager(self, tmp_path):
     agents_dir = str(tmp_path)
     return LocalEvalSetsManager(agents_dir=agents_dir)
 
@@ -330,7 +350,7 @@ class TestLocalEvalSetsManager:
     eval_set_id = "test_eval_set"
     mock_eval_set = EvalSet(eval_set_id=eval_set_id, eval_cases=[])
     mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.load_eval_set_from_file",
+        "google.adk.evaluation.local_eval_sets_manager._load_eval_set_file",
         return_value=mock_eval_set,
     )
     mocker.patch("os.path.exists", return_value=True)
@@ -345,7 +365,7 @@ class TestLocalEvalSetsManager:
     app_name = "test_app"
     eval_set_id = "test_eval_set"
     mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.load_eval_set_from_file",
+        "google.adk.evaluation.local_eval_sets_manager._load_eval_set_file",
         side_effect=FileNotFoundError,
     )
 
@@ -408,34 +428,30 @@ class TestLocalEvalSetsManager:
     assert eval_sets == ["eval_set_1", "eval_set_2"]
 
   def test_local_eval_sets_manager_add_eval_case_success(
-      self, local_eval_sets_manager, mocker
+      self, local_eval_sets_manager
   ):
     app_name = "test_app"
     eval_set_id = "test_eval_set"
     eval_case_id = "test_eval_case"
     mock_eval_case = EvalCase(eval_id=eval_case_id, conversation=[])
-    mock_eval_set = EvalSet(eval_set_id=eval_set_id, eval_cases=[])
-
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_set",
-        return_value=mock_eval_set,
-    )
-    mock_write_eval_set_to_path = mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager._write_eval_set_to_path"
+    eval_set_file_path = _write_eval_set(
+        local_eval_sets_manager._agents_dir,
+        app_name,
+        EvalSet(eval_set_id=eval_set_id, eval_cases=[]),
     )
 
     local_eval_sets_manager.add_eval_case(app_name, eval_set_id, mock_eval_case)
 
-    assert len(mock_eval_set.eval_cases) == 1
-    assert mock_eval_set.eval_cases[0] == mock_eval_case
-    expected_eval_set_file_path = os.path.join(
-        local_eval_sets_manager._agents_dir,
-        app_name,
-        eval_set_id + _EVAL_SET_FILE_EXTENSION,
+    expected_eval_set = EvalSet(
+        eval_set_id=eval_set_id, eval_cases=[mock_eval_case]
     )
-    mock_eval_set.eval_cases.append(mock_eval_case)
-    mock_write_eval_set_to_path.assert_called_once_with(
-        expected_eval_set_file_path, mock_eval_set
+    assert (
+        local_eval_sets_manager.get_eval_set(app_name, eval_set_id)
+        == expected_eval_set
+    )
+    assert (
+        load_eval_set_from_file(eval_set_file_path, eval_set_id)
+        == expected_eval_set
     )
 
   def test_local_eval_sets_manager_add_eval_case_eval_set_not_found(
@@ -459,19 +475,16 @@ class TestLocalEvalSetsManager:
       )
 
   def test_local_eval_sets_manager_add_eval_case_eval_case_id_exists(
-      self, local_eval_sets_manager, mocker
+      self, local_eval_sets_manager
   ):
     app_name = "test_app"
     eval_set_id = "test_eval_set"
     eval_case_id = "test_eval_case"
     mock_eval_case = EvalCase(eval_id=eval_case_id, conversation=[])
-    mock_eval_set = EvalSet(
-        eval_set_id=eval_set_id, eval_cases=[mock_eval_case]
-    )
-
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_set",
-        return_value=mock_eval_set,
+    _write_eval_set(
+        local_eval_sets_manager._agents_dir,
+        app_name,
+        EvalSet(eval_set_id=eval_set_id, eval_cases=[mock_eval_case]),
     )
 
     with pytest.raises(
@@ -486,19 +499,16 @@ class TestLocalEvalSetsManager:
       )
 
   def test_local_eval_sets_manager_get_eval_case_success(
-      self, local_eval_sets_manager, mocker
+      self, local_eval_sets_manager
   ):
     app_name = "test_app"
     eval_set_id = "test_eval_set"
     eval_case_id = "test_eval_case"
     mock_eval_case = EvalCase(eval_id=eval_case_id, conversation=[])
-    mock_eval_set = EvalSet(
-        eval_set_id=eval_set_id, eval_cases=[mock_eval_case]
-    )
-
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_set",
-        return_value=mock_eval_set,
+    _write_eval_set(
+        local_eval_sets_manager._agents_dir,
+        app_name,
+        EvalSet(eval_set_id=eval_set_id, eval_cases=[mock_eval_case]),
     )
 
     eval_case = local_eval_sets_manager.get_eval_case(
@@ -515,7 +525,7 @@ class TestLocalEvalSetsManager:
     eval_case_id = "test_eval_case"
 
     mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_set",
+        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager._get_cached_eval_set",
         return_value=None,
     )
 
@@ -526,16 +536,15 @@ class TestLocalEvalSetsManager:
     assert eval_case is None
 
   def test_local_eval_sets_manager_get_eval_case_eval_case_not_found(
-      self, local_eval_sets_manager, mocker
+      self, local_eval_sets_manager
   ):
     app_name = "test_app"
     eval_set_id = "test_eval_set"
     eval_case_id = "test_eval_case"
-    mock_eval_set = EvalSet(eval_set_id=eval_set_id, eval_cases=[])
-
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_set",
-        return_value=mock_eval_set,
+    _write_eval_set(
+        local_eval_sets_manager._agents_dir,
+        app_name,
+        EvalSet(eval_set_id=eval_set_id, eval_cases=[]),
     )
 
     eval_case = local_eval_sets_manager.get_eval_case(
@@ -545,7 +554,7 @@ class TestLocalEvalSetsManager:
     assert eval_case is None
 
   def test_local_eval_sets_manager_update_eval_case_success(
-      self, local_eval_sets_manager, mocker
+      self, local_eval_sets_manager
   ):
     app_name = "test_app"
     eval_set_id = "test_eval_set"
@@ -556,37 +565,19 @@ class TestLocalEvalSetsManager:
     updated_eval_case = EvalCase(
         eval_id=eval_case_id, conversation=[], creation_timestamp=123
     )
-    mock_eval_set = EvalSet(
-        eval_set_id=eval_set_id, eval_cases=[mock_eval_case]
-    )
-
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_set",
-        return_value=mock_eval_set,
-    )
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_case",
-        return_value=mock_eval_case,
-    )
-    mock_write_eval_set_to_path = mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager._write_eval_set_to_path"
+    _write_eval_set(
+        local_eval_sets_manager._agents_dir,
+        app_name,
+        EvalSet(eval_set_id=eval_set_id, eval_cases=[mock_eval_case]),
     )
 
     local_eval_sets_manager.update_eval_case(
         app_name, eval_set_id, updated_eval_case
     )
 
-    assert len(mock_eval_set.eval_cases) == 1
-    assert mock_eval_set.eval_cases[0] == updated_eval_case
-    expected_eval_set_file_path = os.path.join(
-        local_eval_sets_manager._agents_dir,
-        app_name,
-        eval_set_id + _EVAL_SET_FILE_EXTENSION,
-    )
-    mock_write_eval_set_to_path.assert_called_once_with(
-        expected_eval_set_file_path,
-        EvalSet(eval_set_id=eval_set_id, eval_cases=[updated_eval_case]),
-    )
+    assert local_eval_sets_manager.get_eval_set(
+        app_name, eval_set_id
+    ) == EvalSet(eval_set_id=eval_set_id, eval_cases=[updated_eval_case])
 
   def test_local_eval_sets_manager_update_eval_case_eval_set_not_found(
       self, local_eval_sets_manager, mocker
@@ -610,20 +601,16 @@ class TestLocalEvalSetsManager:
       )
 
   def test_local_eval_sets_manager_update_eval_case_eval_case_not_found(
-      self, local_eval_sets_manager, mocker
+      self, local_eval_sets_manager
   ):
     app_name = "test_app"
     eval_set_id = "test_eval_set"
     eval_case_id = "test_eval_case"
     updated_eval_case = EvalCase(eval_id=eval_case_id, conversation=[])
-    mock_eval_set = EvalSet(eval_set_id=eval_set_id, eval_cases=[])
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_set",
-        return_value=mock_eval_set,
-    )
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_case",
-        return_value=None,
+    _write_eval_set(
+        local_eval_sets_manager._agents_dir,
+        app_name,
+        EvalSet(eval_set_id=eval_set_id, eval_cases=[]),
     )
     with pytest.raises(
         NotFoundError,
@@ -636,42 +623,25 @@ class TestLocalEvalSetsManager:
       )
 
   def test_local_eval_sets_manager_delete_eval_case_success(
-      self, local_eval_sets_manager, mocker
+      self, local_eval_sets_manager
   ):
     app_name = "test_app"
     eval_set_id = "test_eval_set"
     eval_case_id = "test_eval_case"
     mock_eval_case = EvalCase(eval_id=eval_case_id, conversation=[])
-    mock_eval_set = EvalSet(
-        eval_set_id=eval_set_id, eval_cases=[mock_eval_case]
-    )
-
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_set",
-        return_value=mock_eval_set,
-    )
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_case",
-        return_value=mock_eval_case,
-    )
-    mock_write_eval_set_to_path = mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager._write_eval_set_to_path"
+    _write_eval_set(
+        local_eval_sets_manager._agents_dir,
+        app_name,
+        EvalSet(eval_set_id=eval_set_id, eval_cases=[mock_eval_case]),
     )
 
     local_eval_sets_manager.delete_eval_case(
         app_name, eval_set_id, eval_case_id
     )
 
-    assert len(mock_eval_set.eval_cases) == 0
-    expected_eval_set_file_path = os.path.join(
-        local_eval_sets_manager._agents_dir,
-        app_name,
-        eval_set_id + _EVAL_SET_FILE_EXTENSION,
-    )
-    mock_write_eval_set_to_path.assert_called_once_with(
-        expected_eval_set_file_path,
-        EvalSet(eval_set_id=eval_set_id, eval_cases=[]),
-    )
+    assert local_eval_sets_manager.get_eval_set(
+        app_name, eval_set_id
+    ) == EvalSet(eval_set_id=eval_set_id, eval_cases=[])
 
   def test_local_eval_sets_manager_delete_eval_case_eval_set_not_found(
       self, local_eval_sets_manager, mocker
@@ -699,19 +669,15 @@ class TestLocalEvalSetsManager:
     mock_write_eval_set_to_path.assert_not_called()
 
   def test_local_eval_sets_manager_delete_eval_case_eval_case_not_found(
-      self, local_eval_sets_manager, mocker
+      self, local_eval_sets_manager
   ):
     app_name = "test_app"
     eval_set_id = "test_eval_set"
     eval_case_id = "test_eval_case"
-    mock_eval_set = EvalSet(eval_set_id=eval_set_id, eval_cases=[])
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_set",
-        return_value=mock_eval_set,
-    )
-    mocker.patch(
-        "google.adk.evaluation.local_eval_sets_manager.LocalEvalSetsManager.get_eval_case",
-        return_value=None,
+    _write_eval_set(
+        local_eval_sets_manager._agents_dir,
+        app_name,
+        EvalSet(eval_set_id=eval_set_id, eval_cases=[]),
     )
     with pytest.raises(
         NotFoundError,
@@ -722,3 +688,250 @@ class TestLocalEvalSetsManager:
       local_eval_sets_manager.delete_eval_case(
           app_name, eval_set_id, eval_case_id
       )
+
+  def test_local_eval_sets_manager_caches_eval_set(self, tmp_path, mocker):
+    local_eval_sets_manager = LocalEvalSetsManager(agents_dir=str(tmp_path))
+    app_name = "test_app"
+    eval_set_id = "test_eval_set"
+    os.makedirs(tmp_path / app_name)
+    local_eval_sets_manager.create_eval_set(app_name, eval_set_id)
+    local_eval_sets_manager.add_eval_case(
+        app_name,
+        eval_set_id,
+        EvalCase(eval_id="test_eval_case", conversation=[]),
+    )
+    load_spy = mocker.patch(
+        "google.adk.evaluation.local_eval_sets_manager._load_eval_set_file",
+        wraps=_load_eval_set_file,
+    )
+
+    eval_case = local_eval_sets_manager.get_eval_case(
+        app_name, eval_set_id, "test_eval_case"
+    )
+    local_eval_sets_manager.get_eval_set(app_name, eval_set_id)
+
+    assert eval_case.eval_id == "test_eval_case"
+    load_spy.assert_not_called()
+
+  def test_local_eval_sets_manager_reloads_eval_set_changed_on_disk(
+      self, tmp_path
+  ):
+    local_eval_sets_manager = LocalEvalSetsManager(agents_dir=str(tmp_path))
+    app_name = "test_app"
+    eval_set_id = "test_eval_set"
+    os.makedirs(tmp_path / app_name)
+    local_eval_sets_manager.create_eval_set(app_name, eval_set_id)
+    assert local_eval_sets_manager.get_eval_set(app_name, eval_set_id)
+
+    # Another process updates the eval set file.
+    LocalEvalSetsManager(agents_dir=str(tmp_path)).add_eval_case(
+        app_name,
+        eval_set_id,
+        EvalCase(eval_id="test_eval_case", conversation=[]),
+    )
+
+    eval_set = local_eval_sets_manager.get_eval_set(app_name, eval_set_id)
+    assert [e.eval_id for e in eval_set.eval_cases] == ["test_eval_case"]
+
+  def test_local_eval_sets_manager_failed_write_keeps_file(
+      self, tmp_path, mocker
+  ):
+    local_eval_sets_manager = LocalEvalSetsManager(agents_dir=str(tmp_path))
+    app_name = "test_app"
+    eval_set_id = "test_eval_set"
+    os.makedirs(tmp_path / app_name)
+    local_eval_sets_manager.create_eval_set(app_name, eval_set_id)
+    local_eval_sets_manager.add_eval_case(
+        app_name,
+        eval_set_id,
+        EvalCase(eval_id="test_eval_case_1", conversation=[]),
+    )
+    mocker.patch(
+        "google.adk.evaluation.local_eval_sets_manager.os.write",
+        side_effect=_write_partially,
+    )
+
+    with pytest.raises(OSError):
+      local_eval_sets_manager.add_eval_case(
+          app_name,
+          eval_set_id,
+          EvalCase(eval_id="test_eval_case_2", conversation=[]),
+      )
+    mocker.stopall()
+    local_eval_sets_manager.add_eval_case(
+        app_name,
+        eval_set_id,
+        EvalCase(eval_id="test_eval_case_3", conversation=[]),
+    )
+
+    eval_set = LocalEvalSetsManager(agents_dir=str(tmp_path)).get_eval_set(
+        app_name, eval_set_id
+    )
+    assert [e.eval_id for e in eval_set.eval_cases] == [
+        "test_eval_case_1",
+        "test_eval_case_3",
+    ]
+
+  def test_local_eval_sets_manager_returns_copies_of_cached_eval_set(
+      self, tmp_path
+  ):
+    local_eval_sets_manager = LocalEvalSetsManager(agents_dir=str(tmp_path))
+    app_name = "test_app"
+    eval_set_id = "test_eval_set"
+    os.makedirs(tmp_path / app_name)
+    local_eval_sets_manager.create_eval_set(app_name, eval_set_id)
+    local_eval_sets_manager.add_eval_case(
+        app_name,
+        eval_set_id,
+        EvalCase(eval_id="test_eval_case", conversation=[]),
+    )
+
+    eval_set = local_eval_sets_manager.get_eval_set(app_name, eval_set_id)
+    eval_set.eval_cases.clear()
+    eval_case = local_eval_sets_manager.get_eval_case(
+        app_name, eval_set_id, "test_eval_case"
+    )
+    eval_case.eval_id = "changed"
+
+    eval_set = local_eval_sets_manager.get_eval_set(app_name, eval_set_id)
+    assert [e.eval_id for e in eval_set.eval_cases] == ["test_eval_case"]
+
+  def test_local_eval_sets_manager_failed_write_keeps_cached_eval_set(
+      self, tmp_path, mocker
+  ):
+    local_eval_sets_manager = LocalEvalSetsManager(agents_dir=str(tmp_path))
+    app_name = "test_app"
+    eval_set_id = "test_eval_set"
+    os.makedirs(tmp_path / app_name)
+    local_eval_sets_manager.create_eval_set(app_name, eval_set_id)
+    assert local_eval_sets_manager.get_eval_set(app_name, eval_set_id)
+    mocker.patch(
+        "google.adk.evaluation.local_eval_sets_manager.os.write",
+        side_effect=_write_partially,
+    )
+    load_spy = mocker.patch(
+        "google.adk.evaluation.local_eval_sets_manager._load_eval_set_file",
+        wraps=_load_eval_set_file,
+    )
+
+    with pytest.raises(OSError):
+      local_eval_sets_manager.add_eval_case(
+          app_name,
+          eval_set_id,
+          EvalCase(eval_id="test_eval_case", conversation=[]),
+      )
+
+    eval_set = local_eval_sets_manager.get_eval_set(app_name, eval_set_id)
+    assert not eval_set.eval_cases
+    load_spy.assert_not_called()
+
+  def test_local_eval_sets_manager_caches_eval_set_ids(self, tmp_path, mocker):
+    local_eval_sets_manager = LocalEvalSetsManager(agents_dir=str(tmp_path))
+    app_name = "test_app"
+    os.makedirs(tmp_path / app_name)
+    local_eval_sets_manager.create_eval_set(app_name, "eval_set_2")
+    local_eval_sets_manager.create_eval_set(app_name, "eval_set_1")
+    assert local_eval_sets_manager.list_eval_sets(app_name) == [
+        "eval_set_1",
+        "eval_set_2",
+    ]
+    listdir_spy = mocker.patch(
+        "google.adk.evaluation.local_eval_sets_manager.os.listdir",
+        wraps=os.listdir,
+    )
+
+    assert local_eval_sets_manager.list_eval_sets(app_name) == [
+        "eval_set_1",
+        "eval_set_2",
+    ]
+    listdir_spy.assert_not_called()
+
+    os.remove(tmp_path / app_name / ("eval_set_2" + _EVAL_SET_FILE_EXTENSION))
+    assert local_eval_sets_manager.list_eval_sets(app_name) == ["eval_set_1"]
+    listdir_spy.assert_called_once()
+
+  def test_local_eval_sets_manager_appends_changes_to_journal(self, tmp_path):
+    local_eval_sets_manager = LocalEvalSetsManager(agents_dir=str(tmp_path))
+    app_name = "test_app"
+    eval_set_id = "test_eval_set"
+    eval_set_file_path = _write_eval_set(
+        str(tmp_path),
+        app_name,
+        EvalSet(
+            eval_set_id=eval_set_id,
+            eval_cases=[EvalCase(eval_id="eval_case_1", conversation=[])],
+        ),
+    )
+    with open(eval_set_file_path, encoding="utf-8") as f:
+      eval_set_file_content = f.read()
+
+    local_eval_sets_manager.add_eval_case(
+        app_name,
+        eval_set_id,
+        EvalCase(eval_id="eval_case_2", conversation=[]),
+    )
+    local_eval_sets_manager.update_eval_case(
+        app_name,
+        eval_set_id,
+        EvalCase(eval_id="eval_case_1", conversation=[], creation_timestamp=1),
+    )
+    local_eval_sets_manager.delete_eval_case(
+        app_name, eval_set_id, "eval_case_2"
+    )
+
+    with open(eval_set_file_path, encoding="utf-8") as f:
+      assert f.read() == eval_set_file_content
+    with open(eval_set_file_path + _JOURNAL_FILE_SUFFIX, encoding="utf-8") as f:
+      assert len(f.readlines()) == 3
+    expected_eval_set = EvalSet(
+        eval_set_id=eval_set_id,
+        eval_cases=[
+            EvalCase(
+                eval_id="eval_case_1", conversation=[], creation_timestamp=1
+            )
+        ],
+    )
+    assert (
+        local_eval_sets_manager.get_eval_set(app_name, eval_set_id)
+        == expected_eval_set
+    )
+    assert (
+        load_eval_set_from_file(eval_set_file_path, eval_set_id)
+        == expected_eval_set
+    )
+
+  def test_local_eval_sets_manager_compacts_journal(self, tmp_path, mocker):
+    mocker.patch(
+        "google.adk.evaluation.local_eval_sets_manager._MIN_JOURNAL_RECORDS_TO_COMPACT",
+        3,
+    )
+    local_eval_sets_manager = LocalEvalSetsManager(agents_dir=str(tmp_path))
+    app_name = "test_app"
+    eval_set_id = "test_eval_set"
+    os.makedirs(tmp_path / app_name)
+    local_eval_sets_manager.create_eval_set(app_name, eval_set_id)
+    eval_set_file_path = local_eval_sets_manager._get_eval_set_file_path(
+        app_name, eval_set_id
+    )
+
+    for i in range(4):
+      local_eval_sets_manager.add_eval_case(
+          app_name,
+          eval_set_id,
+          EvalCase(eval_id=f"eval_case_{i}", conversation=[]),
+      )
+      assert os.path.exists(eval_set_file_path + _JOURNAL_FILE_SUFFIX) == (
+          i != 2
+      )
+
+    expected_eval_case_ids = [f"eval_case_{i}" for i in range(4)]
+    assert [
+        e.eval_id
+        for e in _load_eval_set_file(eval_set_file_path, "").eval_cases
+    ] == expected_eval_case_ids[:3]
+    for eval_sets_manager in (
+        local_eval_sets_manager,
+        LocalEvalSetsManager(agents_dir=str(tmp_path)),
+    ):
+      eval_set = eval_sets_manager.get_eval_set(app_name, eval_set_id)
+      assert [e.eval_id for e in eval_set.eval_cases] == expected_eval_case_ids
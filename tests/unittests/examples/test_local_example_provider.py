@@ -0,0 +1,99 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.examples import example_util
+from google.adk.examples import LocalExampleProvider
+from google.adk.examples.example import Example
+from google.genai import types
+import pytest
+
+
+def _example(query: str, answer: str) -> Example:
+  return Example(
+      input=types.Content(role="user", parts=[types.Part(text=query)]),
+      output=[types.Content(role="model", parts=[types.Part(text=answer)])],
+  )
+
+
+def _examples() -> list[Example]:
+  return [
+      _example("What is the weather in Paris?", "Sunny."),
+      _example("Book a flight to Paris", "Booked."),
+      _example("What is the weather in Tokyo today?", "Rainy."),
+      _example("Cancel my order", "Cancelled."),
+  ]
+
+
+def test_get_examples_ranks_by_relevance():
+  """The examples sharing the rarest words with the query come first."""
+  examples = _examples()
+  provider = LocalExampleProvider(examples, top_k=2)
+
+  assert provider.get_examples("weather in Tokyo") == [
+      examples[2],
+      examples[0],
+  ]
+
+
+def test_get_examples_without_match():
+  """No example is returned if no example shares a word with the query."""
+  provider = LocalExampleProvider(_examples())
+
+  assert not provider.get_examples("hello")
+  assert not provider.get_examples("")
+  assert example_util.build_example_si(provider, "hello", None) == ""
+
+
+def test_build_example_si_renders_examples_once():
+  """The examples of a provider are rendered once, when it's built."""
+  with mock.patch.object(
+      example_util,
+      "_render_example",
+      wraps=example_util._render_example,
+  ) as mock_render:
+    provider = LocalExampleProvider(_examples(), top_k=1)
+    first = example_util.build_example_si(provider, "order", "gemini-2.0")
+    second = example_util.build_example_si(provider, "order", "gemini-2.0")
+    example_util.build_example_si(provider, "order", "gemini-1.5")
+
+  assert first == second
+  assert "[user]\nCancel my order\n[model]\nCancelled.\n" in first
+  # Once per example and model family.
+  assert mock_render.call_count == 2 * len(provider.examples)
+
+
+@pytest.mark.parametrize("model", [None, "gemini-1.5", "gemini-2.0"])
+def test_build_example_si_matches_rendered_examples(model):
+  """The pre-rendered examples match the examples rendered on demand."""
+  provider = LocalExampleProvider(_examples(), top_k=2)
+
+  assert example_util.build_example_si(
+      provider, "weather in Tokyo", model
+  ) == example_util.convert_examples_to_text(
+      provider.get_examples("weather in Tokyo"), model
+  )
+
+
+def test_build_example_si_renders_modified_example_again():
+  """A modified example is not rendered from the cache."""
+  examples = [_example("Cancel my order", "Cancelled.")]
+  first = example_util.build_example_si(examples, "order", None)
+
+  examples[0].output[0].parts[0].text = "Not cancelled."
+  second = example_util.build_example_si(examples, "order", None)
+
+  assert "Cancelled." in first
+  assert "Not cancelled." in second
@@ -0,0 +1,96 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.agents.transcription_entry import TranscriptionEntry
+from google.adk.flows.llm_flows.audio_transcriber import AudioTranscriber
+from google.cloud import speech
+from google.genai import types
+import pytest
+
+
+def _audio(role: str, data: bytes) -> TranscriptionEntry:
+  return TranscriptionEntry(
+      role=role, data=types.Blob(data=data, mime_type='audio/pcm')
+  )
+
+
+def _recognize(config, audio):
+  return speech.RecognizeResponse(
+      results=[
+          speech.SpeechRecognitionResult(
+              alternatives=[
+                  speech.SpeechRecognitionAlternative(
+                      transcript=audio.content.decode()
+                  )
+              ]
+          )
+      ]
+  )
+
+
+@pytest.fixture
+def transcriber():
+  transcriber = AudioTranscriber()
+  transcriber.client = mock.Mock()
+  transcriber.client.recognize.side_effect = _recognize
+  return transcriber
+
+
+@pytest.fixture
+def invocation_context():
+  model_content = types.Content(
+      role='model', parts=[types.Part(text='model text')]
+  )
+  invocation_context = mock.Mock()
+  invocation_context.transcription_cache = [
+      _audio('user', b'hello '),
+      _audio('user', b'world'),
+      TranscriptionEntry(role='model', data=model_content),
+      _audio('user', b'bye'),
+  ]
+  return invocation_context
+
+
+def _texts(contents: list[types.Content]) -> list[tuple[str, str]]:
+  return [(content.role, content.parts[0].text) for content in contents]
+
+
+def test_transcribe_file_bundles_consecutive_audio(
+    transcriber, invocation_context
+):
+  contents = transcriber.transcribe_file(invocation_context)
+
+  assert _texts(contents) == [
+      ('user', 'hello world'),
+      ('model', 'model text'),
+      ('user', 'bye'),
+  ]
+  assert transcriber.client.recognize.call_count == 2
+  assert invocation_context.transcription_cache == []
+
+
+@pytest.mark.asyncio
+async def test_transcribe_file_async_preserves_order(
+    transcriber, invocation_context
+):
+  contents = await transcriber.transcribe_file_async(invocation_context)
+
+  assert _texts(contents) == [
+      ('user', 'hello world'),
+      ('model', 'model text'),
+      ('user', 'bye'),
+  ]
+  assert invocation_context.transcription_cache == []
@@ -0,0 +1,56 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.models._streaming_utils import JsonAccumulator
+from google.adk.models._streaming_utils import TextAccumulator
+import pytest
+
+
+def test_text_accumulator_pop_resets():
+  text = TextAccumulator()
+  assert not text
+
+  text.append("Hello")
+  text.append("")
+  text.append(" world")
+
+  assert text
+  assert text.text == "Hello world"
+  assert text.pop() == "Hello world"
+  assert not text
+  assert text.pop() == ""
+
+
+@pytest.mark.parametrize(
+    "fragments, completions",
+    [
+        (['{"a": ', '"b"', "}"], [False, False, True]),
+        (['{"a": "}', '{"', "}"], [False, False, True]),
+        (['{"a": "\\"}', '"}'], [False, True]),
+        (['{"a": [1, ', "2]}"], [False, True]),
+        (["{}", "\n"], [True, True]),
+        (['{"a": }'], [False]),
+        (["12", "3"], [True, True]),
+    ],
+)
+def test_json_accumulator_is_complete(fragments, completions):
+  args = JsonAccumulator()
+
+  actual = []
+  for fragment in fragments:
+    args.append(fragment)
+    actual.append(args.is_complete())
+
+  assert actual == completions
+  assert args.text == "".join(fragments)
@@ -0,0 +1,94 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests that heavy optional integrations are imported lazily."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_MODULES = (
+    'docker',
+    'google.cloud.aiplatform',
+    'llama_index',
+    'sqlalchemy',
+    'vertexai',
+)
+
+
+def _imported_heavy_modules(statement: str) -> list[str]:
+  """Runs the import statement in a fresh interpreter."""
+  code = (
+      'import json, sys\n'
+      f'{statement}\n'
+      f'print(json.dumps([m for m in {_HEAVY_MODULES!r} if m in'
+      ' sys.modules]))'
+  )
+  output = subprocess.run(
+      [sys.executable, '-c', code],
+      check=True,
+      capture_output=True,
+      text=True,
+  ).stdout
+  return json.loads(output.splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_modules():
+  statement = '''
+import google.adk
+import google.adk.agents
+import google.adk.code_executors
+import google.adk.examples
+import google.adk.memory
+import google.adk.sessions
+import google.adk.tools
+'''
+
+  assert _imported_heavy_modules(statement) == []
+
+
+@pytest.mark.parametrize(
+    'module_name, attribute',
+    [
+        ('google.adk.code_executors', 'VertexAiCodeExecutor'),
+        ('google.adk.examples', 'VertexAiExampleStore'),
+        ('google.adk.memory', 'VertexAiMemoryBankService'),
+        ('google.adk.memory', 'VertexAiRagMemoryService'),
+        ('google.adk.sessions', 'DatabaseSessionService'),
+        ('google.adk.sessions', 'VertexAiSessionService'),
+        ('google.adk.tools', 'APIHubToolset'),
+        ('google.adk.tools', 'ExampleTool'),
+    ],
+)
+def test_lazy_attribute_is_importable(module_name, attribute):
+  module = __import__(module_name, fromlist=[attribute])
+
+  assert getattr(module, attribute).__name__ == attribute
+
+
+def test_unknown_attribute_raises_attribute_error():
+  import google.adk.tools
+
+  with pytest.raises(AttributeError):
+    google.adk.tools.NotATool
+
+
+def test_lazy_attribute_is_set_on_package():
+  import google.adk.examples
+
+  value = google.adk.examples.VertexAiExampleStore
+
+  assert vars(google.adk.examples)['VertexAiExampleStore'] is value
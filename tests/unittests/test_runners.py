@@ -12,16 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from typing import Optional
+from unittest import mock
 
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
 from google.adk.events.event import Event
+from google.adk.models.google_llm import Gemini
 from google.adk.runners import Runner
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.sessions.session import Session
+from google.adk.tools.base_toolset import BaseToolset
 from google.genai import types
+import pytest
 
 
 class MockAgent(BaseAgent):
@@ -290,21 +295,216 @@ class TestRunnerFindAgentToRun:
     result = self.runner._find_agent_to_run(session, self.root_agent)
     assert result == self.sub_agent2
 
-  def test_is_transferable_across_agent_tree_with_llm_agent(self):
-    """Test _is_transferable_across_agent_tree with LLM agent."""
-    result = self.runner._is_transferable_across_agent_tree(self.sub_agent1)
-    assert result is True
 
-  def test_is_transferable_across_agent_tree_with_non_transferable_agent(self):
-    """Test _is_transferable_across_agent_tree with non-transferable agent."""
-    result = self.runner._is_transferable_across_agent_tree(
-        self.non_transferable_agent
+class LoopRecordingAgent(BaseAgent):
+  """Mock agent that records the event loop it runs on."""
+
+  loops: list = []
+
+  async def _run_async_impl(self, invocation_context):
+    self.loops.append(asyncio.get_running_loop())
+    yield Event(
+        invocation_id=invocation_context.invocation_id,
+        author=self.name,
+        content=types.Content(
+            role="model", parts=[types.Part(text="Test response")]
+        ),
+    )
+
+
+class TestRunnerSyncRun:
+  """Tests for the sync Runner.run API."""
+
+  def setup_method(self):
+    """Set up test fixtures."""
+    self.session_service = InMemorySessionService()
+    self.agent = LoopRecordingAgent(name="root_agent")
+    self.agent.loops = []
+    self.runner = Runner(
+        app_name="test_app",
+        agent=self.agent,
+        session_service=self.session_service,
+    )
+    self.session = asyncio.run(
+        self.session_service.create_session(
+            app_name="test_app", user_id="test_user"
+        )
+    )
+
+  def _run_once(self):
+    return list(
+        self.runner.run(
+            user_id="test_user",
+            session_id=self.session.id,
+            new_message=types.Content(
+                role="user", parts=[types.Part(text="hi")]
+            ),
+        )
     )
-    assert result is False
-
-  def test_is_transferable_across_agent_tree_with_non_llm_agent(self):
-    """Test _is_transferable_across_agent_tree with non-LLM agent."""
-    non_llm_agent = MockAgent("non_llm_agent")
-    # MockAgent inherits from BaseAgent, not LlmAgent, so it should return False
-    result = self.runner._is_transferable_across_agent_tree(non_llm_agent)
-    assert result is False
+
+  def test_run_reuses_background_loop(self):
+    """Consecutive sync runs share one event loop."""
+    events1 = self._run_once()
+    events2 = self._run_once()
+
+    assert [e.author for e in events1] == ["root_agent"]
+    assert [e.author for e in events2] == ["root_agent"]
+    assert len(self.agent.loops) == 2
+    assert self.agent.loops[0] is self.agent.loops[1]
+
+    asyncio.run(self.runner.close())
+
+  def test_close_shuts_down_background_loop(self):
+    """Closing the runner stops the loop and a new run starts a fresh one."""
+    self._run_once()
+    loop = self.runner._loop
+    thread = self.runner._loop_thread
+
+    asyncio.run(self.runner.close())
+
+    assert self.runner._loop is None
+    assert not thread.is_alive()
+    assert loop.is_closed()
+
+    self._run_once()
+    assert self.agent.loops[1] is not loop
+
+    asyncio.run(self.runner.close())
+
+  def test_run_raises_errors_from_agent(self):
+    """Errors raised while running the agent surface to the sync caller."""
+    with pytest.raises(ValueError, match="Session not found"):
+      list(
+          self.runner.run(
+              user_id="test_user",
+              session_id="missing",
+              new_message=types.Content(
+                  role="user", parts=[types.Part(text="hi")]
+              ),
+          )
+      )
+
+    asyncio.run(self.runner.close())
+
+
+class TestRunnerRunAsyncWithSession:
+  """Tests for Runner.run_async with a session fetched by the caller."""
+
+  def setup_method(self):
+    """Set up test fixtures."""
+    self.session_service = InMemorySessionService()
+    self.runner = Runner(
+        app_name="test_app",
+        agent=MockAgent(name="root_agent"),
+        session_service=self.session_service,
+    )
+
+  async def _run(self, session: Session, user_id: str, session_id: str):
+    return [
+        event
+        async for event in self.runner.run_async(
+            user_id=user_id,
+            session_id=session_id,
+            new_message=types.Content(
+                role="user", parts=[types.Part(text="hi")]
+            ),
+            session=session,
+        )
+    ]
+
+  @pytest.mark.asyncio
+  async def test_run_async_does_not_fetch_given_session(self):
+    """The session passed by the caller is used without fetching it again."""
+    session = await self.session_service.create_session(
+        app_name="test_app", user_id="test_user"
+    )
+    with mock.patch.object(
+        self.session_service,
+        "get_session",
+        side_effect=AssertionError("unexpected get_session"),
+    ):
+      events = await self._run(session, "test_user", session.id)
+
+    assert [event.author for event in events] == ["root_agent"]
+    assert [event.author for event in session.events] == [
+        "user",
+        "root_agent",
+    ]
+
+  @pytest.mark.asyncio
+  async def test_run_async_rejects_mismatched_session(self):
+    """The session passed by the caller must match the user and session ids."""
+    session = await self.session_service.create_session(
+        app_name="test_app", user_id="test_user"
+    )
+
+    with pytest.raises(ValueError, match="does not match"):
+      await self._run(session, "other_user", session.id)
+
+
+class MockToolset(BaseToolset):
+  """Mock toolset for unit testing."""
+
+  def __init__(self):
+    super().__init__()
+    self.get_tools_calls = 0
+
+  async def get_tools(self, readonly_context=None):
+    self.get_tools_calls += 1
+    return []
+
+  async def close(self):
+    pass
+
+
+def _get_weather(city: str) -> str:
+  """Gets the weather in a city."""
+  return f"Sunny in {city}."
+
+
+class TestRunnerWarmup:
+  """Tests for Runner.warmup method."""
+
+  @pytest.mark.asyncio
+  async def test_warmup_prepares_llm_agents(self):
+    """The models and tools of all LLM agents in the tree are prepared."""
+    toolset = MockToolset()
+    sub_agent = LlmAgent(name="sub_agent", tools=[_get_weather, toolset])
+    root_agent = LlmAgent(
+        name="root_agent",
+        model="gemini-1.5-pro",
+        sub_agents=[MockAgent(name="other_agent"), sub_agent],
+    )
+    runner = Runner(
+        app_name="test_app",
+        agent=root_agent,
+        session_service=InMemorySessionService(),
+    )
+
+    with mock.patch.object(Gemini, "warmup") as mock_warmup:
+      timings = await runner.warmup()
+
+    assert list(timings) == [
+        "agent_tree",
+        "root_agent.model",
+        "root_agent.tools",
+        "sub_agent.model",
+        "sub_agent.tools",
+    ]
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert mock_warmup.await_count == 2
+    assert toolset.get_tools_calls == 1
+    # The warmed up model is the one used by the runs.
+    assert sub_agent.canonical_model is root_agent.canonical_model
+
+  @pytest.mark.asyncio
+  async def test_warmup_raises_for_invalid_agent(self):
+    """Errors in the agent tree are raised by the warm-up."""
+    runner = Runner(
+        app_name="test_app",
+        agent=LlmAgent(name="root_agent"),
+        session_service=InMemorySessionService(),
+    )
+
+    with pytest.raises(ValueError, match="No model found"):
+      await runner.warmup()
@@ -23,6 +23,9 @@ from google.adk.agents.llm_agent import LlmAgent
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 from google.adk.sessions import InMemorySessionService
+from google.adk.telemetry import get_telemetry_config
+from google.adk.telemetry import set_telemetry_config
+from google.adk.telemetry import TelemetryConfig
 from google.adk.telemetry import trace_call_llm
 from google.adk.telemetry import trace_merged_tool_calls
 from google.adk.telemetry import trace_tool_call
@@ -47,6 +50,20 @@ def mock_span_fixture():
   return mock.MagicMock()
 
 
+@pytest.fixture
+def telemetry_config_fixture():
+  original_config = get_telemetry_config()
+  yield
+  set_telemetry_config(original_config)
+
+
+def _span_attributes(span: mock.MagicMock) -> dict[str, Any]:
+  return {
+      call_obj.args[0]: call_obj.args[1]
+      for call_obj in span.set_attribute.call_args_list
+  }
+
+
 @pytest.fixture
 def mock_tool_fixture():
   tool = mock.Mock(spec=BaseTool)
@@ -324,3 +341,117 @@ def test_trace_merged_tool_calls_sets_correct_attributes(
       expected_calls, any_order=True
   )
   mock_event_fixture.model_dumps_json.assert_called_once_with(exclude_none=True)
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_skips_non_recording_span(
+    monkeypatch, mock_span_fixture
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  mock_span_fixture.is_recording.return_value = False
+  llm_response = mock.create_autospec(LlmResponse, instance=True)
+
+  agent = LlmAgent(name='test_agent')
+  invocation_context = await _create_invocation_context(agent)
+  trace_call_llm(
+      invocation_context, 'test_event_id', LlmRequest(), llm_response
+  )
+
+  mock_span_fixture.set_attribute.assert_not_called()
+  llm_response.model_dump_json.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_records_only_metadata(
+    monkeypatch, mock_span_fixture, telemetry_config_fixture
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  set_telemetry_config(TelemetryConfig(capture_payloads=False))
+
+  agent = LlmAgent(name='test_agent')
+  invocation_context = await _create_invocation_context(agent)
+  llm_request = LlmRequest(
+      model='test_model',
+      contents=[types.Content(role='user', parts=[types.Part(text='hi')])],
+  )
+  llm_response = LlmResponse(
+      content=types.Content(role='model', parts=[types.Part(text='hello')]),
+      usage_metadata=types.GenerateContentResponseUsageMetadata(
+          total_token_count=100, prompt_token_count=50
+      ),
+  )
+  trace_call_llm(invocation_context, 'test_event_id', llm_request, llm_response)
+
+  attributes = _span_attributes(mock_span_fixture)
+  assert attributes['gen_ai.request.model'] == 'test_model'
+  assert attributes['gen_ai.usage.input_tokens'] == 50
+  assert attributes['gcp.vertex.agent.llm_request'] == '{}'
+  assert attributes['gcp.vertex.agent.llm_response'] == '{}'
+
+
+def test_trace_tool_call_samples_payloads(
+    monkeypatch,
+    mock_span_fixture,
+    mock_tool_fixture,
+    mock_event_fixture,
+    telemetry_config_fixture,
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  set_telemetry_config(TelemetryConfig(payload_sample_rate=0.0))
+  mock_event_fixture.id = 'event_id'
+  mock_event_fixture.content = types.Content(
+      role='user',
+      parts=[
+          types.Part(
+              function_response=types.FunctionResponse(
+                  id='tool_call_id', name='sample_tool', response={'a': 1}
+              )
+          ),
+      ],
+  )
+
+  trace_tool_call(
+      tool=mock_tool_fixture,
+      args={'query': 'details'},
+      function_response_event=mock_event_fixture,
+  )
+
+  attributes = _span_attributes(mock_span_fixture)
+  assert attributes['gen_ai.tool.name'] == 'sample_tool'
+  assert attributes['gen_ai.tool.call.id'] == 'tool_call_id'
+  assert attributes['gcp.vertex.agent.tool_call_args'] == '{}'
+  assert attributes['gcp.vertex.agent.tool_response'] == '{}'
+
+
+def test_trace_tool_call_truncates_payloads(
+    monkeypatch,
+    mock_span_fixture,
+    mock_tool_fixture,
+    mock_event_fixture,
+    telemetry_config_fixture,
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  set_telemetry_config(TelemetryConfig(max_payload_length=10))
+  mock_event_fixture.id = 'event_id'
+  mock_event_fixture.content = types.Content(role='user', parts=[])
+  args = {'query': 'x' * 100}
+
+  trace_tool_call(
+      tool=mock_tool_fixture,
+      args=args,
+      function_response_event=mock_event_fixture,
+  )
+
+  attributes = _span_attributes(mock_span_fixture)
+  assert (
+      attributes['gcp.vertex.agent.tool_call_args']
+      == json.dumps(args)[:10] + '...<truncated>'
+  )
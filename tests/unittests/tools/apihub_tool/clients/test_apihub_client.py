@@ -17,6 +17,7 @@ import json
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+from google.adk.tools.apihub_tool.clients import apihub_client
 from google.adk.tools.apihub_tool.clients.apihub_client import APIHubClient
 import pytest
 from requests.exceptions import HTTPError
@@ -43,6 +44,13 @@ MOCK_API_VERSION = {
 MOCK_SPEC_CONTENT = {"contents": base64.b64encode(b"spec content").decode()}
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_credentials():
+  apihub_client._credentials_by_service_account.clear()
+  yield
+  apihub_client._credentials_by_service_account.clear()
+
+
 # Test cases
 class TestAPIHubClient:
 
@@ -60,7 +68,7 @@ class TestAPIHubClient:
         "private_key": "1234",
     })
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_list_apis(self, mock_get, client):
     mock_get.return_value.json.return_value = MOCK_API_LIST
     mock_get.return_value.status_code = 200
@@ -75,7 +83,7 @@ class TestAPIHubClient:
         },
     )
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_list_apis_empty(self, mock_get, client):
     mock_get.return_value.json.return_value = {"apis": []}
     mock_get.return_value.status_code = 200
@@ -83,14 +91,14 @@ class TestAPIHubClient:
     apis = client.list_apis("test-project", "us-central1")
     assert apis == []
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_list_apis_error(self, mock_get, client):
     mock_get.return_value.raise_for_status.side_effect = HTTPError
 
     with pytest.raises(HTTPError):
       client.list_apis("test-project", "us-central1")
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_api(self, mock_get, client):
     mock_get.return_value.json.return_value = MOCK_API_DETAIL
     mock_get.return_value.status_code = 200
@@ -106,13 +114,13 @@ class TestAPIHubClient:
         },
     )
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_api_error(self, mock_get, client):
     mock_get.return_value.raise_for_status.side_effect = HTTPError
     with pytest.raises(HTTPError):
       client.get_api("projects/test-project/locations/us-central1/apis/api1")
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_api_version(self, mock_get, client):
     mock_get.return_value.json.return_value = MOCK_API_VERSION
     mock_get.return_value.status_code = 200
@@ -128,7 +136,7 @@ class TestAPIHubClient:
         },
     )
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_api_version_error(self, mock_get, client):
     mock_get.return_value.raise_for_status.side_effect = HTTPError
     with pytest.raises(HTTPError):
@@ -136,7 +144,7 @@ class TestAPIHubClient:
           "projects/test-project/locations/us-central1/apis/api1/versions/v1"
       )
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_spec_content(self, mock_get, client):
     mock_get.return_value.json.return_value = MOCK_SPEC_CONTENT
     mock_get.return_value.status_code = 200
@@ -152,7 +160,7 @@ class TestAPIHubClient:
         },
     )
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_spec_content_empty(self, mock_get, client):
     mock_get.return_value.json.return_value = {"contents": ""}
     mock_get.return_value.status_code = 200
@@ -161,7 +169,7 @@ class TestAPIHubClient:
     )
     assert spec_content == ""
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_spec_content_error(self, mock_get, client):
     mock_get.return_value.raise_for_status.side_effect = HTTPError
     with pytest.raises(HTTPError):
@@ -394,7 +402,7 @@ class TestAPIHubClient:
       # no service account client
       APIHubClient()._get_access_token()
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_spec_content_api_level(self, mock_get, client):
     mock_get.side_effect = [
         MagicMock(status_code=200, json=lambda: MOCK_API_DETAIL),  # For get_api
@@ -413,7 +421,7 @@ class TestAPIHubClient:
     # Check calls - get_api, get_api_version, then get_spec_content
     assert mock_get.call_count == 3
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_spec_content_version_level(self, mock_get, client):
     mock_get.side_effect = [
         MagicMock(
@@ -430,7 +438,7 @@ class TestAPIHubClient:
     assert content == "spec content"
     assert mock_get.call_count == 2  # get_api_version and get_spec_content
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_spec_content_spec_level(self, mock_get, client):
     mock_get.return_value.json.return_value = MOCK_SPEC_CONTENT
     mock_get.return_value.status_code = 200
@@ -441,7 +449,113 @@ class TestAPIHubClient:
     assert content == "spec content"
     mock_get.assert_called_once()  # Only get_spec_content should be called
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
+  def test_get_spec_content_uses_spec_cache(self, mock_get, tmp_path):
+    spec_resource_name = "projects/test-project/locations/us-central1/apis/api1/versions/v1/specs/spec1"
+    update_time = "2025-01-01T00:00:00Z"
+
+    def get(url, headers):
+      if url.endswith(":contents"):
+        return MagicMock(status_code=200, json=lambda: MOCK_SPEC_CONTENT)
+      return MagicMock(
+          status_code=200, json=lambda: {"updateTime": update_time}
+      )
+
+    mock_get.side_effect = get
+
+    def get_spec_content():
+      return APIHubClient(
+          access_token="mocked_token", spec_cache_dir=str(tmp_path)
+      ).get_spec_content(spec_resource_name)
+
+    assert get_spec_content() == "spec content"
+    assert get_spec_content() == "spec content"
+    fetched_urls = [c.args[0] for c in mock_get.call_args_list]
+    assert sum(url.endswith(":contents") for url in fetched_urls) == 1
+
+    # An updated spec is fetched again.
+    update_time = "2025-01-02T00:00:00Z"
+    assert get_spec_content() == "spec content"
+    fetched_urls = [c.args[0] for c in mock_get.call_args_list]
+    assert sum(url.endswith(":contents") for url in fetched_urls) == 2
+
+  @patch("requests.Session.get")
+  def test_get_spec_content_spec_cache_is_bounded(self, mock_get, tmp_path):
+    spec_resource_name = "projects/test-project/locations/us-central1/apis/api1/versions/v1/specs/spec1"
+    update_times = iter(["2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z"])
+
+    def get(url, headers):
+      if url.endswith(":contents"):
+        return MagicMock(status_code=200, json=lambda: MOCK_SPEC_CONTENT)
+      update_time = next(update_times)
+      return MagicMock(
+          status_code=200, json=lambda: {"updateTime": update_time}
+      )
+
+    mock_get.side_effect = get
+    client = APIHubClient(
+        access_token="mocked_token", spec_cache_dir=str(tmp_path)
+    )
+
+    with patch.object(apihub_client, "_MAX_SPEC_CACHE_ENTRIES", 1):
+      assert client.get_spec_content(spec_resource_name) == "spec content"
+      assert client.get_spec_content(spec_resource_name) == "spec content"
+
+    assert len(list(tmp_path.iterdir())) == 1
+
+  @patch("requests.Session.get")
+  def test_get_spec_content_removes_temp_file_on_failed_cache_write(
+      self, mock_get, tmp_path
+  ):
+    def get(url, headers):
+      if url.endswith(":contents"):
+        return MagicMock(status_code=200, json=lambda: MOCK_SPEC_CONTENT)
+      return MagicMock(status_code=200, json=lambda: {})
+
+    mock_get.side_effect = get
+    client = APIHubClient(
+        access_token="mocked_token", spec_cache_dir=str(tmp_path)
+    )
+
+    with patch(
+        "google.adk.utils._file_utils.os.replace",
+        side_effect=OSError("disk full"),
+    ):
+      content = client.get_spec_content(
+          "projects/test-project/locations/us-central1/apis/api1/versions/v1/specs/spec1"
+      )
+
+    assert content == "spec content"
+    assert not list(tmp_path.iterdir())
+
+  @patch(
+      "google.adk.tools.apihub_tool.clients.apihub_client.default_service_credential"
+  )
+  def test_get_access_token_shared_across_clients(
+      self, mock_default_service_credential
+  ):
+    mock_credential = MagicMock()
+    mock_credential.token = "default_token"
+    mock_credential.expired = False
+    mock_default_service_credential.return_value = (mock_credential, "")
+
+    assert APIHubClient()._get_access_token() == "default_token"
+    assert APIHubClient()._get_access_token() == "default_token"
+    mock_default_service_credential.assert_called_once()
+    mock_credential.refresh.assert_called_once()
+
+  @pytest.mark.asyncio
+  @patch("requests.Session.get")
+  async def test_get_spec_content_async(self, mock_get, client):
+    mock_get.return_value.json.return_value = MOCK_SPEC_CONTENT
+    mock_get.return_value.status_code = 200
+
+    content = await client.get_spec_content_async(
+        "projects/test-project/locations/us-central1/apis/api1/versions/v1/specs/spec1"
+    )
+    assert content == "spec content"
+
+  @patch("requests.Session.get")
   def test_get_spec_content_no_versions(self, mock_get, client):
     mock_get.return_value.json.return_value = {
         "name": "projects/test-project/locations/us-central1/apis/api1",
@@ -459,7 +573,7 @@ class TestAPIHubClient:
           "projects/test-project/locations/us-central1/apis/api1"
       )
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_spec_content_no_specs(self, mock_get, client):
     mock_get.side_effect = [
         MagicMock(status_code=200, json=lambda: MOCK_API_DETAIL),
@@ -483,7 +597,7 @@ class TestAPIHubClient:
           "projects/test-project/locations/us-central1/apis/api1/versions/v1"
       )
 
-  @patch("requests.get")
+  @patch("requests.Session.get")
   def test_get_spec_content_invalid_path(self, mock_get, client):
     with pytest.raises(
         ValueError,
@@ -331,6 +331,51 @@ class TestConnectionsClient:
       with pytest.raises(ValueError, match="Request error"):
         client.get_entity_schema_and_operations("entity1")
 
+  def test_poll_operation_backs_off_until_done(
+      self, project, location, connection_name
+  ):
+    client = ConnectionsClient(project, location, connection_name, None)
+    pending_response = mock.MagicMock()
+    pending_response.json.return_value = {"done": False}
+    done_response = mock.MagicMock()
+    done_response.json.return_value = {"done": True, "response": {}}
+
+    with (
+        mock.patch.object(
+            client,
+            "_execute_api_call",
+            side_effect=[pending_response] * 6 + [done_response],
+        ),
+        mock.patch("time.sleep") as mock_sleep,
+    ):
+      operation_response = client._poll_operation("operations/test_op")
+
+    assert operation_response == {"done": True, "response": {}}
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [
+        0.5,
+        1,
+        2,
+        4,
+        8,
+        8,
+    ]
+
+  def test_get_connection_revision(self, project, location, connection_name):
+    client = ConnectionsClient(project, location, connection_name, None)
+    mock_response = mock.MagicMock()
+    mock_response.json.return_value = {
+        "connectorVersion": "connectors/test/versions/1",
+        "updateTime": "2025-01-01T00:00:00Z",
+    }
+
+    with mock.patch.object(
+        client, "_execute_api_call", return_value=mock_response
+    ):
+      assert (
+          client.get_connection_revision()
+          == "connectors/test/versions/1@2025-01-01T00:00:00Z"
+      )
+
   def test_get_action_schema_success(
       self, project, location, connection_name, mock_credentials
   ):
@@ -13,10 +13,13 @@
 # limitations under the License.
 
 import json
+import os
 import re
+import threading
 from unittest import mock
 
 from google.adk.tools.application_integration_tool.clients.connections_client import ConnectionsClient
+from google.adk.tools.application_integration_tool.clients.integration_client import _SchemaCache
 from google.adk.tools.application_integration_tool.clients.integration_client import IntegrationClient
 import google.auth
 import google.auth.transport.requests
@@ -458,6 +461,159 @@ class TestIntegrationClient:
     )
     mock_connections_client_instance.get_action_operation.assert_called_once()
 
+  def test_get_openapi_spec_for_connection_fetches_schemas_concurrently(
+      self, project, location, connection_name, mock_connections_client
+  ):
+    mock_connections_client_instance = mock_connections_client.return_value
+    mock_connections_client_instance.get_connector_base_spec.return_value = {
+        "components": {"schemas": {}},
+        "paths": {},
+    }
+    # Each fetch waits for the other one, so this only completes if they run
+    # concurrently.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get_entity_schema_and_operations(entity):
+      barrier.wait()
+      return {"type": "object"}, ["LIST"]
+
+    def get_action_schema(action):
+      barrier.wait()
+      return {
+          "inputSchema": {},
+          "outputSchema": {},
+          "displayName": action,
+      }
+
+    mock_connections_client_instance.get_entity_schema_and_operations.side_effect = (
+        get_entity_schema_and_operations
+    )
+    mock_connections_client_instance.get_action_schema.side_effect = (
+        get_action_schema
+    )
+
+    client = IntegrationClient(
+        project=project,
+        location=location,
+        connection=connection_name,
+        entity_operations={"entity1": []},
+        actions=["TestAction"],
+    )
+    spec = client.get_openapi_spec_for_connection()
+
+    assert len(spec["paths"]) == 2
+
+  def test_get_openapi_spec_for_connection_uses_schema_cache(
+      self,
+      project,
+      location,
+      connection_name,
+      mock_connections_client,
+      tmp_path,
+  ):
+    mock_connections_client_instance = mock_connections_client.return_value
+    mock_connections_client_instance.get_connector_base_spec.side_effect = (
+        lambda: {"components": {"schemas": {}}, "paths": {}}
+    )
+    mock_connections_client_instance.get_connection_revision.return_value = (
+        "revision1"
+    )
+    mock_connections_client_instance.get_entity_schema_and_operations.return_value = (
+        {"type": "object"},
+        ["LIST"],
+    )
+    mock_connections_client_instance.get_action_schema.return_value = {
+        "inputSchema": {},
+        "outputSchema": {},
+        "displayName": "TestAction",
+    }
+
+    def get_spec():
+      return IntegrationClient(
+          project=project,
+          location=location,
+          connection=connection_name,
+          entity_operations={"entity1": []},
+          actions=["TestAction"],
+          schema_cache_dir=str(tmp_path),
+      ).get_openapi_spec_for_connection()
+
+    first_spec = get_spec()
+    second_spec = get_spec()
+
+    assert second_spec == first_spec
+    mock_connections_client_instance.get_entity_schema_and_operations.assert_called_once_with(
+        "entity1"
+    )
+    mock_connections_client_instance.get_action_schema.assert_called_once_with(
+        "TestAction"
+    )
+
+    # A new revision of the connection invalidates the cached schemas.
+    mock_connections_client_instance.get_connection_revision.return_value = (
+        "revision2"
+    )
+    get_spec()
+
+    assert (
+        mock_connections_client_instance.get_entity_schema_and_operations.call_count
+        == 2
+    )
+    assert mock_connections_client_instance.get_action_schema.call_count == 2
+
+  def test_schema_cache_removes_temp_file_on_failed_write(self, tmp_path):
+    schema_cache = _SchemaCache(
+        str(tmp_path), "project", "location", "connection", "revision"
+    )
+
+    with mock.patch(
+        "google.adk.utils._file_utils.os.replace",
+        side_effect=OSError("disk full"),
+    ):
+      schema_cache.put("entity", "entity1", {"type": "object"})
+
+    assert not os.listdir(tmp_path)
+    assert schema_cache.get("entity", "entity1") is None
+
+  def test_schema_cache_evicts_least_recently_used(self, tmp_path):
+    with mock.patch(
+        "google.adk.tools.application_integration_tool.clients.integration_client._MAX_SCHEMA_CACHE_ENTRIES",
+        2,
+    ):
+      schema_cache = _SchemaCache(
+          str(tmp_path), "project", "location", "connection", "revision"
+      )
+      schema_cache.put("entity", "entity1", {"name": "entity1"})
+      schema_cache.put("entity", "entity2", {"name": "entity2"})
+      # Makes entity2 the least recently used.
+      os.utime(schema_cache._get_path("entity", "entity2"), ns=(0, 0))
+      schema_cache.put("entity", "entity3", {"name": "entity3"})
+
+    assert len(os.listdir(tmp_path)) == 2
+    assert schema_cache.get("entity", "entity1") == {"name": "entity1"}
+    assert schema_cache.get("entity", "entity2") is None
+    assert schema_cache.get("entity", "entity3") == {"name": "entity3"}
+
+  def test_schema_cache_never_evicts_other_files(self, tmp_path):
+    other_file = tmp_path / "other.json"
+    other_file.write_text("{}")
+    os.utime(other_file, ns=(0, 0))
+    with mock.patch(
+        "google.adk.tools.application_integration_tool.clients.integration_client._MAX_SCHEMA_CACHE_ENTRIES",
+        1,
+    ):
+      schema_cache = _SchemaCache(
+          str(tmp_path), "project", "location", "connection", "revision"
+      )
+      schema_cache.put("entity", "entity1", {"name": "entity1"})
+      # Makes entity1 more recently used than the other file only.
+      os.utime(schema_cache._get_path("entity", "entity1"), ns=(1, 1))
+      schema_cache.put("entity", "entity2", {"name": "entity2"})
+
+    assert other_file.read_text() == "{}"
+    assert schema_cache.get("entity", "entity1") is None
+    assert schema_cache.get("entity", "entity2") == {"name": "entity2"}
+
   def test_get_openapi_spec_for_connection_invalid_operation(
       self, project, location, connection_name, mock_connections_client
   ):
@@ -44,7 +44,8 @@ def change_state_callback(callback_context: CallbackContext):
   print('change_state_callback: ', callback_context.state)
 
 
-def test_no_schema():
+@mark.parametrize('lightweight', [False, True])
+def test_no_schema(lightweight):
   mock_model = testing_utils.MockModel.create(
       responses=[
           function_call_no_schema,
@@ -61,7 +62,7 @@ def test_no_schema():
   root_agent = Agent(
       name='root_agent',
       model=mock_model,
-      tools=[AgentTool(agent=tool_agent)],
+      tools=[AgentTool(agent=tool_agent, lightweight=lightweight)],
   )
 
   runner = testing_utils.InMemoryRunner(root_agent)
@@ -73,7 +74,8 @@ def test_no_schema():
   ]
 
 
-def test_update_state():
+@mark.parametrize('lightweight', [False, True])
+def test_update_state(lightweight):
   """The agent tool can read and change parent state."""
 
   mock_model = testing_utils.MockModel.create(
@@ -94,7 +96,7 @@ def test_update_state():
   root_agent = Agent(
       name='root_agent',
       model=mock_model,
-      tools=[AgentTool(agent=tool_agent)],
+      tools=[AgentTool(agent=tool_agent, lightweight=lightweight)],
   )
 
   runner = testing_utils.InMemoryRunner(root_agent)
@@ -107,7 +109,41 @@ def test_update_state():
   assert runner.session.state['state_1'] == 'changed_value'
 
 
-def test_update_artifacts():
+def test_lightweight_session_is_valid():
+  """The child session of a lightweight agent tool is a regular session."""
+  sessions = []
+
+  def record_session_callback(callback_context: CallbackContext):
+    sessions.append(callback_context._invocation_context.session)
+
+  mock_model = testing_utils.MockModel.create(
+      responses=[function_call_no_schema, 'response1', 'response2']
+  )
+  tool_agent = Agent(
+      name='tool_agent',
+      model=mock_model,
+      before_agent_callback=record_session_callback,
+  )
+  root_agent = Agent(
+      name='root_agent',
+      model=mock_model,
+      tools=[AgentTool(agent=tool_agent, lightweight=True)],
+      before_agent_callback=change_state_callback,
+  )
+  runner = testing_utils.InMemoryRunner(root_agent)
+
+  runner.run('test1')
+
+  (session,) = sessions
+  assert type(session.state) is dict
+  assert session.state == {'state_1': 'changed_value'}
+  assert type(session).model_validate_json(session.model_dump_json()) == (
+      session
+  )
+
+
+@mark.parametrize('lightweight', [False, True])
+def test_update_artifacts(lightweight):
   """The agent tool can read and write artifacts."""
 
   async def before_tool_agent(callback_context: CallbackContext):
@@ -141,7 +177,7 @@ def test_update_artifacts():
       name='root_agent',
       before_agent_callback=before_main_agent,
       after_agent_callback=after_main_agent,
-      tools=[AgentTool(agent=tool_agent)],
+      tools=[AgentTool(agent=tool_agent, lightweight=lightweight)],
       model=mock_model,
   )
 
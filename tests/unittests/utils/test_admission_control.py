@@ -0,0 +1,121 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from google.adk.errors.too_many_requests_error import TooManyRequestsError
+from google.adk.utils.admission_control import AdmissionConfig
+from google.adk.utils.admission_control import AdmissionController
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_full():
+  controller = AdmissionController(
+      AdmissionConfig(max_concurrent_runs_per_app=1)
+  )
+
+  async with controller.admit('app', 'user_1'):
+    with pytest.raises(TooManyRequestsError, match='queue is full'):
+      await controller.acquire('app', 'user_2')
+    # Other apps have their own limits.
+    async with controller.admit('other_app', 'user_1'):
+      pass
+
+  metrics = controller.get_metrics()['app']
+  assert (metrics.running, metrics.admitted, metrics.rejected) == (0, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_admits_queued_runs_in_order():
+  controller = AdmissionController(
+      AdmissionConfig(max_concurrent_runs_per_app=1, max_queue_size=2)
+  )
+  admitted = []
+
+  async def run(user_id: str):
+    async with controller.admit('app', user_id):
+      admitted.append(user_id)
+      await asyncio.sleep(0)
+
+  await controller.acquire('app', 'user_0')
+  tasks = [asyncio.create_task(run(f'user_{i}')) for i in (1, 2)]
+  await asyncio.sleep(0)
+  assert controller.get_metrics()['app'].queue_depth == 2
+
+  controller.release('app', 'user_0')
+  await asyncio.gather(*tasks)
+
+  assert admitted == ['user_1', 'user_2']
+  metrics = controller.get_metrics()['app']
+  assert (metrics.running, metrics.queue_depth, metrics.admitted) == (0, 0, 3)
+  assert metrics.max_wait_seconds > 0
+  assert metrics.total_wait_seconds >= metrics.max_wait_seconds
+
+
+@pytest.mark.asyncio
+async def test_user_limit_does_not_block_other_users():
+  controller = AdmissionController(
+      AdmissionConfig(
+          max_concurrent_runs_per_app=3,
+          max_concurrent_runs_per_user=1,
+          max_queue_size=1,
+      )
+  )
+
+  await controller.acquire('app', 'user_1')
+  waiting = asyncio.create_task(controller.acquire('app', 'user_1'))
+  await asyncio.sleep(0)
+  await asyncio.wait_for(controller.acquire('app', 'user_2'), timeout=1)
+  assert not waiting.done()
+
+  controller.release('app', 'user_1')
+  await asyncio.wait_for(waiting, timeout=1)
+  assert controller.get_metrics()['app'].running == 2
+
+
+@pytest.mark.asyncio
+async def test_rejects_after_max_wait():
+  controller = AdmissionController(
+      AdmissionConfig(
+          max_concurrent_runs_per_app=1,
+          max_queue_size=1,
+          max_wait_seconds=0.01,
+      )
+  )
+
+  await controller.acquire('app', 'user_1')
+  with pytest.raises(TooManyRequestsError, match='timed out'):
+    await controller.acquire('app', 'user_2')
+
+  metrics = controller.get_metrics()['app']
+  assert (metrics.queue_depth, metrics.rejected) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+  controller = AdmissionController(
+      AdmissionConfig(max_concurrent_runs_per_app=1, max_queue_size=1)
+  )
+
+  await controller.acquire('app', 'user_1')
+  waiting = asyncio.create_task(controller.acquire('app', 'user_2'))
+  await asyncio.sleep(0)
+  waiting.cancel()
+  with pytest.raises(asyncio.CancelledError):
+    await waiting
+
+  assert controller.get_metrics()['app'].queue_depth == 0
+  controller.release('app', 'user_1')
+  assert controller.get_metrics()['app'].running == 0
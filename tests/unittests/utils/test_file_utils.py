@@ -0,0 +1,99 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from unittest import mock
+
+from google.adk.utils._file_utils import DiskCache
+from google.adk.utils._file_utils import write_file_atomically
+import pytest
+
+
+def test_write_file_atomically_replaces_file(tmp_path):
+  path = tmp_path / 'file.txt'
+  path.write_text('old')
+
+  write_file_atomically(str(path), 'new')
+
+  assert path.read_text() == 'new'
+  assert os.listdir(tmp_path) == ['file.txt']
+
+
+def test_write_file_atomically_removes_temp_file_on_failure(tmp_path):
+  path = tmp_path / 'file.txt'
+  path.write_text('old')
+
+  with mock.patch(
+      'google.adk.utils._file_utils.os.replace',
+      side_effect=OSError('disk full'),
+  ):
+    with pytest.raises(OSError, match='disk full'):
+      write_file_atomically(str(path), 'new')
+
+  assert path.read_text() == 'old'
+  assert os.listdir(tmp_path) == ['file.txt']
+
+
+def test_disk_cache_get_and_put(tmp_path):
+  cache = DiskCache(str(tmp_path / 'cache'), suffix='.txt', max_entries=10)
+
+  assert cache.get('key') is None
+  cache.put('key', 'value')
+
+  assert cache.get('key') == 'value'
+  assert cache.get_path('key').endswith('.txt')
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+  cache = DiskCache(str(tmp_path), suffix='.txt', max_entries=2)
+
+  cache.put('key1', 'value1')
+  cache.put('key2', 'value2')
+  # Makes key2 the least recently used.
+  os.utime(cache.get_path('key1'), ns=(2, 2))
+  os.utime(cache.get_path('key2'), ns=(1, 1))
+  cache.put('key3', 'value3')
+
+  assert len(os.listdir(tmp_path)) == 2
+  assert cache.get('key1') == 'value1'
+  assert cache.get('key2') is None
+  assert cache.get('key3') == 'value3'
+
+
+def test_disk_cache_never_evicts_other_files(tmp_path):
+  other_files = ['other.txt', 'a' * 64 + '.json', 'a' * 64 + '.txt.tmp']
+  for name in other_files:
+    (tmp_path / name).write_text('other')
+    os.utime(tmp_path / name, ns=(0, 0))
+  cache = DiskCache(str(tmp_path), suffix='.txt', max_entries=1)
+
+  cache.put('key1', 'value1')
+  cache.put('key2', 'value2')
+
+  for name in other_files:
+    assert (tmp_path / name).read_text() == 'other'
+  assert len(os.listdir(tmp_path)) == len(other_files) + 1
+
+
+def test_disk_cache_ignores_write_failures(tmp_path):
+  cache = DiskCache(str(tmp_path), suffix='.txt', max_entries=10)
+
+  with mock.patch(
+      'google.adk.utils._file_utils.os.replace',
+      side_effect=OSError('disk full'),
+  ):
+    cache.put('key', 'value')
+
+  assert cache.get('key') is None
+  assert not os.listdir(tmp_path)
@@ -1,6 +1,8 @@
 from google.adk.agents import Agent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
 from google.adk.sessions import Session
 from google.adk.utils import instructions_utils
 import pytest
@@ -214,3 +216,57 @@ async def test_inject_session_state_artifact_service_not_initialized_raises_valu
     await instructions_utils.inject_session_state(
         instruction_template, invocation_context
     )
+
+
+@pytest.mark.asyncio
+async def test_inject_session_state_reuses_artifact_within_invocation():
+  instruction_template = "The artifact content is: {artifact.my_file}"
+  mock_artifact_service = MockArtifactService({"my_file": "version 1"})
+  readonly_context = await _create_test_readonly_context(
+      artifact_service=mock_artifact_service
+  )
+
+  await instructions_utils.inject_session_state(
+      instruction_template, readonly_context
+  )
+  mock_artifact_service.artifacts["my_file"] = "version 2"
+  populated_instruction = await instructions_utils.inject_session_state(
+      instruction_template, readonly_context
+  )
+  assert populated_instruction == "The artifact content is: version 1"
+
+  # A new version saved in the session is loaded again.
+  readonly_context._invocation_context.session.events.append(
+      Event(
+          author="agent",
+          actions=EventActions(artifact_delta={"my_file": 1}),
+      )
+  )
+  populated_instruction = await instructions_utils.inject_session_state(
+      instruction_template, readonly_context
+  )
+  assert populated_instruction == "The artifact content is: version 2"
+
+
+@pytest.mark.asyncio
+async def test_inject_session_state_reads_current_state_with_same_template():
+  instruction_template = "Hello {user_name}{punctuation?}"
+  readonly_context = await _create_test_readonly_context(
+      state={"user_name": "Foo"}
+  )
+
+  assert (
+      await instructions_utils.inject_session_state(
+          instruction_template, readonly_context
+      )
+      == "Hello Foo"
+  )
+
+  readonly_context._invocation_context.session.state["user_name"] = "Bar"
+  readonly_context._invocation_context.session.state["punctuation"] = "!"
+  assert (
+      await instructions_utils.inject_session_state(
+          instruction_template, readonly_context
+      )
+      == "Hello Bar!"
+  )
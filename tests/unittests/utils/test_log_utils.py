@@ -0,0 +1,61 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from unittest import mock
+
+from google.adk.utils.log_utils import LazyPayload
+from google.adk.utils.log_utils import MAX_PAYLOAD_PREVIEW_LENGTH
+from google.adk.utils.log_utils import preview_payload
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+def test_lazy_payload_not_built_when_level_disabled(caplog):
+  build_message = mock.Mock(return_value='payload')
+
+  with caplog.at_level(logging.WARNING, logger=logger.name):
+    logger.info('%s', LazyPayload(logger, build_message))
+
+  build_message.assert_not_called()
+  assert not caplog.records
+
+
+def test_lazy_payload_previewed_at_info(caplog):
+  payload = 'x' * (MAX_PAYLOAD_PREVIEW_LENGTH + 10)
+
+  with caplog.at_level(logging.INFO, logger=logger.name):
+    logger.info('Payload: %s', LazyPayload(logger, lambda: payload))
+    messages = caplog.messages
+
+  assert messages == [
+      f'Payload: {"x" * MAX_PAYLOAD_PREVIEW_LENGTH}... (10 more characters)'
+  ]
+
+
+def test_lazy_payload_complete_at_debug(caplog):
+  payload = 'x' * (MAX_PAYLOAD_PREVIEW_LENGTH + 10)
+
+  with caplog.at_level(logging.DEBUG, logger=logger.name):
+    logger.info('%s', LazyPayload(logger, lambda: payload))
+    messages = caplog.messages
+
+  assert messages == [payload]
+
+
+def test_preview_payload():
+  assert preview_payload('short', max_length=5) == 'short'
+  assert (
+      preview_payload('longer', max_length=5) == 'longe... (1 more characters)'
+  )